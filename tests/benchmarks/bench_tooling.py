@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Tooling benchmarks on the real catalog and on synthetic ones
+
+Each benchmark runs against this checkout's catalog and against one synthetic
+catalog per --scale (generated with init_repo_structure.py). Results are
+named ``<benchmark>[<catalog>]``, e.g. ``validate_skill_file[synthetic-1000]``.
+
+    python tests/benchmarks/bench_tooling.py --scale 1000 --out /tmp/bench.json
+    python tooling/benchmark.py compare /tmp/bench.json tests/benchmarks/baseline.json
+
+Nothing in the checkout is written: indexes, databases and embeddings go to
+a temporary directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import fnmatch
+import io
+import json
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "tooling"))
+
+import analyze_agent_dependencies  # noqa: E402
+import analyze_coverage  # noqa: E402
+import build_index  # noqa: E402
+from benchmark import (  # noqa: E402
+    DEFAULT_REPEAT,
+    DEFAULT_TOLERANCE,
+    DEFAULT_WARMUP,
+    Measurement,
+    compare,
+    format_measurement,
+    format_seconds,
+    load_results,
+    measure,
+    print_comparisons,
+    write_results,
+)
+from init_repo_structure import generate_synthetic_catalog  # noqa: E402
+from lint_skill import lint_skill_file  # noqa: E402
+from skill_document import clear_document_cache  # noqa: E402
+from validate_skill import validate_skill_file  # noqa: E402
+
+try:
+    import sklearn  # noqa: F401
+
+    import build_embeddings
+    import route_skills
+except ImportError:  # pragma: no cover
+    build_embeddings = route_skills = None  # type: ignore[assignment]
+
+DEFAULT_SCALES = [1000]
+# Agents generated per synthetic skill (the real catalog has about one per 1.5)
+AGENTS_PER_SKILL = 0.1
+ROUTE_QUERIES = 50
+
+
+@dataclass
+class Catalog:
+    name: str
+    root: Path  # skills/, agents/ and index/skills-index.json
+    work: Path  # scratch space for outputs
+
+    @property
+    def skill_files(self) -> list[Path]:
+        return sorted((self.root / "skills").glob("*/SKILL.md"))
+
+    @property
+    def skills(self) -> list[dict[str, Any]]:
+        data: list[dict[str, Any]] = json.loads(
+            (self.root / "index" / "skills-index.json").read_text(encoding="utf-8")
+        )
+        return data
+
+    @property
+    def embeddings_dir(self) -> Path:
+        return self.work / "embeddings"
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        yield
+
+
+def prepare_catalogs(scales: list[int], work: Path) -> Iterator[Catalog]:
+    """This checkout's catalog, then one synthetic catalog per scale"""
+    yield from _with_embeddings(Catalog("repo", REPO_ROOT, work / "repo"))
+    for n in scales:
+        root = work / f"synthetic-{n}"
+        generate_synthetic_catalog(root, n, max(1, int(n * AGENTS_PER_SKILL)), seed=n)
+        with quiet():
+            build_index.main(["--root", str(root), "--no-db", "--no-schema-check"])
+        yield from _with_embeddings(Catalog(f"synthetic-{n}", root, root / "work"))
+
+
+def _with_embeddings(catalog: Catalog) -> Iterator[Catalog]:
+    catalog.work.mkdir(parents=True, exist_ok=True)
+    if build_embeddings is not None:
+        embeddings = build_embeddings.build_embeddings(catalog.skills)
+        build_embeddings.save_embeddings(embeddings, catalog.embeddings_dir)
+    yield catalog
+
+
+# name -> (fn(catalog) returning the callable to time, drop the document cache before each run)
+BENCHMARKS: dict[str, tuple[Callable[[Catalog], Callable[[], object]], bool]] = {}
+
+
+def benchmark(name: str, cold: bool = True) -> Callable[[Any], Any]:
+    def register(fn: Callable[[Catalog], Callable[[], object]]) -> Any:
+        BENCHMARKS[name] = (fn, cold)
+        return fn
+
+    return register
+
+
+@benchmark("build_index")
+def bench_build_index(catalog: Catalog) -> Callable[[], object]:
+    argv = ["--root", str(catalog.root), "--out", str(catalog.work / "skills-index.json")]
+    argv += ["--db", str(catalog.work / "catalog.db")]
+
+    def run() -> None:
+        with quiet():
+            build_index.main(argv)
+
+    return run
+
+
+@benchmark("build_embeddings", cold=False)
+def bench_build_embeddings(catalog: Catalog) -> Callable[[], object]:
+    skills = catalog.skills
+    return lambda: build_embeddings.build_embeddings(skills)
+
+
+@benchmark("validate_skill_file")
+def bench_validate(catalog: Catalog) -> Callable[[], object]:
+    files = catalog.skill_files
+    return lambda: [validate_skill_file(p) for p in files]
+
+
+@benchmark("lint_skill_file")
+def bench_lint(catalog: Catalog) -> Callable[[], object]:
+    files = catalog.skill_files
+    return lambda: [lint_skill_file(p) for p in files]
+
+
+@benchmark("build_dependency_graph")
+def bench_dependency_graph(catalog: Catalog) -> Callable[[], object]:
+    skills_set = {s["slug"] for s in catalog.skills}
+    return lambda: analyze_agent_dependencies.build_dependency_graph(1, skills_set, catalog.root)
+
+
+@benchmark("analyze_coverage", cold=False)
+def bench_coverage(catalog: Catalog) -> Callable[[], object]:
+    skills = catalog.skills
+
+    def run() -> str:
+        by_tier, by_domain, domain_tier_map = analyze_coverage.analyze_coverage(skills)
+        return analyze_coverage.generate_markdown_report(
+            by_tier, by_domain, domain_tier_map, len(skills)
+        )
+
+    return run
+
+
+@benchmark("SkillRouter.route", cold=False)
+def bench_route(catalog: Catalog) -> Callable[[], object]:
+    router = route_skills.SkillRouter(catalog.embeddings_dir)
+    queries = [s["summary"] for s in catalog.skills[:ROUTE_QUERIES]]
+    return lambda: [router.route(q, top_k=3) for q in queries]
+
+
+def run_benchmarks(
+    catalogs: Iterator[Catalog],
+    pattern: str = "*",
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+) -> Iterator[Measurement]:
+    needs_sklearn = {"build_embeddings", "SkillRouter.route"}
+    for catalog in catalogs:
+        for name, (make, cold) in BENCHMARKS.items():
+            full_name = f"{name}[{catalog.name}]"
+            if not fnmatch.fnmatch(full_name, pattern):
+                continue
+            if name in needs_sklearn and build_embeddings is None:
+                print(f"SKIP {full_name}: scikit-learn not installed", file=sys.stderr)
+                continue
+            setup = clear_document_cache if cold else None
+            yield measure(full_name, make(catalog), repeat, warmup, setup)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark the tooling on real and synthetic catalogs")
+    ap.add_argument(
+        "--scale",
+        type=int,
+        nargs="*",
+        default=DEFAULT_SCALES,
+        help=f"Synthetic catalog sizes in skills (default: {DEFAULT_SCALES}; none = repo only)",
+    )
+    ap.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark")
+    ap.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="Untimed runs first")
+    ap.add_argument("-k", default="*", help="Only benchmarks whose full name matches this glob")
+    ap.add_argument("--out", type=Path, default=None, help="Write results JSON here")
+    ap.add_argument("--baseline", type=Path, default=None, help="Compare against this results JSON")
+    ap.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Allowed relative slowdown with --baseline (default: {DEFAULT_TOLERANCE})",
+    )
+    args = ap.parse_args(argv)
+
+    results: list[Measurement] = []
+    with tempfile.TemporaryDirectory(prefix="toolworks-bench-") as tmp:
+        catalogs = prepare_catalogs(args.scale, Path(tmp))
+        for m in run_benchmarks(catalogs, args.k, args.repeat, args.warmup):
+            print(f"{m.name:<45} {format_measurement(m):>24}  min {format_seconds(m.min)}")
+            results.append(m)
+
+    if args.out:
+        write_results(args.out, results)
+        print(f"\nWrote {len(results)} result(s) to {args.out}")
+    if args.baseline:
+        print()
+        comparisons = compare(
+            {m.name: m for m in results}, load_results(args.baseline), args.tolerance
+        )
+        comparisons = [c for c in comparisons if c.current is not None]
+        print_comparisons(comparisons)
+        if any(c.status == "regressed" for c in comparisons):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
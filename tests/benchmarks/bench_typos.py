@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Misspelled-query routing benchmark
+
+Queries are the eval scenario descriptions in tests/evals_*.yaml (the scenario
+name when there is none), each labelled with its eval's skill. Every query is
+also misspelled: one to --edits of its vocabulary words get a random
+deletion, insertion, substitution, transposition or split. Both query sets are
+routed with and without SkillRouter(typo_tolerant=True) and reported as
+hit rate (the labelled skill in the top --top-k) and per-query latency.
+
+    python tests/benchmarks/bench_typos.py --out /tmp/typos.json
+
+Exits 1 when typo-tolerant routing is more than --max-slowdown times slower
+than exact routing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import sys
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "tooling"))
+
+from benchmark import (  # noqa: E402
+    DEFAULT_REPEAT,
+    DEFAULT_WARMUP,
+    Measurement,
+    format_seconds,
+    measure,
+    write_results,
+)
+from route_skills import SkillRouter  # noqa: E402
+from run_evals import load_scenarios  # noqa: E402
+
+EDITS = ("delete", "insert", "substitute", "transpose", "split")
+# Words shorter than this keep their spelling (typos in "api" are a different word)
+MIN_TYPO_LEN = 5
+DEFAULT_MAX_SLOWDOWN = 3.0
+
+
+@dataclass
+class Query:
+    text: str
+    skill: str
+
+
+def eval_queries(root: Path, known: set[str]) -> list[Query]:
+    """One query per eval scenario whose skill the router knows"""
+    queries = []
+    for path in sorted((root / "tests").glob("evals_*.yaml")):
+        for scenario in load_scenarios(path):
+            if scenario.skill not in known:
+                continue
+            text = scenario.raw.get("description") or scenario.id
+            queries.append(Query(str(text).replace("_", " "), scenario.skill))
+    return queries
+
+
+def misspell_word(word: str, rng: random.Random) -> str:
+    i = rng.randrange(1, len(word) - 1)  # keep the first and last letter
+    edit = rng.choice(EDITS)
+    if edit == "delete":
+        return word[:i] + word[i + 1 :]
+    if edit == "insert":
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+    if edit == "substitute":
+        letters = string.ascii_lowercase.replace(word[i].lower(), "")
+        return word[:i] + rng.choice(letters) + word[i + 1 :]
+    if edit == "transpose":
+        return word[: i - 1] + word[i] + word[i - 1] + word[i + 1 :]
+    return word[:i] + " " + word[i:]
+
+
+def misspell(text: str, vocabulary: set[str], rng: random.Random, edits: int = 1) -> str:
+    """text with up to `edits` of its routing-relevant words misspelled"""
+    words = text.split()
+    eligible = [
+        i
+        for i, w in enumerate(words)
+        if len(w) >= MIN_TYPO_LEN and w.isalpha() and w.lower() in vocabulary
+    ]
+    if not eligible:
+        eligible = [i for i, w in enumerate(words) if len(w) >= MIN_TYPO_LEN and w.isalpha()]
+    for i in rng.sample(eligible, min(edits, len(eligible))):
+        words[i] = misspell_word(words[i], rng)
+    return " ".join(words)
+
+
+def hit_rate(router: SkillRouter, queries: list[Query], top_k: int) -> float:
+    hits = sum(
+        any(r["slug"] == q.skill for r in router.route(q.text, top_k=top_k)) for q in queries
+    )
+    return hits / len(queries) if queries else 0.0
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark typo-tolerant routing on eval queries")
+    ap.add_argument("--root", type=Path, default=REPO_ROOT, help="Repo root (default: checkout)")
+    ap.add_argument("--edits", type=int, default=1, help="Misspelled words per query")
+    ap.add_argument("--top-k", type=int, default=3, help="A hit is the skill in the top K")
+    ap.add_argument("--seed", type=int, default=0, help="Misspelling random seed")
+    ap.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs")
+    ap.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="Untimed runs first")
+    ap.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=DEFAULT_MAX_SLOWDOWN,
+        help=f"Fail above this typo-tolerant/exact latency ratio (default: {DEFAULT_MAX_SLOWDOWN})",
+    )
+    ap.add_argument("--out", type=Path, default=None, help="Write latency results JSON here")
+    args = ap.parse_args(argv)
+
+    embeddings_dir = args.root / "index" / "embeddings"
+    with warnings.catch_warnings():
+        # Pickles from another scikit-learn release still load and score the same
+        warnings.simplefilter("ignore")
+        exact = SkillRouter(embeddings_dir)
+        tolerant = SkillRouter(embeddings_dir, typo_tolerant=True)
+
+    clean = eval_queries(args.root, set(exact.slugs))
+    if not clean:
+        print("ERROR: no eval scenarios for known skills", file=sys.stderr)
+        return 2
+    vocabulary = set(exact.vectorizer.vocabulary_)
+    rng = random.Random(args.seed)  # noqa: S311 - reproducible test data, not security
+    typos = [Query(misspell(q.text, vocabulary, rng, args.edits), q.skill) for q in clean]
+
+    print(
+        f"{len(clean)} eval queries, {args.edits} misspelled word(s) each, hit = top {args.top_k}"
+    )
+    print(f"{'queries':<12} {'exact':>8} {'tolerant':>9}")
+    for label, queries in (("clean", clean), ("misspelled", typos)):
+        print(
+            f"{label:<12} {hit_rate(exact, queries, args.top_k):>8.1%}"
+            f" {hit_rate(tolerant, queries, args.top_k):>9.1%}"
+        )
+
+    results: list[Measurement] = []
+    for name, router in (("exact", exact), ("typo_tolerant", tolerant)):
+        texts = [q.text for q in typos]
+        m = measure(
+            f"route_misspelled[{name}]",
+            lambda router=router, texts=texts: [router.route(t, args.top_k) for t in texts],
+            args.repeat,
+            args.warmup,
+        )
+        results.append(m)
+    per_query = [m.median / len(typos) for m in results]
+    slowdown = per_query[1] / per_query[0]
+    print(
+        f"\nlatency per query: exact {format_seconds(per_query[0])},"
+        f" typo-tolerant {format_seconds(per_query[1])} ({slowdown:.2f}x)"
+    )
+
+    if args.out:
+        write_results(args.out, results)
+        print(f"Wrote {len(results)} result(s) to {args.out}")
+    if slowdown > args.max_slowdown:
+        print(
+            f"ERROR: typo-tolerant routing is {slowdown:.2f}x slower than exact"
+            f" (limit {args.max_slowdown}x)",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+"""Shared pytest configuration.
+
+The tooling scripts are run as ``python tooling/<script>.py`` and import their
+siblings as top-level modules, so tests put ``tooling/`` on ``sys.path`` the
+same way the interpreter does for a script.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TOOLING_DIR = REPO_ROOT / "tooling"
+
+if str(TOOLING_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLING_DIR))
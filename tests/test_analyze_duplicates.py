@@ -0,0 +1,102 @@
+"""Tests for near-duplicate skill detection."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+
+import analyze_duplicates
+from analyze_duplicates import (
+    DEFAULT_THRESHOLD,
+    LSH_RECALL,
+    cluster_pairs,
+    exact_pairs,
+    find_duplicates,
+    lsh_pairs,
+    lsh_shape,
+)
+
+
+def random_vectors(n: int, planted: int, seed: int = 0) -> sp.csr_matrix:
+    """Random sparse rows; the last `planted` rows are slightly perturbed copies of the first"""
+    rng = np.random.default_rng(seed)
+    base = sp.random(n - planted, 300, density=0.05, random_state=seed, format="csr")
+    copies = base[:planted].toarray()
+    copies[np.arange(planted), rng.integers(300, size=planted)] += 0.1
+    return normalize(sp.vstack([base, sp.csr_matrix(copies)]).tocsr())
+
+
+def test_exact_pairs_match_dense_computation() -> None:
+    vectors = random_vectors(300, 5)
+    rows, cols, scores = exact_pairs(vectors, 0.2, block_size=7)
+
+    dense = (vectors @ vectors.T).toarray()
+    expected = {(r, c) for r, c in zip(*np.nonzero(dense >= 0.2), strict=True) if r < c}
+    assert set(zip(rows.tolist(), cols.tolist(), strict=True)) == expected
+    assert np.allclose(scores, dense[rows, cols])
+
+
+def test_lsh_finds_planted_duplicates() -> None:
+    n, planted = 3000, 20
+    vectors = random_vectors(n, planted)
+    slugs = [f"skill-{i}" for i in range(n)]
+
+    clusters = find_duplicates(slugs, vectors, threshold=0.9, method="lsh")
+    found = {tuple(c.members) for c in clusters}
+    assert found == {
+        tuple(sorted((f"skill-{i}", f"skill-{n - planted + i}"))) for i in range(planted)
+    }
+
+    rows, _, scores = lsh_pairs(vectors, 0.9)
+    assert len(rows) == planted
+    assert (scores >= 0.9).all()
+
+
+def pairs_at_cosine(pairs: int, cosine: float, dim: int = 300, seed: int = 0) -> sp.csr_matrix:
+    """Rows i and pairs + i are unit vectors with exactly `cosine` between them"""
+    rng = np.random.default_rng(seed)
+    base = normalize(rng.standard_normal((pairs, dim)))
+    noise = rng.standard_normal((pairs, dim))
+    noise -= (noise * base).sum(axis=1, keepdims=True) * base
+    partner = cosine * base + np.sqrt(1 - cosine**2) * normalize(noise)
+    return sp.csr_matrix(np.vstack([base, partner]))
+
+
+def test_lsh_keeps_its_recall_at_the_lowest_threshold_it_accepts() -> None:
+    threshold = 0.8
+    assert lsh_shape(threshold) is not None
+    pairs = 400
+    vectors = pairs_at_cosine(pairs, threshold + 1e-6)
+    rows, cols, _ = lsh_pairs(vectors, threshold)
+    found = {(r, c) for r, c in zip(rows.tolist(), cols.tolist(), strict=True) if c == r + pairs}
+    assert len(found) / pairs >= LSH_RECALL - 0.03
+
+
+def test_default_threshold_never_drops_pairs_to_lsh(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert lsh_shape(DEFAULT_THRESHOLD) is None
+    vectors = pairs_at_cosine(200, DEFAULT_THRESHOLD + 0.01)
+    slugs = [f"skill-{i}" for i in range(400)]
+    with pytest.raises(ValueError, match="too low for LSH"):
+        find_duplicates(slugs, vectors, method="lsh")
+
+    # Large catalogs at the default threshold still find every pair
+    monkeypatch.setattr(analyze_duplicates, "LSH_MIN_SKILLS", 100)
+    found = {frozenset(p[:2]) for c in find_duplicates(slugs, vectors) for p in c.pairs}
+    assert {frozenset((f"skill-{i}", f"skill-{200 + i}")) for i in range(200)} <= found
+
+
+def test_cluster_pairs_merges_chains() -> None:
+    rows, cols = np.array([0, 1, 3]), np.array([1, 2, 4])
+    clusters = cluster_pairs(["a", "b", "c", "d", "e"], rows, cols, np.array([0.6, 0.9, 0.7]))
+    assert [c.members for c in clusters] == [["a", "b", "c"], ["d", "e"]]
+    assert clusters[0].pairs[0] == ("b", "c", 0.9)
+
+
+def test_unknown_method_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown method"):
+        find_duplicates(["a"], random_vectors(10, 0), method="fuzzy")
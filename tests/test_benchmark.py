@@ -0,0 +1,89 @@
+"""Tests for the benchmark harness and the tooling benchmark suite."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+from benchmark import Measurement, compare, load_results, main, measure, summarize, write_results
+
+SUITE = Path(__file__).resolve().parent / "benchmarks" / "bench_tooling.py"
+
+
+def result(name: str, median: float, iqr: float = 0.0) -> Measurement:
+    return Measurement(name, median, iqr, median, 5)
+
+
+def test_summary_statistics() -> None:
+    m = summarize("x", [5.0, 1.0, 3.0, 2.0, 4.0])
+    assert (m.median, m.iqr, m.min, m.runs) == (3.0, 2.0, 1.0, 5)
+    assert summarize("x", [2.0]).iqr == 0.0
+    with pytest.raises(ValueError, match="No timings"):
+        summarize("x", [])
+
+
+def test_measure_skips_warmup_and_runs_setup_every_time() -> None:
+    calls: list[str] = []
+    m = measure(
+        "x", lambda: calls.append("run"), repeat=3, warmup=2, setup=lambda: calls.append("setup")
+    )
+    assert m.runs == 3
+    assert calls == ["setup", "run"] * 5
+
+
+def test_compare_applies_tolerance_and_noise_floor() -> None:
+    baseline = {
+        "slower": result("slower", 1.0),
+        "noisy": result("noisy", 1.0, iqr=0.6),
+        "faster": result("faster", 1.0),
+        "tiny": result("tiny", 0.0001),
+        "gone": result("gone", 1.0),
+    }
+    current = {
+        "slower": result("slower", 1.3),
+        "noisy": result("noisy", 1.4, iqr=0.4),
+        "faster": result("faster", 0.5),
+        "tiny": result("tiny", 0.0005),
+        "added": result("added", 1.0),
+    }
+    statuses = {c.name: c.status for c in compare(current, baseline, tolerance=0.25)}
+    assert statuses == {
+        "slower": "regressed",
+        "noisy": "ok",
+        "faster": "improved",
+        "tiny": "ok",
+        "gone": "missing",
+        "added": "new",
+    }
+
+
+def test_compare_command_exit_codes(tmp_path: Path) -> None:
+    base, now = tmp_path / "base.json", tmp_path / "now.json"
+    write_results(base, [result("a", 1.0), result("b", 1.0)])
+    write_results(now, [result("a", 1.1)])
+    assert load_results(now)["a"] == result("a", 1.1)
+
+    assert main(["compare", str(now), str(base)]) == 0
+    assert main(["compare", str(now), str(base), "--fail-on-missing"]) == 1
+    assert main(["compare", str(now), str(base), "--tolerance", "0.05"]) == 1
+    assert main(["compare", str(tmp_path / "none.json"), str(base)]) == 2
+
+
+def test_suite_runs_on_a_small_synthetic_catalog(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spec = importlib.util.spec_from_file_location("bench_tooling", SUITE)
+    assert spec is not None and spec.loader is not None
+    suite = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "bench_tooling", suite)
+    spec.loader.exec_module(suite)
+
+    out = tmp_path / "results.json"
+    argv = ["--scale", "20", "--repeat", "1", "--warmup", "0", "-k", "*[[]synthetic-*"]
+    assert suite.main([*argv, "--out", str(out)]) == 0
+    names = {name.split("[")[0] for name in load_results(out)}
+    expected = {"build_index", "validate_skill_file", "lint_skill_file", "build_dependency_graph"}
+    assert expected | {"analyze_coverage"} <= names
@@ -0,0 +1,89 @@
+"""Tests for the SQLite/FTS5 skill catalog."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import catalog_db
+
+SKILLS = [
+    {
+        "slug": "kubernetes-manifest-generator",
+        "name": "Kubernetes Manifest Generator",
+        "summary": "Generate hardened Kubernetes manifests",
+        "keywords": ["kubernetes", "manifests", "security"],
+        "owner": "cognitive-toolworks",
+        "version": "1.0.0",
+        "entry": "skills/kubernetes-manifest-generator/SKILL.md",
+    },
+    {
+        "slug": "testing-unit-generator",
+        "name": "Unit Test Generator",
+        "summary": "Generate unit tests for Python and TypeScript",
+        "keywords": ["testing", "unit-tests"],
+        "owner": "cognitive-toolworks",
+        "version": "1.0.0",
+        "entry": "skills/testing-unit-generator/SKILL.md",
+    },
+]
+AGENTS = [
+    {
+        "slug": "testing-orchestrator",
+        "name": "Testing Orchestrator",
+        "description": "Coordinates test strategy",
+        "keywords": ["testing"],
+        "entry": "agents/testing-orchestrator/AGENT.md",
+    }
+]
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Path:
+    path = tmp_path / "catalog.db"
+    catalog_db.write_catalog(
+        path,
+        SKILLS,
+        AGENTS,
+        {"testing-unit-generator": ["kubernetes-manifest-generator"]},
+    )
+    return path
+
+
+def test_lookups(db: Path) -> None:
+    conn = catalog_db.connect(db)
+    try:
+        skill = catalog_db.get_skill(conn, "testing-unit-generator")
+        assert skill is not None
+        assert skill["keywords"] == ["testing", "unit-tests"]
+        assert catalog_db.get_skill(conn, "missing") is None
+        assert catalog_db.get_agent(conn, "testing-orchestrator") is not None
+        assert catalog_db.find_by_keyword(conn, "testing") == ["testing-unit-generator"]
+        assert catalog_db.find_by_keyword(conn, "testing", kind="agent") == ["testing-orchestrator"]
+        assert catalog_db.dependents_of(conn, "kubernetes-manifest-generator") == [
+            "testing-unit-generator"
+        ]
+    finally:
+        conn.close()
+
+
+def test_fts_router_ranks_by_bm25(db: Path) -> None:
+    router = catalog_db.FtsSkillRouter(db)
+    try:
+        results = router.route("generate python unit tests", top_k=2, min_score=0.0)
+        assert results[0]["slug"] == "testing-unit-generator"
+        assert [r["rank"] for r in results] == list(range(1, len(results) + 1))
+        assert all(0.0 <= r["score"] < 1.0 for r in results)
+        # FTS syntax in user text must not leak into the MATCH expression
+        assert router.route('"kubernetes" NEAR(', top_k=1, min_score=0.0)[0]["slug"] == (
+            "kubernetes-manifest-generator"
+        )
+        assert router.route("!!!") == []
+    finally:
+        router.close()
+
+
+def test_connect_missing(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        catalog_db.connect(tmp_path / "nope.db")
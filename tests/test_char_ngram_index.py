@@ -0,0 +1,131 @@
+"""Tests for the character n-gram index and typo-tolerant routing."""
+
+from __future__ import annotations
+
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+import char_ngram_index
+from char_ngram_index import CharNgramIndex, char_wb_ngrams
+
+SUITE = Path(__file__).resolve().parent / "benchmarks" / "bench_typos.py"
+TERMS = ["generator", "graphql", "kubernetes", "manifest", "module", "terraform", "the"]
+
+SKILLS = [
+    {
+        "slug": "k8s-manifests",
+        "name": "kubernetes manifest generator",
+        "summary": "generate kubernetes deployment manifests",
+        "keywords": ["kubernetes", "helm"],
+    },
+    {
+        "slug": "graphql-designer",
+        "name": "graphql schema designer",
+        "summary": "design graphql schemas and resolvers",
+        "keywords": ["graphql"],
+    },
+    {
+        "slug": "terraform-modules",
+        "name": "terraform module patterns",
+        "summary": "reusable terraform modules for cloud infrastructure",
+        "keywords": ["terraform"],
+    },
+]
+
+
+def test_char_wb_ngrams_pad_the_word() -> None:
+    assert char_wb_ngrams("helm") == {" he", "hel", "elm", "lm "}
+    assert char_wb_ngrams("a") == {" a "}
+    assert char_wb_ngrams("ab", n=4) == {" ab "}
+
+
+def test_candidates_rank_by_dice_similarity() -> None:
+    index = CharNgramIndex(TERMS)
+    assert len(index) == len(TERMS) and "graphql" in index and "graph" not in index
+    best = index.candidates("kubernets")
+    assert best[0][0] == "kubernetes"
+    assert best[0][1] == pytest.approx(2 * 7 / (9 + 10))
+    assert [s for _, s in best] == sorted((s for _, s in best), reverse=True)
+    assert index.candidates("zzzz") == []
+
+
+def test_nearest_respects_the_similarity_threshold() -> None:
+    index = CharNgramIndex(TERMS)
+    assert index.nearest("manifets") == "manifest"
+    assert index.nearest("modul") == "module"
+    assert index.nearest("terrain") is None
+    assert index.nearest("terrain", min_similarity=0.2) == "terraform"
+
+
+def test_nearest_memo_keeps_the_most_recent_words(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(char_ngram_index, "MAX_MEMO_WORDS", 3)
+    index = CharNgramIndex(TERMS)
+    words = ["kubernets", "manifets", "modul", "terrafrom", "generaton"]
+    for word in words:
+        index.nearest(word)
+    assert index.nearest("modul") == "module"  # a hit refreshes the word
+    index.nearest("graphq")
+    assert [word for word, _ in index._memo] == ["generaton", "modul", "graphq"]
+
+
+def test_correct_joins_split_words_and_keeps_what_it_should() -> None:
+    index = CharNgramIndex(TERMS)
+    tokens = ["the", "kubernets", "manifest", "generaton", "for", "graph", "ql", "api", "k8s"]
+    assert index.correct(tokens) == [
+        "the",
+        "kubernetes",
+        "manifest",
+        "generator",
+        "for",
+        "graphql",
+        "api",
+        "k8s",
+    ]
+    # Stop words are never corrected, even when they resemble a term
+    assert index.correct(["modulo"], skip=["modulo"]) == ["modulo"]
+    assert index.correct(["modulo"]) == ["module"]
+
+
+def test_typo_tolerant_router_recovers_misspelled_queries(tmp_path: Path) -> None:
+    pytest.importorskip("sklearn")
+    from build_embeddings import build_embeddings, save_embeddings
+    from route_skills import SkillRouter
+
+    save_embeddings(build_embeddings(SKILLS), tmp_path)
+    exact = SkillRouter(tmp_path)
+    tolerant = SkillRouter(tmp_path, typo_tolerant=True)
+    assert tolerant._term_index is None and tolerant._tokenize is None
+
+    assert tolerant.correct_query("Kubernets deploymnt") == "kubernetes deployment"
+    assert tolerant.correct_query("graph ql schema") == "graphql schema"
+    assert exact.route("kubernets manifets") == []
+    assert tolerant.route("kubernets manifets")[0]["slug"] == "k8s-manifests"
+    assert tolerant.route("terraform modul")[0]["slug"] == "terraform-modules"
+    clean = "design graphql schemas"
+    assert tolerant.route(clean) == exact.route(clean)
+
+
+def test_typo_benchmark_runs_on_the_eval_queries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("sklearn")
+    spec = importlib.util.spec_from_file_location("bench_typos", SUITE)
+    assert spec is not None and spec.loader is not None
+    suite = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "bench_typos", suite)
+    spec.loader.exec_module(suite)
+
+    rng = random.Random(3)  # noqa: S311 - reproducible test data, not security
+    for _ in range(20):
+        typo = suite.misspell("validate kubernetes manifests", {"kubernetes"}, rng)
+        assert typo != "validate kubernetes manifests"
+        assert typo.split()[0] == "validate"
+
+    out = tmp_path / "typos.json"
+    argv = ["--repeat", "1", "--warmup", "0", "--max-slowdown", "1000", "--out", str(out)]
+    assert suite.main(argv) == 0
+    assert out.exists()
@@ -0,0 +1,121 @@
+"""Tests for the toolworks command-line entry point."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cli import COMMANDS, main
+
+TOOLING = Path(__file__).resolve().parent.parent / "tooling"
+CLI = TOOLING / "cli.py"
+
+# Commands that must start without the scientific stack
+LIGHTWEIGHT = ["index", "route", "validate", "lint", "deps", "coverage", "init", "evals", "graph"]
+HEAVY_MODULES = {"numpy", "scipy", "sklearn"}
+# Generous for slow CI runners; these commands import in well under 100 ms locally
+IMPORT_BUDGET_MS = 500
+# The toolworks console script, run against an installed tooling package
+RUN_INSTALLED = "import sys; from tooling.cli import main; sys.exit(main())"
+
+
+def cold_start(command: str) -> tuple[str, dict[str, int]]:
+    """
+    `toolworks <command> --help` output and its imports (top-level package ->
+    microseconds), from -X importtime
+
+    Nested imports are counted in their top-level importer's cumulative time,
+    so the sum over top-level lines is the total import cost of the command.
+    """
+    # S603: runs our own interpreter on the repo's cli.py with fixed arguments
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", str(CLI), command, "--help"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    totals: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        package = name.strip().split(".")[0]
+        top_level = name.startswith(" ") and not name.startswith("  ")
+        totals[package] = totals.get(package, 0) + (int(cumulative) if top_level else 0)
+    return proc.stdout, totals
+
+
+@pytest.mark.parametrize("command", LIGHTWEIGHT)
+def test_lightweight_commands_start_fast(command: str) -> None:
+    usage, imports = cold_start(command)
+    assert usage.startswith(f"usage: toolworks {command}")
+    assert not HEAVY_MODULES & imports.keys()
+    assert sum(imports.values()) / 1000 < IMPORT_BUDGET_MS
+
+
+def test_usage_lists_every_command(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main([]) == 0
+    out = capsys.readouterr().out
+    assert all(f"  {name} " in out for name in COMMANDS)
+
+    assert main(["nope"]) == 2
+    assert "unknown command 'nope'" in capsys.readouterr().err
+
+
+def test_arguments_reach_the_script(tmp_path: Path) -> None:
+    assert main(["init", "--repo-root", str(tmp_path), "--synthetic-skills", "2"]) == 0
+    assert len(list((tmp_path / "skills").glob("*/SKILL.md"))) == 2
+
+
+def test_profiling_options_wrap_any_command(tmp_path: Path) -> None:
+    trace = tmp_path / "trace.json"
+    argv = ["--trace", str(trace), "init", "--repo-root", str(tmp_path / "repo")]
+    assert main([*argv, "--synthetic-skills", "1"]) == 0
+    assert trace.exists()
+
+
+def test_installed_commands_work_on_the_current_directory(tmp_path: Path) -> None:
+    # Installed layout: the package sits in site-packages, away from any catalog
+    site = tmp_path / "site-packages"
+    shutil.copytree(TOOLING, site / "tooling", ignore=shutil.ignore_patterns("__pycache__"))
+    catalog = tmp_path / "catalog"
+    catalog.mkdir()
+    env = {**os.environ, "PYTHONPATH": str(site)}
+
+    def toolworks(*args: str) -> str:
+        # S603: runs our own interpreter on a copy of the repo's cli with fixed arguments
+        proc = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", RUN_INSTALLED, *args],
+            cwd=catalog,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert proc.returncode == 0, proc.stderr
+        return proc.stdout
+
+    toolworks("init", "--synthetic-skills", "6", "--synthetic-agents", "2")
+    toolworks("index", "--no-db")
+    toolworks("deps")
+    toolworks("coverage")
+    toolworks("graph", "build")
+    agent = sorted(p.name for p in (catalog / "agents").iterdir())[0]
+    toolworks("graph", "needs", agent)
+    expected = [
+        "docs/AGENT_DEPENDENCIES.md",
+        "docs/COVERAGE_MATRIX.md",
+        "index/dependency-graph.json",
+    ]
+    if importlib.util.find_spec("sklearn") is not None:
+        toolworks("embed")
+        assert "Embeddings not found" not in toolworks("route", "synthetic skill")
+        expected.append("index/embeddings/vectorizer.pkl")
+    assert all((catalog / path).exists() for path in expected)
+    assert sorted(p.name for p in site.iterdir()) == ["tooling"]
@@ -0,0 +1,75 @@
+"""Tests for the persisted CSR dependency graph."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from dependency_graph import DependencyGraph, build_graph, slug_from_arg
+
+DEPENDENCIES = {
+    "cloud-orchestrator": {"skills": ["cloud-aws-architect"], "agents": ["security-auditor"]},
+    "security-auditor": {"skills": ["security-scanner"], "agents": []},
+    "idle-agent": {"skills": [], "agents": []},
+}
+SKILL_DEPENDENCIES = {
+    "cloud-aws-architect": ["security-framework"],
+    "security-scanner": ["security-framework"],
+    # A declared cycle must not break the closure
+    "cycle-a": ["cycle-b"],
+    "cycle-b": ["cycle-a"],
+}
+SKILLS = ["cloud-aws-architect", "security-scanner", "cycle-a", "cycle-b", "unused-skill"]
+
+
+@pytest.fixture
+def graph() -> DependencyGraph:
+    return build_graph(DEPENDENCIES, SKILL_DEPENDENCIES, SKILLS)
+
+
+def _naive_reach(graph: DependencyGraph, start: str, reverse: bool = False) -> set[str]:
+    step = graph.direct_dependents if reverse else graph.direct_needs
+    seen: set[str] = set()
+    todo = [start]
+    while todo:
+        for nxt in step(todo.pop()):
+            if nxt not in seen:
+                seen.add(nxt)
+                todo.append(nxt)
+    seen.discard(start)
+    return seen
+
+
+def test_queries(graph: DependencyGraph) -> None:
+    assert graph.kind("security-framework") == "skill"  # declared-only dependency
+    assert graph.needs("cloud-orchestrator", "skill") == [
+        "cloud-aws-architect",
+        "security-framework",
+        "security-scanner",
+    ]
+    assert graph.affected("security-framework", "agent") == [
+        "cloud-orchestrator",
+        "security-auditor",
+    ]
+    assert graph.affected_by(["security-scanner", "security-auditor"]) == ["cloud-orchestrator"]
+    assert graph.needs("cycle-a") == ["cycle-b"]
+    assert graph.affected("unused-skill") == []
+    with pytest.raises(ValueError, match="Unknown agent or skill"):
+        graph.needs("missing")
+
+
+def test_closure_matches_traversal_and_round_trips(graph: DependencyGraph, tmp_path: Path) -> None:
+    path = tmp_path / "graph.json"
+    graph.save(path)
+    loaded = DependencyGraph.load(path)
+    assert loaded.nodes == graph.nodes
+    for slug in graph.nodes:
+        assert set(loaded.needs(slug)) == _naive_reach(graph, slug)
+        assert set(loaded.affected(slug)) == _naive_reach(graph, slug, reverse=True)
+
+
+def test_slug_from_arg() -> None:
+    assert slug_from_arg("skills/security-scanner/SKILL.md") == "security-scanner"
+    assert slug_from_arg("agents/security-auditor") == "security-auditor"
+    assert slug_from_arg("security-scanner") == "security-scanner"
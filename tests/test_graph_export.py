@@ -0,0 +1,74 @@
+"""Tests for the streaming dependency graph exporters."""
+
+from __future__ import annotations
+
+import io
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from analyze_agent_dependencies import generate_mermaid_diagram
+from dependency_graph import DependencyGraph
+from graph_export import FORMATS, export_graph
+
+EDGES = [
+    ("cloud-orchestrator", "cloud-aws-architect"),
+    ("cloud-orchestrator", "security-scanner"),
+    ("security-auditor", "security-scanner"),
+    ("cloud-aws-architect", "security-framework"),
+]
+
+
+@pytest.fixture
+def graph() -> DependencyGraph:
+    return DependencyGraph.from_edges(
+        ["cloud-orchestrator", "security-auditor"], ["cloud-aws-architect"], EDGES
+    )
+
+
+def _export(graph: DependencyGraph, fmt: str, **kwargs: object) -> str:
+    out = io.StringIO()
+    export_graph(graph, fmt, out, **kwargs)  # type: ignore[arg-type]
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_output_is_deterministic(graph: DependencyGraph, fmt: str) -> None:
+    rebuilt = DependencyGraph.from_edges(
+        ["security-auditor", "cloud-orchestrator"], ["cloud-aws-architect"], reversed(EDGES)
+    )
+    assert _export(graph, fmt) == _export(rebuilt, fmt)
+
+
+def test_full_exports(graph: DependencyGraph) -> None:
+    data = json.loads(_export(graph, "json"))
+    assert data["summary"] is False
+    assert data["adjacency"]["cloud-orchestrator"] == ["cloud-aws-architect", "security-scanner"]
+    assert {"id": "security-auditor", "kind": "agent", "domain": "security"} in data["nodes"]
+
+    root = ET.fromstring(_export(graph, "graphml"))  # noqa: S314
+    ns = {"g": "http://graphml.graphdrawing.org/xmlns"}
+    assert len(root.findall(".//g:node", ns)) == len(graph.nodes)
+    assert len(root.findall(".//g:edge", ns)) == len(EDGES)
+
+    dot = _export(graph, "dot")
+    assert 'subgraph "cluster_security" {' in dot
+    assert '"security-auditor" -> "security-scanner";' in dot
+
+
+def test_summary_switches_on_size(graph: DependencyGraph) -> None:
+    assert json.loads(_export(graph, "json", threshold=len(EDGES)))["summary"] is False
+    data = json.loads(_export(graph, "json", threshold=len(EDGES) - 1))
+    assert data["summary"] is True
+    assert data["adjacency"] == {"cloud": {"cloud": 1, "security": 2}, "security": {"security": 1}}
+    assert '"cloud" -> "security" [label="2"];' in _export(graph, "dot", summary=True)
+
+
+def test_mermaid_collapses_to_domains() -> None:
+    dependencies = {
+        "cloud-orchestrator": {"name": "Cloud", "skills": ["cloud-a", "cloud-b"], "skill_count": 2}
+    }
+    assert "cloud_orchestrator --> cloud_a" in generate_mermaid_diagram(dependencies)
+    summary = generate_mermaid_diagram(dependencies, max_edges=1)
+    assert "agents_cloud -->|2| skills_cloud" in summary
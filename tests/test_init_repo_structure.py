@@ -0,0 +1,67 @@
+"""Tests for the synthetic catalog generator in init_repo_structure.py."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from init_repo_structure import generate_synthetic_catalog, main
+from lint_skill import lint_skill_file
+from validate_catalog import validate_file
+from validate_skill import REQ_BODY_SECTIONS, validate_skill_file
+
+
+def test_synthetic_catalog_passes_the_tooling(tmp_path: Path) -> None:
+    skills, agents = generate_synthetic_catalog(tmp_path, 60, 6, seed=3)
+    assert len(set(skills)) == 60
+    assert len(set(agents)) == 6
+
+    for slug in skills:
+        skill_md = tmp_path / "skills" / slug / "SKILL.md"
+        assert validate_skill_file(skill_md) == []
+        assert [i for i in lint_skill_file(skill_md) if i.severity == "ERROR"] == []
+        entry_path = tmp_path / "skills" / slug / "index-entry.json"
+        assert validate_file(entry_path, "index-entry") == []
+        entry = json.loads(entry_path.read_text(encoding="utf-8"))
+        assert set(entry["dependencies"]) <= set(skills[: skills.index(slug)])
+    text = (tmp_path / "skills" / skills[0] / "SKILL.md").read_text(encoding="utf-8")
+    assert all(heading in text for heading in REQ_BODY_SECTIONS)
+
+    index_path = tmp_path / "index" / "agents-index.json"
+    assert validate_file(index_path, "agents-index") == []
+    for agent in json.loads(index_path.read_text(encoding="utf-8")):
+        body = (tmp_path / agent["entry"]).read_text(encoding="utf-8")
+        assert sum(f"`{slug}`" in body for slug in skills) >= 3
+
+
+def test_synthetic_catalog_is_reproducible(tmp_path: Path) -> None:
+    def snapshot(root: Path) -> dict[str, bytes]:
+        return {
+            str(p.relative_to(root)): p.read_bytes() for p in sorted(root.rglob("*")) if p.is_file()
+        }
+
+    for name, seed in (("a", 5), ("b", 5), ("c", 6)):
+        argv = ["--repo-root", str(tmp_path / name), "--no-defaults", "--seed", str(seed)]
+        argv += ["--synthetic-skills", "25", "--synthetic-agents", "3"]
+        assert main(argv) == 0
+    assert snapshot(tmp_path / "a") == snapshot(tmp_path / "b")
+    assert snapshot(tmp_path / "a") != snapshot(tmp_path / "c")
+
+
+def test_a_second_run_never_overwrites_the_first(tmp_path: Path) -> None:
+    def snapshot() -> dict[Path, bytes]:
+        return {p: p.read_bytes() for p in tmp_path.rglob("*.md") if p.is_file()}
+
+    # Base slugs collide at this size, so both runs produce -2, -3, ... suffixes
+    first_skills, first_agents = generate_synthetic_catalog(tmp_path, 200, 10, seed=1)
+    assert any(slug.endswith("-2") for slug in first_skills)
+    before = snapshot()
+    second_skills, second_agents = generate_synthetic_catalog(tmp_path, 200, 10, seed=1)
+
+    assert not set(first_skills) & set(second_skills)
+    assert not set(first_agents) & set(second_agents)
+    after = snapshot()
+    assert {p: after[p] for p in before} == before
+    assert len(after) == len(before) + len(second_skills) + len(second_agents)
+    index = json.loads((tmp_path / "index" / "agents-index.json").read_text(encoding="utf-8"))
+    assert [a["slug"] for a in index] == first_agents + second_agents
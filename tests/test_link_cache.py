@@ -0,0 +1,93 @@
+"""Tests for the persistent link-status cache."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from link_cache import LinkCache, check_links_cached
+from link_checker import LinkChecker, LinkResult
+
+ETAG = '"v1"'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen: ClassVar[list[tuple[str, str | None]]] = []  # (path, If-None-Match)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+    def do_HEAD(self) -> None:
+        self.seen.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/gone":
+            self.send_response(404)
+        elif self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+        else:
+            self.send_response(200)
+            self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    Handler.seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fresh_entries_skip_the_network(server: str, tmp_path: Path) -> None:
+    urls = [f"{server}/ok", f"{server}/gone"]
+    cache = LinkCache(tmp_path / "links.sqlite")
+    checker = LinkChecker(min_interval=0)
+
+    first = check_links_cached(urls, checker, cache)
+    assert (first[urls[0]].ok, first[urls[1]].error) == (True, "HTTP 404")
+    assert len(Handler.seen) == 2
+
+    again = check_links_cached(urls, checker, cache)
+    assert again == first
+    assert len(Handler.seen) == 2
+    checker.close()
+    cache.close()
+
+
+def test_expired_entries_revalidate_conditionally(server: str, tmp_path: Path) -> None:
+    url = f"{server}/ok"
+    cache = LinkCache(tmp_path / "links.sqlite", ttl_hours=1)
+    cache.put_many(
+        [LinkResult(url, True, None, 200, url, ETAG, None)], checked_at=time.time() - 7200
+    )
+    result = check_links_cached([url], LinkChecker(min_interval=0), cache)[url]
+    assert (result.ok, result.status, result.etag) == (True, 304, ETAG)
+    assert Handler.seen == [("/ok", ETAG)]
+    _, checked_at = cache.get(url) or (None, 0.0)
+    assert time.time() - checked_at < 60
+
+
+def test_bad_ttl_and_offline(tmp_path: Path) -> None:
+    cache = LinkCache(tmp_path / "links.sqlite", ttl_hours=10, bad_ttl_hours=1)
+    now = time.time()
+    good = LinkResult("http://example.invalid/a", True)
+    bad = LinkResult("http://example.invalid/b", False, "HTTP 500", 500)
+    cache.put_many([good, bad], checked_at=now - 3 * 3600)
+    assert cache.is_fresh(good, now - 3 * 3600, now)
+    assert not cache.is_fresh(bad, now - 3 * 3600, now)
+
+    # Offline: stale entries are still reported, unknown URLs are skipped
+    offline = check_links_cached(
+        [good.url, bad.url, "http://example.invalid/new"], None, cache, offline=True
+    )
+    assert list(offline) == [good.url, bad.url]
+    assert offline[bad.url].error == "HTTP 500"
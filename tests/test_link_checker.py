@@ -0,0 +1,131 @@
+"""Tests for the concurrent link checker against a local HTTP server."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from link_checker import LinkChecker
+from lint_skill import lint_skill_file
+
+LATENCY = 0.2
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    requests: ClassVar[list[tuple[str, str, int]]] = []  # (method, path, client port)
+    lock = threading.Lock()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+    def _reply(self, status: int, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _handle(self) -> None:
+        with self.lock:
+            self.requests.append((self.command, self.path, self.client_address[1]))
+        if self.path.startswith("/slow"):
+            time.sleep(LATENCY)
+        if self.path == "/nohead" and self.command == "HEAD":
+            self._reply(405)
+        elif self.path == "/nohead":
+            status = 206 if self.headers.get("Range") == "bytes=0-0" else 200
+            self._reply(status)
+        elif self.path == "/moved":
+            self._reply(301, {"Location": "/ok"})
+        elif self.path == "/loop":
+            self._reply(302, {"Location": "/loop"})
+        elif self.path == "/missing":
+            self._reply(404)
+        else:
+            self._reply(200)
+
+    do_HEAD = _handle  # noqa: N815
+    do_GET = _handle  # noqa: N815
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    Handler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_statuses_redirects_and_head_fallback(server: str) -> None:
+    checker = LinkChecker(min_interval=0, max_redirects=3)
+    results = checker.check_many(
+        [
+            f"{server}/ok",
+            f"{server}/nohead",
+            f"{server}/moved",
+            f"{server}/missing",
+            f"{server}/loop",
+        ]
+    )
+    checker.close()
+    assert results[f"{server}/ok"].ok
+    assert (results[f"{server}/nohead"].ok, results[f"{server}/nohead"].status) == (True, 206)
+    assert results[f"{server}/moved"].final_url == f"{server}/ok"
+    assert results[f"{server}/missing"].error == "HTTP 404"
+    assert results[f"{server}/loop"].error == "Too many redirects (>3)"
+    assert ("GET", "/nohead") in {(m, p) for m, p, _ in Handler.requests}
+
+
+def test_dedupes_and_reuses_connections(server: str) -> None:
+    checker = LinkChecker(workers=8, per_host=1, min_interval=0)
+    urls = [f"{server}/page{i % 5}" for i in range(20)]
+    results = checker.check_many(urls)
+    checker.close()
+    assert list(results) == [f"{server}/page{i}" for i in range(5)]
+    assert len(Handler.requests) == 5
+    # One connection per host: every request arrived from the same client port
+    assert len({port for _, _, port in Handler.requests}) == 1
+
+
+def test_concurrency_and_per_host_cap(server: str) -> None:
+    urls = [f"{server}/slow{i}" for i in range(8)]
+
+    start = time.perf_counter()
+    LinkChecker(workers=8, per_host=8, min_interval=0).check_many(urls)
+    parallel = time.perf_counter() - start
+    assert parallel < 4 * LATENCY
+
+    start = time.perf_counter()
+    LinkChecker(workers=8, per_host=2, min_interval=0).check_many(urls)
+    capped = time.perf_counter() - start
+    assert capped >= 4 * LATENCY * 0.9
+
+
+def test_rate_limit(server: str) -> None:
+    start = time.perf_counter()
+    LinkChecker(workers=4, per_host=4, min_interval=0.05).check_many(
+        [f"{server}/r{i}" for i in range(5)]
+    )
+    assert time.perf_counter() - start >= 4 * 0.05 * 0.9
+
+
+def test_unreachable_and_lint_integration(server: str, tmp_path: Path) -> None:
+    result = LinkChecker(timeout=1).check("http://127.0.0.1:9/")
+    assert not result.ok and result.error
+
+    md = tmp_path / "SKILL.md"
+    md.write_text(
+        f"---\nname: x\n---\n\nSee [ok]({server}/ok) and {server}/missing\n", encoding="utf-8"
+    )
+    broken = [i.message for i in lint_skill_file(md, validate_links=True) if "Broken" in i.message]
+    assert broken == [f"Broken link '{server}/missing': HTTP 404"]
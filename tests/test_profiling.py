@@ -0,0 +1,81 @@
+"""Tests for the shared profiling, tracing and memory-report hooks."""
+
+from __future__ import annotations
+
+import json
+import pstats
+from pathlib import Path
+
+import pytest
+
+import profiling
+from build_index import main as build_index_main
+from profiling import profiling_session, span, tracing
+
+SKILL = """---
+name: Demo
+slug: demo
+description: A demo skill
+keywords: [demo]
+owner: me
+version: 1.0.0
+---
+
+## Purpose & When-To-Use
+
+Demo.
+"""
+
+
+def test_span_is_a_shared_no_op_when_not_tracing() -> None:
+    assert not profiling._tracers
+    assert span("a") is span("b", n=1)
+    with span("a"):
+        pass
+
+
+def test_spans_nest_in_chrome_trace_order() -> None:
+    with tracing() as tracer, span("outer", files=2):
+        with span("inner"):
+            pass
+        with span("inner"):
+            pass
+    assert not profiling._tracers
+
+    inner_a, inner_b, outer = tracer.events
+    assert [e["name"] for e in tracer.events] == ["inner", "inner", "outer"]
+    assert outer["args"] == {"files": 2}
+    assert all(e["ph"] == "X" for e in tracer.events)
+    assert outer["ts"] <= inner_a["ts"] <= inner_b["ts"]
+    assert inner_b["ts"] + inner_b["dur"] <= outer["ts"] + outer["dur"]
+    assert tracer.to_json()["traceEvents"][0]["ph"] == "M"
+
+
+def test_outputs_are_written_even_when_the_command_exits(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    prof, trace = tmp_path / "out.prof", tmp_path / "trace.json"
+    with pytest.raises(SystemExit), profiling_session(prof, trace, memprofile=True):
+        with span("allocate"):
+            held = [bytearray(1024) for _ in range(100)]
+        raise SystemExit(1)
+    assert held
+
+    assert pstats.Stats(str(prof)).total_calls > 0
+    events = json.loads(trace.read_text(encoding="utf-8"))["traceEvents"]
+    assert [e["name"] for e in events if e["ph"] == "X"] == ["allocate"]
+    err = capsys.readouterr().err
+    assert "Peak traced memory" in err
+    assert "test_profiling.py" in err
+    assert "by cumulative time" in err
+
+
+def test_build_index_trace_covers_its_phases(tmp_path: Path) -> None:
+    (tmp_path / "skills" / "demo").mkdir(parents=True)
+    (tmp_path / "skills" / "demo" / "SKILL.md").write_text(SKILL, encoding="utf-8")
+    trace = tmp_path / "trace.json"
+
+    argv = ["--root", str(tmp_path), "--no-db", "--no-schema-check", "--trace", str(trace)]
+    assert build_index_main(argv) == 0
+    names = {e["name"] for e in json.loads(trace.read_text(encoding="utf-8"))["traceEvents"]}
+    assert {"parse skills", "read", "yaml load", "estimate tokens", "write index"} <= names
@@ -0,0 +1,79 @@
+"""Tests for the routing query log and its streaming analyzer."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from query_log import (
+    FrequentItems,
+    LogHistogram,
+    QueryLogWriter,
+    analyze_query_log,
+    cluster_queries,
+    log_files,
+    route_record,
+)
+
+
+def test_writer_rotates_by_size_without_losing_records(tmp_path: Path) -> None:
+    path = tmp_path / "logs" / "route.jsonl"
+    writer = QueryLogWriter(path, max_bytes=2000, backups=10, flush_interval=0.01)
+    for i in range(100):
+        writer.log(route_record(f"query {i}", ["demo-skill"], [0.5], 1.0, 0.1))
+    writer.close()
+    writer.log(route_record("after close", [], [], 1.0, 0.1))  # ignored
+
+    files = log_files(path)
+    assert len(files) > 1
+    assert all(f.stat().st_size <= 2000 for f in files)
+    queries = [json.loads(line)["query"] for f in files for line in f.open()]
+    assert queries == [f"query {i}" for i in range(100)]  # oldest backup first
+
+
+def test_analyzer_streams_demand_and_gaps(tmp_path: Path) -> None:
+    path = tmp_path / "route.jsonl"
+    records = [route_record("deploy kubernetes app", ["k8s-deploy"], [0.6], 2.0, 0.1)] * 5
+    records += [route_record("bake sourdough bread", ["k8s-deploy"], [0.02], 4.0, 0.1)] * 3
+    records += [route_record("bread baking recipe", [], [], 4.0, 0.1)]
+    path.write_text(
+        "".join(json.dumps(r) + "\n" for r in records) + '{"torn": \n', encoding="utf-8"
+    )
+
+    stats = analyze_query_log([path])
+    assert stats.total == 9
+    assert stats.low_confidence == 4
+    assert stats.skill_demand == {"k8s-deploy": 5}
+    assert stats.unmet_queries.top(1) == [("bake sourdough bread", 3)]
+    clusters = stats.clusters(threshold=0.2)
+    assert clusters[0].size == 4
+    assert "bread" in clusters[0].terms
+
+
+def test_histogram_percentiles_are_close() -> None:
+    rng = random.Random(0)  # noqa: S311
+    values = sorted(rng.lognormvariate(0, 1) for _ in range(20_000))
+    hist = LogHistogram()
+    for v in values:
+        hist.add(v)
+    for pct in (50, 90, 99):
+        exact = values[int(pct / 100 * len(values)) - 1]
+        assert hist.percentile(pct) == pytest.approx(exact, rel=0.03)
+
+
+def test_frequent_items_keeps_heavy_hitters_in_bounded_space() -> None:
+    items = FrequentItems(capacity=10)
+    for i in range(5000):
+        items.add("popular" if i % 3 == 0 else f"rare-{i}")
+    assert len(items.counts) <= 10
+    assert items.top(1)[0][0] == "popular"
+
+
+def test_cluster_queries_groups_by_token_overlap() -> None:
+    clusters = cluster_queries(
+        ["rotate aws keys", "rotate aws access keys", "paint a fence", "please"]
+    )
+    assert [c.size for c in clusters] == [2, 1]
@@ -0,0 +1,105 @@
+"""Tests for the content-hash result cache."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import result_cache
+from lint_skill import CACHE_MODULES, lint_cached, lint_skill_file
+from result_cache import ResultCache, tool_fingerprint
+from validate_skill import cache_fingerprint, iter_validation_results
+
+SKILL = "---\nname: demo\n---\n\n## Purpose & When-To-Use\n```bash\necho hi\n"
+
+
+def test_hit_miss_and_prune(tmp_path: Path) -> None:
+    a, b = tmp_path / "a.md", tmp_path / "b.md"
+    a.write_text("one", encoding="utf-8")
+    b.write_text("two", encoding="utf-8")
+    store = tmp_path / "cache" / "t.json"
+
+    cache = ResultCache(store, "fp")
+    assert cache.get("a", [a]) is None
+    cache.put("a", [a], ["issue"])
+    cache.put("b", [b], [])
+    cache.save()
+
+    cache = ResultCache(store, "fp")
+    assert cache.get("a", [a]) == ["issue"]
+    # Touched but identical content still hits; changed content misses
+    st = a.stat()
+    os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.get("a", [a]) == ["issue"]
+    a.write_text("ONE", encoding="utf-8")
+    assert cache.get("a", [a]) is None
+    cache.save()  # b was not looked up this run: pruned
+
+    cache = ResultCache(store, "fp")
+    assert set(cache.entries) == {"a"}
+    assert ResultCache(store, "other").entries == {}
+
+
+def test_fingerprint_tracks_options() -> None:
+    assert tool_fingerprint(["skill_rules"]) == tool_fingerprint(["skill_rules"])
+    assert tool_fingerprint(["skill_rules"]) != tool_fingerprint(["skill_rules"], {"x": 1})
+    assert cache_fingerprint(False, None) != cache_fingerprint(True, None)
+
+
+def test_validate_and_lint_replay(tmp_path: Path) -> None:
+    md = tmp_path / "demo" / "SKILL.md"
+    md.parent.mkdir()
+    md.write_text(SKILL, encoding="utf-8")
+
+    def validate(cache: ResultCache) -> list[tuple[Path, str]]:
+        return [
+            (i.path, i.message)
+            for _, res in iter_validation_results([md], cache=cache)
+            for i in res
+        ]
+
+    fp = cache_fingerprint(False, None)
+    cold = ResultCache(tmp_path / "validate.json", fp)
+    expected = validate(cold)
+    assert expected and cold.misses == 1
+    cold.save()
+    warm = ResultCache(tmp_path / "validate.json", fp)
+    assert validate(warm) == expected
+    assert (warm.hits, warm.misses) == (1, 0)
+
+    lint = ResultCache(tmp_path / "lint.json", "fp")
+    issues, urls = lint_cached(md, lint)
+    assert (issues, urls) == lint_cached(md, lint)
+    assert issues == lint_skill_file(md)
+    assert lint.hits == 1
+
+
+def test_lint_cache_invalidated_by_listed_module_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # lint_document reads the front matter split, events and links from skill_document
+    assert "skill_document" in CACHE_MODULES
+    tooling = tmp_path / "tooling"
+    tooling.mkdir()
+    for name in CACHE_MODULES:
+        shutil.copy(result_cache.TOOLING_DIR / f"{name}.py", tooling)
+    monkeypatch.setattr(result_cache, "TOOLING_DIR", tooling)
+
+    md = tmp_path / "SKILL.md"
+    md.write_text(SKILL, encoding="utf-8")
+    store = tmp_path / "lint.json"
+    cache = ResultCache(store, tool_fingerprint(CACHE_MODULES))
+    lint_cached(md, cache)
+    cache.save()
+
+    for name in CACHE_MODULES:
+        source = tooling / f"{name}.py"
+        original = source.read_text(encoding="utf-8")
+        source.write_text(original + "\n# changed\n", encoding="utf-8")
+        cache = ResultCache(store, tool_fingerprint(CACHE_MODULES))
+        lint_cached(md, cache)
+        assert (cache.hits, cache.misses) == (0, 1), name
+        source.write_text(original, encoding="utf-8")
@@ -0,0 +1,158 @@
+"""Tests for the eval scenario runner."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import result_cache
+from result_cache import ResultCache
+from run_evals import (
+    CommandExecutor,
+    Scenario,
+    StubExecutor,
+    load_scenarios,
+    main,
+    matches,
+    parse_checks,
+    run_check,
+    run_scenarios,
+)
+
+EVALS = """
+skill: demo-skill
+scenarios:
+  - name: dict style
+    inputs: {target: 99.9}
+    expected_output:
+      report:
+        status: ["PASS", "WARN"]
+        error_budget_remaining: ">0"
+      notes: not_null
+  - name: statement style
+    input: {}
+    expected_outputs:
+      - config.topics[0].partitions >= 3
+      - config.topics[0].name matches /user\\\\.activity/
+      - code contains "retry"
+      - summary is present
+      - reviewers agree the design is sound
+"""
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "evals_demo-skill.yaml").write_text(EVALS, encoding="utf-8")
+    (tmp_path / "skills" / "demo-skill").mkdir(parents=True)
+    (tmp_path / "skills" / "demo-skill" / "SKILL.md").write_text("# Demo\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_expected_output_expressions() -> None:
+    assert matches(3, ">0")
+    assert not matches(0, ">0")
+    assert matches(1999, "<2000")
+    assert matches("WARN", ["PASS", "WARN"])
+    assert matches(["API2:2023", "API8:2023", "x"], ["API8:2023", "API2:2023"])
+    assert matches({"rule": "E501", "line": 3}, {"rule": "E501"})
+    assert not matches("5", ">0")
+
+    checks, manual = parse_checks(
+        ["a.b[1] == true", "text contains error handling", {"contains": "stages:"}]
+    )
+    assert manual == 1
+    assert run_check(checks[0], {"a": {"b": [False, True]}})
+    assert run_check(checks[1], {"text": "export const stages: []"})
+
+
+def test_stub_run_passes_and_reports_free_text(repo: Path) -> None:
+    scenarios = load_scenarios(repo / "tests" / "evals_demo-skill.yaml")
+    assert [s.key for s in scenarios] == ["demo-skill::dict style", "demo-skill::statement style"]
+
+    results = list(run_scenarios(scenarios, StubExecutor(), jobs=2, root=repo))
+    assert [r.status for r in results] == ["pass", "pass"]
+    assert [(r.checks, r.manual) for r in results] == [(2, 0), (4, 1)]
+    assert all(r.seconds >= 0 for r in results)
+
+
+def test_failures_name_the_expectation(repo: Path) -> None:
+    scenario = load_scenarios(repo / "tests" / "evals_demo-skill.yaml")[0]
+    [result] = run_scenarios(
+        [scenario], lambda _scenario: {"report": {"status": "FAIL"}}, root=repo
+    )
+    assert result.status == "fail"
+    assert len(result.failures) == 2
+
+
+def test_cache_reruns_only_changed_skills(repo: Path) -> None:
+    calls: list[str] = []
+
+    def executor(scenario: Scenario) -> Any:
+        calls.append(scenario.id)
+        return StubExecutor()(scenario)
+
+    scenarios = load_scenarios(repo / "tests" / "evals_demo-skill.yaml")
+    store = repo / "cache.json"
+    for _ in range(2):
+        cache = ResultCache(store, "fp")
+        results = list(run_scenarios(scenarios, executor, cache=cache, root=repo))
+        cache.save()
+    assert len(calls) == 2
+    assert all(r.cached for r in results)
+
+    (repo / "skills" / "demo-skill" / "SKILL.md").write_text("# Changed\n", encoding="utf-8")
+    cache = ResultCache(store, "fp")
+    results = list(run_scenarios(scenarios, executor, cache=cache, root=repo))
+    assert len(calls) == 4
+    assert not any(r.cached for r in results)
+
+
+def test_cache_invalidated_by_listed_module_changes(
+    repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    tooling = tmp_path / "tooling"
+    shutil.copytree(result_cache.TOOLING_DIR, tooling)
+    monkeypatch.setattr(result_cache, "TOOLING_DIR", tooling)
+
+    def cached() -> list[bool]:
+        assert main(["--root", str(repo), "--jobs", "1", "--json"]) == 0
+        return [r["cached"] for r in json.loads(capsys.readouterr().out)]
+
+    assert not any(cached())
+    assert all(cached())
+    # Scenario files are parsed by validate_catalog.load_data
+    source = tooling / "validate_catalog.py"
+    source.write_text(source.read_text(encoding="utf-8") + "\n# changed\n", encoding="utf-8")
+    assert not any(cached())
+
+
+def test_evals_without_a_skill_directory_are_reported(
+    repo: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    argv = ["--root", str(repo), "--no-cache", "--json"]
+    assert main([*argv, "--strict"]) == 0
+    assert "directory" not in capsys.readouterr().err
+
+    orphan = repo / "tests" / "evals_renamed-skill.yaml"
+    orphan.write_text(EVALS.replace("demo-skill", "renamed-skill"), encoding="utf-8")
+    assert main(argv) == 0
+    assert f"[WARN] {orphan}: no skills/renamed-skill directory" in capsys.readouterr().err
+    assert main([*argv, "--strict"]) == 1
+    assert f"[ERROR] {orphan}: no skills/renamed-skill directory" in capsys.readouterr().err
+
+
+def test_command_executor_errors_are_reported(repo: Path) -> None:
+    scenario = load_scenarios(repo / "tests" / "evals_demo-skill.yaml")[1]
+    echo = CommandExecutor(f'"{sys.executable}" -c "import sys; print(sys.stdin.read())"')
+    assert echo(scenario)["skill"] == "demo-skill"
+
+    failing = CommandExecutor(f'"{sys.executable}" -c "raise SystemExit(3)"')
+    [result] = run_scenarios([scenario], failing, root=repo)
+    assert result.status == "error"
+    assert "exit 3" in result.failures[0]
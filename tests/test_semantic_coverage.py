@@ -0,0 +1,72 @@
+"""Tests for embedding-based semantic coverage."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sklearn")
+
+from build_embeddings import build_embeddings, save_embeddings
+from semantic_coverage import (
+    analyze_semantic_coverage,
+    generate_semantic_report,
+    load_embeddings,
+)
+
+SKILLS = [
+    {"slug": f"{domain}-{i}", "name": f"{domain} {word}", "summary": text, "keywords": [domain]}
+    for domain, word, text in [
+        ("kubernetes", "helm", "kubernetes helm charts pods clusters deployment manifests"),
+        ("testing", "unit", "unit tests pytest mocks fixtures coverage assertions"),
+    ]
+    for i in range(6)
+] + [
+    {
+        "slug": "finance-ledger",
+        "name": "ledger reconciliation",
+        "summary": "accounting ledger invoices",
+        "keywords": [],
+    }
+]
+
+
+@pytest.fixture
+def embeddings_dir(tmp_path: Path) -> Path:
+    save_embeddings(build_embeddings(SKILLS), tmp_path)
+    return tmp_path
+
+
+def test_clusters_follow_the_vectors(embeddings_dir: Path) -> None:
+    slugs, vectors, terms = load_embeddings(embeddings_dir)
+    coverage = analyze_semantic_coverage(slugs, vectors, terms, k=3, seed=0)
+
+    groups = sorted(sorted(cl.members) for cl in coverage.clusters)
+    assert groups == sorted(
+        [
+            ["finance-ledger"],
+            sorted(f"kubernetes-{i}" for i in range(6)),
+            sorted(f"testing-{i}" for i in range(6)),
+        ]
+    )
+    by_first = {cl.members[0].split("-")[0]: cl for cl in coverage.clusters}
+    assert "kubernetes" in by_first["kubernetes"].terms
+    assert by_first["finance"].sparse
+    assert coverage.outliers[0][1] <= coverage.outliers[-1][1]
+
+
+def test_similarity_matches_dense_computation(embeddings_dir: Path) -> None:
+    slugs, vectors, terms = load_embeddings(embeddings_dir)
+    coverage = analyze_semantic_coverage(slugs, vectors, terms, k=2, seed=1)
+    dense = vectors.toarray()
+    index = {slug: i for i, slug in enumerate(slugs)}
+    for cl in coverage.clusters:
+        rows = dense[[index[m] for m in cl.members]]
+        centroid = rows.mean(axis=0)
+        centroid /= (centroid**2).sum() ** 0.5
+        assert cl.cohesion == pytest.approx(float((rows @ centroid).mean()), abs=0.05)
+
+    report = generate_semantic_report(coverage, len(slugs))
+    assert "## Sparse Regions" in report
+    assert "## Least Typical Skills" in report
@@ -0,0 +1,87 @@
+"""Tests for the single-file skill bundle."""
+
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import skill_bundle
+from skill_bundle import HEADER, MAGIC, SkillBundle, build_bundle, collect_bundle_files
+
+SKILL = (
+    "---\nslug: demo\n---\n\n## Purpose & When-To-Use\n\nUse it.\n\n## Output Contract\n\nJSON.\n"
+)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "index" / "embeddings").mkdir(parents=True)
+    (tmp_path / "index" / "skills-index.json").write_text('[{"slug": "demo"}]\n')
+    (tmp_path / "index" / "embeddings" / "slugs.json").write_text('["demo"]')
+    (tmp_path / "index" / "embeddings" / ".gitkeep").write_text("")
+    skill = tmp_path / "skills" / "demo"
+    (skill / "examples").mkdir(parents=True)
+    (skill / "SKILL.md").write_text(SKILL, encoding="utf-8")
+    (skill / "examples" / "demo.txt").write_bytes(b"odd-length")
+    return tmp_path
+
+
+def test_round_trip(repo: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out" / "skills.bundle"
+    stats = build_bundle(repo, out)
+    assert stats["files"] == len(collect_bundle_files(repo)) == 4
+
+    with SkillBundle(out) as bundle:
+        assert "index/embeddings/.gitkeep" not in bundle
+        assert bundle.load_json("index/skills-index.json") == [{"slug": "demo"}]
+        assert bytes(bundle.read("skills/demo/examples/demo.txt")) == b"odd-length"
+        assert bundle.text("skills/demo/SKILL.md") == SKILL
+        view = bundle.section("demo", "## Output Contract")
+        assert isinstance(view, memoryview)
+        assert str(view, "utf-8") == "## Output Contract\n\nJSON.\n"
+        with pytest.raises(KeyError):
+            bundle.section("demo", "Examples")
+        with pytest.raises(FileNotFoundError):
+            bundle.read("skills/missing/SKILL.md")
+
+
+def test_build_is_deterministic(repo: Path, tmp_path: Path) -> None:
+    a, b = tmp_path / "a.bundle", tmp_path / "b.bundle"
+    build_bundle(repo, a)
+    build_bundle(repo, b)
+    assert a.read_bytes() == b.read_bytes()
+
+
+def test_rejects_non_bundle(tmp_path: Path) -> None:
+    bogus = tmp_path / "bogus.bundle"
+    bogus.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError, match="bad magic"):
+        SkillBundle(bogus)
+
+
+def test_rejected_files_release_their_mapping(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    opened: list[mmap.mmap] = []
+    real_mmap = mmap.mmap
+
+    def recording_mmap(*args: Any, **kwargs: Any) -> mmap.mmap:
+        opened.append(real_mmap(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(skill_bundle.mmap, "mmap", recording_mmap)
+    cases = {
+        "truncated": b"CTW",
+        "bad magic": b"x" * HEADER.size,
+        "Unsupported bundle version": HEADER.pack(MAGIC, 99, 0, 0, 0),
+    }
+    for message, data in cases.items():
+        path = tmp_path / "bogus.bundle"
+        path.write_bytes(data)
+        with pytest.raises(ValueError, match=message):
+            SkillBundle(path)
+    assert len(opened) == len(cases)
+    assert all(m.closed for m in opened)
@@ -0,0 +1,117 @@
+"""Tests for the shared lazily parsed document model."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import skill_document
+from skill_document import (
+    AgentDocument,
+    MarkdownDocument,
+    SkillDocument,
+    clear_document_cache,
+    load_document,
+)
+
+TEXT = """---
+slug: demo-skill
+name: Demo
+---
+
+## Purpose & When-To-Use
+See [docs](https://example.com/docs) and https://example.org/x.
+
+```bash
+echo hi
+```
+
+## Examples
+```text
+out
+```
+"""
+
+
+def test_lazy_views(tmp_path: Path) -> None:
+    path = tmp_path / "SKILL.md"
+    path.write_text(TEXT, encoding="utf-8")
+    doc = SkillDocument(path)
+    assert doc.meta == {"slug": "demo-skill", "name": "Demo"}
+    assert doc.slug == "demo-skill"
+    assert doc.body_start == 5
+    assert doc.body.startswith("\n## Purpose & When-To-Use")
+    assert [s["heading"] for s in doc.sections] == ["Purpose & When-To-Use", "Examples"]
+    assert doc.code_blocks == [(5, 7), (10, 12)]
+    assert doc.links == ["https://example.com/docs", "https://example.org/x."]
+    assert doc.events is doc.events
+    assert not hasattr(doc, "__dict__")
+
+
+def test_front_matter_errors_are_sticky() -> None:
+    doc = MarkdownDocument.from_text("no front matter\n## Heading\n")
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Missing starting '---'"):
+            doc.meta  # noqa: B018
+    assert doc.body_start == 1
+    assert doc.body.splitlines() == ["no front matter", "## Heading"]
+
+    unclosed = MarkdownDocument.from_text("---\nslug: x\n")
+    assert unclosed.front_matter_error == "Missing closing '---' for front matter"
+
+
+def test_load_document_memoizes_by_stamp(tmp_path: Path) -> None:
+    clear_document_cache()
+    path = tmp_path / "AGENT.md"
+    path.write_text(TEXT, encoding="utf-8")
+    doc = load_document(path, AgentDocument)
+    assert isinstance(doc, AgentDocument)
+    assert load_document(path, AgentDocument) is doc
+    assert load_document(path) is not doc  # separate entry per document kind
+
+    path.write_text(TEXT.replace("Demo", "Changed"), encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    reloaded = load_document(path, AgentDocument)
+    assert reloaded is not doc
+    assert reloaded.meta["name"] == "Changed"
+
+
+def test_decoding_text_keeps_one_copy_of_the_file(tmp_path: Path) -> None:
+    path = tmp_path / "SKILL.md"
+    path.write_text(TEXT + "Unicode: \u00e9\u2014\U0001f600\n", encoding="utf-8")
+    doc = SkillDocument(path)
+    raw = doc.data
+    assert doc.text == raw.decode("utf-8")
+    assert doc._data is None
+    path.unlink()  # the bytes now come from the decoded text
+    assert doc.data == raw
+    assert [s["heading"] for s in doc.sections] == ["Purpose & When-To-Use", "Examples"]
+
+
+def test_document_cache_is_bounded_by_file_size(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clear_document_cache()
+    size = len(TEXT.encode("utf-8"))
+    monkeypatch.setattr(skill_document, "MAX_CACHED_BYTES", 2 * size)
+    monkeypatch.setattr(skill_document, "MAX_CACHED_DOCUMENT_BYTES", size)
+    paths = []
+    for name in "abc":
+        paths.append(tmp_path / name / "SKILL.md")
+        paths[-1].parent.mkdir()
+        paths[-1].write_text(TEXT, encoding="utf-8")
+    a, b = load_document(paths[0]), load_document(paths[1])
+    assert load_document(paths[0]) is a  # a is now the most recently loaded
+    load_document(paths[2])
+    assert load_document(paths[0]) is a
+    assert load_document(paths[1]) is not b  # evicted to stay within two files
+
+    big = tmp_path / "big" / "SKILL.md"
+    big.parent.mkdir()
+    big.write_text(TEXT + "x\n", encoding="utf-8")
+    assert load_document(big) is not load_document(big)
+    assert load_document(paths[0]) is a  # uncached files evict nothing
+    clear_document_cache()
@@ -0,0 +1,86 @@
+"""Tests for the single-pass rule engine and the rules built on it."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from lint_skill import lint_skill_file
+from skill_rules import (
+    FENCE_CLOSE,
+    FENCE_OPEN,
+    HEADING,
+    TEXT,
+    LineEvent,
+    Rule,
+    run_rules,
+    split_front_matter,
+    tokenize,
+)
+from validate_skill import find_code_blocks, first_examples_block_len, validate_skill_file
+
+
+def test_tokenize_events() -> None:
+    lines = ["## Title", "text", "```bash", "# comment", "```", "### Sub"]
+    events = list(tokenize(lines))
+    assert [e.kind for e in events] == [HEADING, TEXT, FENCE_OPEN, HEADING, FENCE_CLOSE, HEADING]
+    assert [e.lineno for e in events] == [1, 2, 3, 4, 5, 6]
+    assert (events[0].level, events[0].in_fence) == (2, False)
+    assert (events[3].level, events[3].in_fence) == (1, True)
+
+
+def test_split_front_matter() -> None:
+    fm, body, error = split_front_matter(["---", "a: 1", "---", "body"])
+    assert (fm, list(body), error) == (["a: 1"], ["body"], None)
+
+    fm, body, error = split_front_matter(["---", "a: 1"])
+    assert fm is None
+    assert list(body) == ["---", "a: 1"]
+    assert error == "Missing closing '---' for front matter"
+
+    fm, body, error = split_front_matter(["plain"])
+    assert (fm, list(body)) == (None, ["plain"])
+    assert error == "Missing starting '---' for front matter"
+
+
+def test_rules_only_see_subscribed_kinds() -> None:
+    class HeadingCounter(Rule):
+        kinds = frozenset({HEADING})
+
+        def __init__(self) -> None:
+            self.seen: list[str] = []
+
+        def visit(self, event: LineEvent) -> None:
+            self.seen.append(event.kind)
+
+    rule = HeadingCounter()
+    assert run_rules(["## A", "x", "```", "```", "## B"], [rule]) == []
+    assert rule.seen == [HEADING, HEADING]
+
+
+def test_legacy_helpers() -> None:
+    body = "intro\n```\na\n```\n## Examples\n```\n1\n2\n```\n## Examples\n```\n```\n"
+    assert find_code_blocks(body) == [(1, 3), (5, 8), (10, 11)]
+    assert first_examples_block_len(body) == 2
+    # A repeated Examples heading ends the search window, like re.split did
+    assert first_examples_block_len("## Examples\n## Examples\n```\nx\n```\n") is None
+
+
+def test_validate_and_lint_issues(tmp_path: Path) -> None:
+    path = tmp_path / "SKILL.md"
+    path.write_text(
+        "---\nname: Demo\ndescription: d\nkeywords: [a]\n---\n"
+        "## Procedure\n\n## Purpose & When-To-Use\n\n```\nsecret = hunter2hunter2\n"
+    )
+    messages = [i.message for i in validate_skill_file(path)]
+    assert "Missing required section heading: ## Pre-Checks" in messages
+    assert "Token budgets (T1/T2/T3) not found" in messages
+    assert "No code example found under '## Examples'" in messages
+    assert messages[-1].startswith("Potential secret matched pattern:")
+
+    lint = [(i.severity, i.message) for i in lint_skill_file(path)]
+    assert lint[0] == (
+        "ERROR",
+        "Heading '## Purpose & When-To-Use' appears out of order (expected after '## Procedure')",
+    )
+    assert ("ERROR", "Unclosed code fence starting at line 5") in lint
+    assert ("WARN", "Missing required section: ## Examples") in lint
@@ -0,0 +1,99 @@
+"""Tests for the SKILL.md byte-offset section index."""
+
+from __future__ import annotations
+
+import itertools
+from pathlib import Path
+
+import pytest
+
+from skill_sections import index_sections, read_sections
+
+DOC = """---
+name: "Demo"
+slug: demo
+---
+
+## Purpose & When-To-Use
+
+Use it.
+
+```markdown
+## Not A Section
+```
+
+## Output Contract
+
+Returns JSON — with unicode.
+
+## Resources
+
+- link
+"""
+
+
+def test_index_sections_skips_front_matter_and_fences() -> None:
+    data = DOC.encode("utf-8")
+    sections = index_sections(data)
+    assert [s["heading"] for s in sections] == [
+        "Purpose & When-To-Use",
+        "Output Contract",
+        "Resources",
+    ]
+    # Sections tile the body from the first heading to EOF
+    assert sections[-1]["offset"] + sections[-1]["length"] == len(data)
+    for a, b in itertools.pairwise(sections):
+        assert a["offset"] + a["length"] == b["offset"]
+    purpose = data[sections[0]["offset"] : sections[0]["offset"] + sections[0]["length"]]
+    assert b"## Not A Section" in purpose
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, 1 << 20])
+def test_read_sections_uses_offsets(tmp_path: Path, mmap_threshold: int) -> None:
+    path = tmp_path / "SKILL.md"
+    path.write_text(DOC, encoding="utf-8")
+    data = path.read_bytes()
+
+    got = read_sections(
+        path,
+        ["## Output Contract", "Resources"],
+        sections=index_sections(data),
+        size=len(data),
+        mmap_threshold=mmap_threshold,
+    )
+    assert list(got) == ["Output Contract", "Resources"]
+    assert got["Output Contract"].startswith("## Output Contract\n")
+    assert "unicode" in got["Output Contract"]
+    assert got["Resources"].endswith("- link\n")
+
+
+def test_read_sections_reindexes_stale_table(tmp_path: Path) -> None:
+    path = tmp_path / "SKILL.md"
+    path.write_text(DOC, encoding="utf-8")
+    stale = index_sections(path.read_bytes())
+    path.write_text(DOC.replace("Use it.", "Use it, now with more words."), encoding="utf-8")
+
+    got = read_sections(path, ["Output Contract"], sections=stale, size=len(DOC.encode()))
+    assert got["Output Contract"].startswith("## Output Contract")
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, 1 << 20])
+def test_read_sections_reindexes_same_size_edits(tmp_path: Path, mmap_threshold: int) -> None:
+    path = tmp_path / "SKILL.md"
+    path.write_text(DOC, encoding="utf-8")
+    table = index_sections(path.read_bytes())
+
+    # Same length, but "## Output Contract" now starts two bytes later
+    moved = DOC.replace("Use it.\n", "Use it.\n\n\n").replace("with unicode.", "with unicod")
+    assert len(moved.encode()) == len(DOC.encode())
+    path.write_text(moved, encoding="utf-8")
+    got = read_sections(
+        path, ["Output Contract"], table, len(DOC.encode()), mmap_threshold=mmap_threshold
+    )
+    assert got["Output Contract"] == "## Output Contract\n\nReturns JSON — with unicod\n\n"
+
+    # Same length and offsets, but the following heading is now body text
+    path.write_text(DOC.replace("## Resources", "xx Resources"), encoding="utf-8")
+    got = read_sections(path, None, table, len(DOC.encode()), mmap_threshold=mmap_threshold)
+    assert list(got) == ["Purpose & When-To-Use", "Output Contract"]
+    assert got["Output Contract"].endswith("xx Resources\n\n- link\n")
@@ -0,0 +1,55 @@
+"""Tests for the single-pass slug matcher."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+from analyze_agent_dependencies import extract_skill_references
+from slug_matcher import SlugMatcher, scan_agents
+
+SKILLS = ["api-design", "api-design-validator", "cloud-aws-architect", "k8s-helm"]
+AGENTS = ["cloud-orchestrator", "security-auditor"]
+
+
+def test_finds_bare_and_backticked_mentions_at_slug_boundaries() -> None:
+    matcher = SlugMatcher(SKILLS, AGENTS)
+    text = (
+        "Use `api-design-validator` first, then api-design.\n"
+        "Delegate to cloud-orchestrator (see skills/k8s-helm/SKILL.md).\n"
+        "Not matched: xapi-design, api-designs, cloud-aws-architect-v2, API-DESIGN."
+    )
+    refs = matcher.references(text, exclude="cloud-orchestrator")
+    assert refs.skills == ("api-design", "api-design-validator", "k8s-helm")
+    assert refs.agents == ()
+    assert matcher.references(text).agents == ("cloud-orchestrator",)
+
+
+def test_matches_naive_per_slug_search() -> None:
+    matcher = SlugMatcher(SKILLS, AGENTS)
+    text = " ".join(["api-design-validator", "api-design-", "-k8s-helm", "security-auditor."] * 3)
+    expected = {
+        slug
+        for slug in SKILLS + AGENTS
+        if re.search(rf"(?<![a-z0-9-]){re.escape(slug)}(?![a-z0-9-])", text)
+    }
+    assert matcher.find(text) == expected
+
+
+def test_scan_agents_parallel_matches_serial(tmp_path: Path) -> None:
+    paths = []
+    for i, body in enumerate(["uses api-design", "uses `k8s-helm` and security-auditor", "none"]):
+        agent_dir = tmp_path / f"agent-{i}"
+        agent_dir.mkdir()
+        path = agent_dir / "AGENT.md"
+        path.write_text(f"---\nslug: agent-{i}\n---\n{body}\n", encoding="utf-8")
+        paths.append(path)
+
+    serial = scan_agents(paths, SKILLS, AGENTS)
+    assert serial == scan_agents(paths, SKILLS, AGENTS, jobs=2)
+    assert [r.skills for r in serial] == [("api-design",), ("k8s-helm",), ()]
+    assert serial[1].agents == ("security-auditor",)
+
+    matcher = SlugMatcher(SKILLS, AGENTS)
+    assert extract_skill_references(paths[0], matcher) == ["api-design"]
+    assert extract_skill_references(paths[0]) == []  # legacy: backticked slugs only
@@ -0,0 +1,77 @@
+"""Tests for token estimation and budget-constrained selection."""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+import pytest
+
+import token_budget
+from route_skills import main as route_main
+from skill_sections import index_sections
+from token_budget import (
+    char_ratio_tokens,
+    estimate_skill_tokens,
+    get_tokenizer,
+    register_tokenizer,
+    select_within_budget,
+)
+
+
+def test_estimate_skill_tokens_covers_whole_file() -> None:
+    data = b"---\nslug: demo\n---\n\n## Purpose & When-To-Use\n\nUse it.\n\n## Resources\n\n- x\n"
+    sections = index_sections(data)
+    tokens = estimate_skill_tokens(data, sections, tokenizer=len)
+    assert tokens["front_matter"] == sections[0]["offset"]
+    assert tokens["total"] == len(data)
+    assert [s["tokens"] for s in sections] == [s["length"] for s in sections]
+
+
+def test_unavailable_tokenizer_falls_back_to_chars(monkeypatch: pytest.MonkeyPatch) -> None:
+    def broken() -> token_budget.Tokenizer:
+        msg = "no network"
+        raise OSError(msg)
+
+    # Register into a copy so the test tokenizer doesn't outlive this test
+    monkeypatch.setattr(
+        token_budget, "_TOKENIZER_FACTORIES", dict(token_budget._TOKENIZER_FACTORIES)
+    )
+    register_tokenizer("broken-for-test", broken)
+    assert "broken-for-test" in token_budget.available_tokenizers()
+    assert get_tokenizer("broken-for-test") is char_ratio_tokens
+    with pytest.raises(ValueError, match="Unknown tokenizer"):
+        get_tokenizer("does-not-exist")
+
+
+def test_select_within_budget_matches_brute_force() -> None:
+    rng = random.Random(7)  # noqa: S311
+    for _ in range(50):
+        items = [(f"s{i}", rng.random(), rng.randint(50, 4000)) for i in range(8)]
+        budget = rng.randint(500, token_budget.MAX_DP_COLUMNS)  # exact, unscaled DP
+        chosen = select_within_budget(items, budget)
+
+        weights = {k: w for k, _, w in items}
+        values = {k: v for k, v, _ in items}
+        assert sum(weights[k] for k in chosen) <= budget
+
+        best = 0.0
+        for r in range(len(items) + 1):
+            for combo in itertools.combinations(items, r):
+                if sum(w for _, _, w in combo) <= budget:
+                    best = max(best, sum(v for _, v, _ in combo))
+        assert sum(values[k] for k in chosen) == pytest.approx(best)
+
+
+def test_select_within_budget_scales_large_budgets() -> None:
+    items = [("a", 1.0, 60_000), ("b", 0.9, 50_000), ("c", 0.8, 50_000)]
+    # Weights are rounded up to stay within budget even when scaled
+    assert select_within_budget(items, 100_000) == ["b", "c"]
+    assert select_within_budget(items, 0) == []
+
+
+def test_budget_is_rejected_for_the_fts_backend(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as exc:
+        route_main(["--backend", "fts", "--budget", "2000", "validate kubernetes"])
+    assert exc.value.code == 2
+    assert "--budget needs the embeddings backend" in capsys.readouterr().err
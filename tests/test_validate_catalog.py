@@ -0,0 +1,72 @@
+"""Tests for JSON Schema validation of catalog metadata."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from validate_catalog import (
+    CATALOG_KINDS,
+    collect_targets,
+    get_validator,
+    iter_catalog_results,
+    validate_data,
+    validate_file,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+ENTRY = {
+    "slug": "demo-skill",
+    "name": "Demo",
+    "summary": "Does a demo.",
+    "keywords": ["demo"],
+    "owner": "me",
+    "version": "1.0.0",
+    "entry": "skills/demo-skill/SKILL.md",
+}
+
+
+def test_real_catalog_matches_schemas() -> None:
+    targets = collect_targets(REPO_ROOT)
+    assert {kind for _, kind in targets} == set(CATALOG_KINDS)
+    failures = [(p, issues) for p, issues in iter_catalog_results(targets) if issues]
+    assert failures == []
+
+
+def test_validators_are_compiled_once() -> None:
+    assert get_validator("evals") is get_validator("evals")
+
+
+def test_index_entry_errors(tmp_path: Path) -> None:
+    path = tmp_path / "index-entry.json"
+    assert validate_data(ENTRY, "index-entry", path) == []
+
+    broken = {**ENTRY, "slug": "Demo Skill", "token_budget": "T7", "keywords": []}
+    del broken["owner"]
+    messages = [i.message for i in validate_data(broken, "index-entry", path)]
+    assert messages == [
+        "<root>: 'owner' is a required property",
+        "keywords: [] should be non-empty",
+        "slug: 'Demo Skill' does not match '^[a-z0-9]+(-[a-z0-9]+)*$'",
+        "token_budget: 'T7' does not match '^T[1-3]$'",
+    ]
+
+
+def test_eval_files_and_parse_errors(tmp_path: Path) -> None:
+    good = tmp_path / "evals_demo.yaml"
+    good.write_text("skill: demo\nscenarios:\n  - name: one\n    tier: T1\n", encoding="utf-8")
+    assert validate_file(good, "evals") == []
+
+    bad = tmp_path / "evals_bad.yaml"
+    bad.write_text("scenarios:\n  - tier: 4\n", encoding="utf-8")
+    assert validate_file(bad, "evals")[0].message.startswith("scenarios/0")
+
+    unparsable = tmp_path / "evals_broken.yaml"
+    unparsable.write_text("scenarios: [\n", encoding="utf-8")
+    assert validate_file(unparsable, "evals")[0].message.startswith("Parse error:")
+
+    entry = tmp_path / "index-entry.json"
+    entry.write_text(json.dumps(ENTRY), encoding="utf-8")
+    targets = [(good, "evals"), (bad, "evals"), (entry, "index-entry")]
+    assert list(iter_catalog_results(targets, jobs=2)) == list(iter_catalog_results(targets))
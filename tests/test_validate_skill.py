@@ -0,0 +1,74 @@
+"""Tests for validate_skill.py."""
+
+from __future__ import annotations
+
+import shutil
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from validate_skill import iter_validation_results, validate_skill_file
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+REAL_SKILLS = sorted((REPO_ROOT / "skills").glob("*/SKILL.md"))
+
+
+@pytest.fixture
+def mixed_skills(tmp_path: Path) -> list[Path]:
+    """A few real skills plus one with broken front matter and one missing sections."""
+    paths = []
+    for src in REAL_SKILLS[:4]:
+        dst = tmp_path / src.parent.name / "SKILL.md"
+        dst.parent.mkdir()
+        shutil.copy(src, dst)
+        paths.append(dst)
+    broken = tmp_path / "broken" / "SKILL.md"
+    broken.parent.mkdir()
+    broken.write_text("no front matter\n")
+    bare = tmp_path / "bare" / "SKILL.md"
+    bare.parent.mkdir()
+    bare.write_text("---\nname: Bare\n---\n\n## Purpose & When-To-Use\n")
+    return sorted([*paths, broken, bare])
+
+
+def test_real_catalog_is_valid() -> None:
+    assert REAL_SKILLS
+    for path in REAL_SKILLS:
+        assert validate_skill_file(path) == [], path
+
+
+def test_parallel_results_match_serial_order(mixed_skills: list[Path]) -> None:
+    serial = list(iter_validation_results(mixed_skills, jobs=1))
+    parallel = list(iter_validation_results(mixed_skills, jobs=3))
+    assert [p for p, _ in parallel] == mixed_skills
+    assert parallel == serial
+    assert any(issues for _, issues in serial)
+
+
+def test_streaming_matches_in_memory(mixed_skills: list[Path]) -> None:
+    for path in mixed_skills:
+        assert validate_skill_file(path, stream=True) == validate_skill_file(path, stream=False)
+
+
+def test_streaming_memory_is_bounded(tmp_path: Path) -> None:
+    src = REAL_SKILLS[0].read_text(encoding="utf-8")
+    head, body = src.split("\n## ", 1)
+    filler = "".join(f"line {i} of generated T1 filler text\n" for i in range(100_000))
+    big = tmp_path / "big" / "SKILL.md"
+    big.parent.mkdir()
+    big.write_text(f"{head}\n{filler}password: hunter22\n## {body}", encoding="utf-8")
+    size = big.stat().st_size
+    assert size > 3_000_000
+
+    tracemalloc.start()
+    streamed = validate_skill_file(big, stream=True)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert streamed == validate_skill_file(big, stream=False)
+    secret_line = head.count("\n") + 2 + 100_000
+    assert [i.message for i in streamed] == [
+        rf"Potential secret matched pattern: (?i)password\s*[:=]\s*[^\s]{{6,}} (line {secret_line}, col 1)"
+    ]
+    assert peak < size // 10
@@ -6,32 +6,55 @@ Extracts skill references from agents and visualizes relationships
 
 from __future__ import annotations
 
+import argparse
 import json
+import os
 import re
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
+from build_index import load_skill_dependencies
+from dependency_graph import build_graph, default_graph_path
+from graph_export import domain_of, export_graph
+from skill_document import AgentDocument, load_document
+from slug_matcher import SlugMatcher, scan_agents
 
-def load_agents_index() -> list[dict[str, Any]]:
+# Above this many agent→skill edges the Mermaid diagram collapses to domains
+MERMAID_MAX_EDGES = 300
+
+EXPORT_SUFFIXES = {".dot": "dot", ".gv": "dot", ".json": "json", ".graphml": "graphml"}
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def load_agents_index(root: Path | None = None) -> list[dict[str, Any]]:
     """Load agents index"""
-    index_path = Path(__file__).parent.parent / "index" / "agents-index.json"
+    index_path = (root or REPO_ROOT) / "index" / "agents-index.json"
     with open(index_path) as f:
         result: list[dict[str, Any]] = json.load(f)
         return result
 
 
-def load_skills_index() -> list[dict[str, Any]]:
+def load_skills_index(root: Path | None = None) -> list[dict[str, Any]]:
     """Load skills index"""
-    index_path = Path(__file__).parent.parent / "index" / "skills-index.json"
+    index_path = (root or REPO_ROOT) / "index" / "skills-index.json"
     with open(index_path) as f:
         result: list[dict[str, Any]] = json.load(f)
         return result
 
 
-def extract_skill_references(agent_md_path: Path) -> list[str]:
-    """Extract skill slug references from agent AGENT.md"""
-    content = agent_md_path.read_text()
+def extract_skill_references(agent_md_path: Path, matcher: SlugMatcher | None = None) -> list[str]:
+    """
+    Extract skill slug references from agent AGENT.md
+
+    With a matcher, every mention of a known skill slug counts (bare or
+    backticked); without one, any backticked hyphenated slug is returned.
+    """
+    doc = load_document(agent_md_path, AgentDocument)
+    if matcher is not None:
+        return list(matcher.references(doc.text, exclude=doc.slug).skills)
+    content = doc.text
 
     # Pattern 1: Backtick-enclosed slugs (e.g., `skill-slug`)
     backtick_pattern = r"`([a-z0-9-]+)`"
@@ -49,31 +72,32 @@ def extract_skill_references(agent_md_path: Path) -> list[str]:
     return sorted(skills)
 
 
-def build_dependency_graph() -> tuple[dict[str, dict[str, Any]], dict[str, list[str]]]:
-    """Build agent→skill dependency graph"""
-    agents = load_agents_index()
-    skills_set = {s["slug"] for s in load_skills_index()}
+def build_dependency_graph(
+    jobs: int = 1, skills_set: set[str] | None = None, root: Path | None = None
+) -> tuple[dict[str, dict[str, Any]], dict[str, list[str]]]:
+    """Build agent→skill dependency graph (agents scanned across `jobs` processes)"""
+    agents = load_agents_index(root)
+    if skills_set is None:
+        skills_set = {s["slug"] for s in load_skills_index(root)}
 
     dependencies: dict[str, dict[str, Any]] = {}
     skill_usage: dict[str, list[str]] = defaultdict(list)  # skill → list of agents using it
 
-    repo_root = Path(__file__).parent.parent
-
-    for agent in agents:
-        agent_slug = agent["slug"]
-        # entry is a relative path from repo root
-        agent_path = repo_root / agent["entry"]
+    repo_root = root or REPO_ROOT
 
-        # Extract skill references
-        referenced_skills = extract_skill_references(agent_path)
+    # entry is a relative path from repo root
+    agent_paths = [repo_root / agent["entry"] for agent in agents]
+    references = scan_agents(agent_paths, skills_set, (a["slug"] for a in agents), jobs)
 
-        # Filter to only actual skills (not agent slugs or other references)
-        valid_skills = [s for s in referenced_skills if s in skills_set]
+    for agent, refs in zip(agents, references, strict=True):
+        agent_slug = agent["slug"]
+        valid_skills = list(refs.skills)
 
         dependencies[agent_slug] = {
             "name": agent["name"],
             "skills": valid_skills,
             "skill_count": len(valid_skills),
+            "agents": [a for a in refs.agents if a != agent_slug],
         }
 
         # Track reverse mapping
@@ -83,8 +107,13 @@ def build_dependency_graph() -> tuple[dict[str, dict[str, Any]], dict[str, list[
     return dependencies, skill_usage
 
 
-def generate_mermaid_diagram(dependencies: dict[str, dict[str, Any]]) -> str:
+def generate_mermaid_diagram(
+    dependencies: dict[str, dict[str, Any]], max_edges: int = MERMAID_MAX_EDGES
+) -> str:
     """Generate Mermaid flowchart for agent→skill dependencies"""
+    if sum(d["skill_count"] for d in dependencies.values()) > max_edges:
+        return generate_mermaid_summary(dependencies)
+
     lines = ["```mermaid", "graph LR"]
 
     # Style definitions
@@ -121,8 +150,35 @@ def generate_mermaid_diagram(dependencies: dict[str, dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
+def generate_mermaid_summary(dependencies: dict[str, dict[str, Any]]) -> str:
+    """Domain-level Mermaid flowchart: agent domain → skill domain, labelled with edge counts"""
+    edges: dict[tuple[str, str], int] = defaultdict(int)
+    for agent_slug, data in dependencies.items():
+        for skill_slug in data["skills"]:
+            edges[(domain_of(agent_slug), domain_of(skill_slug))] += 1
+
+    lines = ["```mermaid", "graph LR"]
+    lines.append("  classDef agent fill:#e1f5ff,stroke:#01579b,stroke-width:2px")
+    lines.append("  classDef skill fill:#fff3e0,stroke:#e65100,stroke-width:1px")
+    lines.append("")
+    for domain in sorted({a for a, _ in edges}):
+        lines.append(f"  agents_{domain.replace('-', '_')}[{domain} agents]:::agent")
+    for domain in sorted({s for _, s in edges}):
+        lines.append(f"  skills_{domain.replace('-', '_')}[{domain} skills]:::skill")
+    lines.append("")
+    for (agent_domain, skill_domain), count in sorted(edges.items()):
+        lines.append(
+            f"  agents_{agent_domain.replace('-', '_')} -->|{count}|"
+            f" skills_{skill_domain.replace('-', '_')}"
+        )
+    lines.append("```")
+    return "\n".join(lines)
+
+
 def generate_markdown_report(
-    dependencies: dict[str, dict[str, Any]], skill_usage: dict[str, list[str]]
+    dependencies: dict[str, dict[str, Any]],
+    skill_usage: dict[str, list[str]],
+    all_skills: set[str] | None = None,
 ) -> str:
     """Generate markdown dependency report"""
     md = ["# Agent→Skill Dependency Graph", ""]
@@ -176,7 +232,8 @@ def generate_markdown_report(
     md.append("")
 
     # Orphaned skills (not referenced by any agent)
-    all_skills = {s["slug"] for s in load_skills_index()}
+    if all_skills is None:
+        all_skills = {s["slug"] for s in load_skills_index()}
     orphaned_skills = all_skills - skill_usage.keys()
 
     md.append(f"### Orphaned Skills ({len(orphaned_skills)})")
@@ -219,30 +276,70 @@ def generate_markdown_report(
     return "\n".join(md)
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Analyze agent→skill dependencies")
+    ap.add_argument(
+        "--root",
+        type=Path,
+        default=Path("."),
+        help="Repo root to analyze; reports go to <root>/docs (default: .)",
+    )
+    ap.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Scan agents across N processes (0 = one per CPU; default: 1)",
+    )
+    ap.add_argument(
+        "--export",
+        type=Path,
+        action="append",
+        default=[],
+        help=f"Also export the graph; format from suffix ({', '.join(sorted(EXPORT_SUFFIXES))})",
+    )
+    args = ap.parse_args(argv)
+    for export_path in args.export:
+        if export_path.suffix not in EXPORT_SUFFIXES:
+            ap.error(f"--export: unsupported suffix {export_path.suffix!r} for {export_path}")
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
     print("Analyzing agent→skill dependencies...")
 
-    dependencies, skill_usage = build_dependency_graph()
+    root: Path = args.root
+    all_skills = {s["slug"] for s in load_skills_index(root)}
+    dependencies, skill_usage = build_dependency_graph(jobs, all_skills, root)
 
     print(f"Found {len(dependencies)} agents")
     print(f"Found {len(skill_usage)} unique skill references")
 
     # Generate report
-    report = generate_markdown_report(dependencies, skill_usage)
+    report = generate_markdown_report(dependencies, skill_usage, all_skills)
 
-    output_path = Path(__file__).parent.parent / "docs" / "AGENT_DEPENDENCIES.md"
+    output_path = root / "docs" / "AGENT_DEPENDENCIES.md"
     output_path.parent.mkdir(exist_ok=True)
     output_path.write_text(report)
 
     print(f"Dependency graph written to: {output_path}")
 
+    # Persist the graph so impact queries (dependency_graph.py) need no re-run
+    graph = build_graph(dependencies, load_skill_dependencies(root / "skills"), all_skills)
+    graph_path = default_graph_path(root)
+    graph.save(graph_path)
+    print(f"Graph data written to: {graph_path}")
+
+    for export_path in args.export:
+        fmt = EXPORT_SUFFIXES[export_path.suffix]
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+        with export_path.open("w", encoding="utf-8", newline="\n") as out:
+            summary = export_graph(graph, fmt, out)
+        print(f"Graph exported to: {export_path} ({'summary' if summary else 'full'} view)")
+
     # Quick summary
     print("\nQuick Summary:")
     print(f"  Total agents: {len(dependencies)}")
     print(f"  Skills referenced: {len(skill_usage)}")
-    print(
-        f"  Orphaned skills: {len({s['slug'] for s in load_skills_index()} - skill_usage.keys())}"
-    )
+    print(f"  Orphaned skills: {len(all_skills - skill_usage.keys())}")
 
 
 if __name__ == "__main__":
@@ -6,15 +6,20 @@ Generates domain coverage visualization and gap analysis
 
 from __future__ import annotations
 
+import argparse
 import json
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
+from query_log import QueryLogStats, analyze_query_log, generate_demand_report
 
-def load_skills_index() -> list[dict[str, Any]]:
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def load_skills_index(root: Path | None = None) -> list[dict[str, Any]]:
     """Load and parse skills index"""
-    index_path = Path(__file__).parent.parent / "index" / "skills-index.json"
+    index_path = (root or REPO_ROOT) / "index" / "skills-index.json"
     with open(index_path) as f:
         result: list[dict[str, Any]] = json.load(f)
         return result
@@ -74,11 +79,72 @@ def analyze_coverage(
     return by_tier, by_domain, domain_tier_map
 
 
+def static_gap_analysis(by_tier: dict[str, list[str]]) -> list[str]:
+    """Hand-maintained gap analysis, used when no query log is given"""
+    md: list[str] = []
+    md.append("## Gap Analysis")
+    md.append("")
+
+    md.append("### Identified Coverage Gaps")
+    md.append("")
+    md.append("**Cloud Providers:**")
+    md.append("- ✅ AWS: `cloud-aws-architect` (comprehensive)")
+    md.append("- ⚠️ Azure: No dedicated architect skill")
+    md.append("- ⚠️ GCP: No dedicated architect skill")
+    md.append("")
+
+    md.append("**Language-Specific Tooling:**")
+    tooling_langs = set()
+    for slug in by_tier.get("Specialized", []):
+        if "rust" in slug or "go" in slug or "python" in slug:
+            tooling_langs.add(slug.split("-")[0])
+
+    md.append(
+        f"- ✅ Existing: {', '.join(sorted(tooling_langs)) if tooling_langs else 'Python, Go, Rust'}"
+    )
+    md.append("- ⚠️ Missing: Java, TypeScript/JavaScript, C#, C++")
+    md.append("")
+
+    md.append("**Testing:**")
+    testing_count = sum(1 for slug in by_tier.get("Domain", []) if slug.startswith("testing-"))
+    md.append(f"- ✅ Core testing skills: {testing_count}")
+    md.append("- ⚠️ Missing: Performance profiling, mutation testing, visual regression")
+    md.append("")
+
+    md.append("**Observability:**")
+    obs_count = sum(1 for slug in by_tier.get("Domain", []) if slug.startswith("observability-"))
+    md.append(f"- ✅ Observability skills: {obs_count}")
+    md.append("- ⚠️ Missing: APM-specific (Datadog, New Relic), cost attribution")
+    md.append("")
+
+    md.append("### Recommendations")
+    md.append("")
+    md.append("**High Priority:**")
+    md.append("1. Add Azure/GCP cloud architect skills (parity with AWS)")
+    md.append("2. Add Java and TypeScript tooling specialists")
+    md.append("3. Create testing orchestrator agent (coordinates test strategy execution)")
+    md.append("")
+
+    md.append("**Medium Priority:**")
+    md.append("4. Performance profiling skill (language-agnostic)")
+    md.append("5. APM integration skill (Datadog, New Relic, etc.)")
+    md.append("6. Visual regression testing skill")
+    md.append("")
+
+    md.append("**Low Priority:**")
+    md.append("7. C#/.NET tooling specialist")
+    md.append("8. C++ build system specialist (CMake, Bazel)")
+    md.append("9. Mutation testing designer")
+    md.append("")
+    return md
+
+
 def generate_markdown_report(
     by_tier: dict[str, list[str]],
     by_domain: dict[str, int],
     domain_tier_map: dict[str, dict[str, list[str]]],
     total_skills: int,
+    demand: QueryLogStats | None = None,
 ) -> str:
     """Generate markdown coverage report"""
     md = ["# Skill Coverage Matrix Analysis", ""]
@@ -144,61 +210,11 @@ def generate_markdown_report(
                     md.append(f"  - `{skill}`")
                 md.append("")
 
-    # Gap analysis
-    md.append("## Gap Analysis")
-    md.append("")
-
-    md.append("### Identified Coverage Gaps")
-    md.append("")
-    md.append("**Cloud Providers:**")
-    md.append("- ✅ AWS: `cloud-aws-architect` (comprehensive)")
-    md.append("- ⚠️ Azure: No dedicated architect skill")
-    md.append("- ⚠️ GCP: No dedicated architect skill")
-    md.append("")
-
-    md.append("**Language-Specific Tooling:**")
-    tooling_langs = set()
-    for slug in by_tier.get("Specialized", []):
-        if "rust" in slug or "go" in slug or "python" in slug:
-            tooling_langs.add(slug.split("-")[0])
-
-    md.append(
-        f"- ✅ Existing: {', '.join(sorted(tooling_langs)) if tooling_langs else 'Python, Go, Rust'}"
-    )
-    md.append("- ⚠️ Missing: Java, TypeScript/JavaScript, C#, C++")
-    md.append("")
-
-    md.append("**Testing:**")
-    testing_count = sum(1 for slug in by_tier.get("Domain", []) if slug.startswith("testing-"))
-    md.append(f"- ✅ Core testing skills: {testing_count}")
-    md.append("- ⚠️ Missing: Performance profiling, mutation testing, visual regression")
-    md.append("")
-
-    md.append("**Observability:**")
-    obs_count = sum(1 for slug in by_tier.get("Domain", []) if slug.startswith("observability-"))
-    md.append(f"- ✅ Observability skills: {obs_count}")
-    md.append("- ⚠️ Missing: APM-specific (Datadog, New Relic), cost attribution")
-    md.append("")
-
-    md.append("### Recommendations")
-    md.append("")
-    md.append("**High Priority:**")
-    md.append("1. Add Azure/GCP cloud architect skills (parity with AWS)")
-    md.append("2. Add Java and TypeScript tooling specialists")
-    md.append("3. Create testing orchestrator agent (coordinates test strategy execution)")
-    md.append("")
-
-    md.append("**Medium Priority:**")
-    md.append("4. Performance profiling skill (language-agnostic)")
-    md.append("5. APM integration skill (Datadog, New Relic, etc.)")
-    md.append("6. Visual regression testing skill")
-    md.append("")
-
-    md.append("**Low Priority:**")
-    md.append("7. C#/.NET tooling specialist")
-    md.append("8. C++ build system specialist (CMake, Bazel)")
-    md.append("9. Mutation testing designer")
-    md.append("")
+    # Gap analysis: measured from the routing query log when one is given
+    if demand is not None:
+        md.extend(generate_demand_report(demand))
+    else:
+        md.extend(static_gap_analysis(by_tier))
 
     # Domain heat map
     md.append("## Domain Coverage Heat Map")
@@ -220,15 +236,81 @@ def generate_markdown_report(
     return "\n".join(md)
 
 
-def main() -> None:
-    skills = load_skills_index()
+def run_semantic(
+    embeddings_dir: Path | None, clusters: int | None, seed: int, root: Path = REPO_ROOT
+) -> None:
+    """Cluster the routing embeddings and write docs/SEMANTIC_COVERAGE.md"""
+    # numpy/scikit-learn are only needed for this mode
+    from semantic_coverage import (
+        analyze_semantic_coverage,
+        generate_semantic_report,
+        load_embeddings,
+    )
+
+    slugs, vectors, terms = load_embeddings(embeddings_dir or root / "index" / "embeddings")
+    coverage = analyze_semantic_coverage(slugs, vectors, terms, k=clusters, seed=seed)
+    report = generate_semantic_report(coverage, len(slugs))
+
+    output_path = root / "docs" / "SEMANTIC_COVERAGE.md"
+    output_path.parent.mkdir(exist_ok=True)
+    output_path.write_text(report)
+
+    print(f"Semantic coverage written to: {output_path}")
+    print("\nQuick Summary:")
+    print(f"  Skills: {len(slugs)}")
+    print(f"  Clusters: {len(coverage.clusters)}")
+    print(f"  Sparse regions: {sum(1 for c in coverage.clusters if c.sparse)}")
+    print("\nLargest Clusters:")
+    for cluster in coverage.clusters[:5]:
+        print(f"  {', '.join(cluster.terms[:3])}: {cluster.size}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Analyze skill coverage")
+    ap.add_argument(
+        "--root",
+        type=Path,
+        default=Path("."),
+        help="Repo root to analyze; reports go to <root>/docs (default: .)",
+    )
+    ap.add_argument(
+        "--semantic",
+        action="store_true",
+        help="Cluster the routing embeddings instead of grouping by slug prefix",
+    )
+    ap.add_argument(
+        "--embeddings-dir",
+        type=Path,
+        default=None,
+        help="build_embeddings.py output (default: <root>/index/embeddings)",
+    )
+    ap.add_argument(
+        "--clusters", type=int, default=None, help="Number of clusters (default: sqrt(n/2))"
+    )
+    ap.add_argument("--seed", type=int, default=0, help="Clustering random seed (default: 0)")
+    ap.add_argument(
+        "--query-log",
+        type=Path,
+        action="append",
+        default=[],
+        help="Routing query log (route_skills.py --query-log); rotated backups are read too."
+        " Replaces the hand-written gap analysis with measured demand (repeatable)",
+    )
+    args = ap.parse_args(argv)
+
+    if args.semantic:
+        run_semantic(args.embeddings_dir, args.clusters, args.seed, args.root)
+        return
+
+    skills = load_skills_index(args.root)
     total = len(skills)
 
     by_tier, by_domain, domain_tier_map = analyze_coverage(skills)
 
-    report = generate_markdown_report(by_tier, by_domain, domain_tier_map, total)
+    demand = analyze_query_log(args.query_log) if args.query_log else None
+    report = generate_markdown_report(by_tier, by_domain, domain_tier_map, total, demand)
 
-    output_path = Path(__file__).parent.parent / "docs" / "COVERAGE_MATRIX.md"
+    output_path = args.root / "docs" / "COVERAGE_MATRIX.md"
     output_path.parent.mkdir(exist_ok=True)
     output_path.write_text(report)
 
@@ -241,6 +323,8 @@ def main() -> None:
     print("\nTop 5 Domains:")
     for domain in sorted(by_domain.keys(), key=lambda d: by_domain[d], reverse=True)[:5]:
         print(f"  {domain}: {by_domain[domain]}")
+    if demand is not None:
+        print(f"\nLogged queries: {demand.total} ({demand.low_confidence} low-confidence)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate skill detection
+Finds skill pairs whose TF-IDF routing vectors (build_embeddings.py) have a
+cosine similarity above a threshold and groups them into clusters. Small
+catalogs use an exact sparse self-product, computed one row block at a time;
+large ones generate candidates with random-hyperplane LSH and verify only
+those, so no dense n x n matrix is ever built. The LSH band shape follows the
+threshold; thresholds too low for LSH to find pairs reliably stay exact
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np  # type: ignore[import-untyped,unused-ignore]
+
+from semantic_coverage import load_embeddings
+
+DEFAULT_THRESHOLD = 0.5
+BLOCK_SIZE = 2048
+# Caps a block's product at about this many cells, so memory stays flat as n grows
+BLOCK_CELLS = 1 << 24
+# Above this many skills, candidate pairs come from LSH instead of the exact product
+LSH_MIN_SKILLS = 20_000
+# Pairs exactly at the threshold become LSH candidates with at least this probability
+LSH_RECALL = 0.95
+# Signature size cap; the random planes alone take vocabulary x bits float32s
+LSH_MAX_BITS = 2048
+# Unrelated (orthogonal) pairs may become candidates with at most this probability
+LSH_MAX_NOISE = 0.01
+# Band widths LSH can hash, as the integer type a band of signature bytes is viewed as
+BAND_DTYPES = {8: np.uint8, 16: np.uint16, 32: np.uint32, 64: np.uint64}
+# LSH buckets holding more skills than this are shared boilerplate, not duplicates
+MAX_BUCKET = 500
+
+
+@dataclass
+class DuplicateCluster:
+    members: list[str]
+    pairs: list[tuple[str, str, float]]  # highest similarity first
+
+    @property
+    def max_score(self) -> float:
+        return self.pairs[0][2] if self.pairs else 0.0
+
+
+def exact_pairs(
+    vectors: Any, threshold: float, block_size: int = BLOCK_SIZE
+) -> tuple[Any, Any, Any]:
+    """(rows, cols, scores) with row < col and cosine >= threshold, one row block at a time"""
+    n = vectors.shape[0]
+    block_size = max(1, min(block_size, BLOCK_CELLS // max(n, 1)))
+    transposed = vectors.T.tocsc()
+    rows, cols, scores = [], [], []
+    for start in range(0, n, block_size):
+        block = (vectors[start : start + block_size] @ transposed).tocoo()
+        keep = (block.data >= threshold) & (block.row + start < block.col)
+        rows.append(block.row[keep] + start)
+        cols.append(block.col[keep])
+        scores.append(block.data[keep])
+    if not rows:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0)
+    return np.concatenate(rows), np.concatenate(cols), np.concatenate(scores)
+
+
+def lsh_shape(threshold: float) -> tuple[int, int] | None:
+    """
+    (bands, bits per band) for LSH at `threshold`, or None when it cannot work
+
+    SimHash bits agree with probability p = 1 - arccos(cosine) / pi, so a pair
+    shares one r-bit band with probability p**r and at least one of b bands
+    with 1 - (1 - p**r)**b. The widest band whose b stays within LSH_MAX_BITS
+    while giving LSH_RECALL at the threshold and LSH_MAX_NOISE at cosine 0 is
+    chosen; low thresholds (about 0.8 and below) have none.
+    """
+    p = 1 - math.acos(min(max(threshold, -1.0), 1.0)) / math.pi
+    for band_bits in sorted(BAND_DTYPES, reverse=True):
+        hit = p**band_bits
+        bands = 1 if hit >= 1 else math.ceil(math.log(1 - LSH_RECALL) / math.log1p(-hit))
+        if bands * band_bits > LSH_MAX_BITS:
+            continue
+        if 1 - (1 - 0.5**band_bits) ** bands <= LSH_MAX_NOISE:
+            return bands, band_bits
+    return None
+
+
+def simhash_signatures(vectors: Any, bits: int, seed: int = 0) -> Any:
+    """
+    (n, bits / 8) packed sign-of-random-projection signatures
+
+    Two rows agree on each bit with probability 1 - angle / pi, so matching
+    bits track cosine similarity (Charikar's SimHash).
+    """
+    rng = np.random.default_rng(seed)
+    planes = rng.standard_normal((vectors.shape[1], bits)).astype(np.float32)
+    chunks = []
+    for start in range(0, vectors.shape[0], 8192):
+        projected = vectors[start : start + 8192] @ planes
+        chunks.append(np.packbits(projected > 0, axis=1))
+    return np.concatenate(chunks) if chunks else np.empty((0, bits // 8), dtype=np.uint8)
+
+
+def lsh_candidates(
+    signatures: Any, band_bits: int = 16, max_bucket: int = MAX_BUCKET
+) -> tuple[Any, Any]:
+    """(rows, cols) of distinct pairs that agree on every bit of at least one band"""
+    n = signatures.shape[0]
+    bands = np.ascontiguousarray(signatures).view(BAND_DTYPES[band_bits])
+    found_rows, found_cols = [], []
+    for band in bands.T:
+        order = np.argsort(band, kind="stable")
+        keys = band[order]
+        bucket = np.cumsum(np.r_[0, keys[1:] != keys[:-1]])
+        sizes = np.bincount(bucket)
+        usable = (sizes[bucket] > 1) & (sizes[bucket] <= max_bucket)
+        order, bucket = order[usable], bucket[usable]
+        # All pairs inside each bucket: compare every position with the one d further on
+        for d in range(1, int(sizes[bucket].max(initial=1))):
+            same = bucket[:-d] == bucket[d:]
+            found_rows.append(order[:-d][same])
+            found_cols.append(order[d:][same])
+    if not found_rows:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    left = np.concatenate(found_rows).astype(np.int64)
+    right = np.concatenate(found_cols).astype(np.int64)
+    # Order each pair and keep it once (it usually collides in several bands)
+    codes = np.unique(np.minimum(left, right) * n + np.maximum(left, right))
+    return codes // n, codes % n
+
+
+def row_cosines(vectors: Any, rows: Any, cols: Any, batch: int = 65_536) -> Any:
+    """Cosine of each (rows[i], cols[i]) pair of L2-normalized rows"""
+    out = np.empty(len(rows))
+    for start in range(0, len(rows), batch):
+        r, c = rows[start : start + batch], cols[start : start + batch]
+        out[start : start + batch] = np.asarray(vectors[r].multiply(vectors[c]).sum(axis=1)).ravel()
+    return out
+
+
+def lsh_pairs(vectors: Any, threshold: float, seed: int = 0) -> tuple[Any, Any, Any]:
+    """Like exact_pairs(), but only LSH candidates are scored (may miss borderline pairs)"""
+    shape = lsh_shape(threshold)
+    if shape is None:
+        msg = f"Threshold {threshold} is too low for LSH to find pairs reliably; use exact"
+        raise ValueError(msg)
+    bands, band_bits = shape
+    signatures = simhash_signatures(vectors, bands * band_bits, seed)
+    rows, cols = lsh_candidates(signatures, band_bits)
+    scores = row_cosines(vectors, rows, cols)
+    keep = scores >= threshold
+    return rows[keep], cols[keep], scores[keep]
+
+
+def cluster_pairs(slugs: list[str], rows: Any, cols: Any, scores: Any) -> list[DuplicateCluster]:
+    """Union-find over the similar pairs; clusters sorted by their best score"""
+    parent = list(range(len(slugs)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for r, c in zip(rows.tolist(), cols.tolist(), strict=True):
+        root_r, root_c = find(r), find(c)
+        if root_r != root_c:
+            parent[max(root_r, root_c)] = min(root_r, root_c)
+
+    groups: dict[int, list[tuple[str, str, float]]] = defaultdict(list)
+    members: dict[int, set[str]] = defaultdict(set)
+    for r, c, s in zip(rows.tolist(), cols.tolist(), scores.tolist(), strict=True):
+        root = find(r)
+        groups[root].append((slugs[r], slugs[c], round(s, 4)))
+        members[root].update((slugs[r], slugs[c]))
+
+    clusters = [
+        DuplicateCluster(
+            members=sorted(members[root]),
+            pairs=sorted(pairs, key=lambda p: (-p[2], p[0], p[1])),
+        )
+        for root, pairs in groups.items()
+    ]
+    return sorted(clusters, key=lambda c: (-c.max_score, c.members))
+
+
+def find_duplicates(
+    slugs: list[str],
+    vectors: Any,
+    threshold: float = DEFAULT_THRESHOLD,
+    method: str = "auto",
+    seed: int = 0,
+) -> list[DuplicateCluster]:
+    """
+    Duplicate clusters; method is "exact", "lsh" or "auto"
+
+    "auto" is exact below LSH_MIN_SKILLS and at thresholds lsh_shape() rejects.
+    """
+    if method == "auto":
+        large = len(slugs) >= LSH_MIN_SKILLS
+        method = "lsh" if large and lsh_shape(threshold) is not None else "exact"
+    if method == "exact":
+        rows, cols, scores = exact_pairs(vectors, threshold)
+    elif method == "lsh":
+        rows, cols, scores = lsh_pairs(vectors, threshold, seed=seed)
+    else:
+        msg = f"Unknown method: {method} (expected auto, exact or lsh)"
+        raise ValueError(msg)
+    return cluster_pairs(slugs, rows, cols, scores)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Find near-duplicate skills from routing embeddings")
+    ap.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Minimum cosine similarity (default: {DEFAULT_THRESHOLD})",
+    )
+    ap.add_argument("--method", choices=["auto", "exact", "lsh"], default="auto")
+    ap.add_argument(
+        "--embeddings-dir",
+        type=Path,
+        default=None,
+        help="build_embeddings.py output (default: index/embeddings)",
+    )
+    ap.add_argument("--json", action="store_true", help="Print clusters as JSON")
+    ap.add_argument(
+        "--fail-on-duplicates", action="store_true", help="Exit 1 when any cluster is found"
+    )
+    args = ap.parse_args()
+
+    try:
+        slugs, vectors, _ = load_embeddings(args.embeddings_dir)
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}. Run build_embeddings.py first.", file=sys.stderr)
+        return 2
+    try:
+        clusters = find_duplicates(slugs, vectors, args.threshold, args.method)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(
+            json.dumps(
+                [
+                    {
+                        "members": c.members,
+                        "pairs": [{"a": a, "b": b, "score": s} for a, b, s in c.pairs],
+                    }
+                    for c in clusters
+                ],
+                indent=2,
+            )
+        )
+    else:
+        print(f"{len(clusters)} duplicate cluster(s) at similarity >= {args.threshold}")
+        for c in clusters:
+            print(f"\n[{c.max_score:.3f}] {', '.join(c.members)}")
+            for a, b, s in c.pairs:
+                print(f"  {s:.3f}  {a} <-> {b}")
+
+    return 1 if clusters and args.fail_on_duplicates else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
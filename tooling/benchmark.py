@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness and baseline comparison
+measure() times a callable over repeated runs after warmup and summarizes
+them as median and interquartile range. Results are stored as JSON so a later
+run can be gated against a baseline: `compare` fails when a benchmark's median
+grew by more than a relative tolerance and by more than the runs' own spread.
+The benchmarks themselves live in tests/benchmarks/
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_REPEAT = 5
+DEFAULT_WARMUP = 1
+# A median more than this much slower than the baseline's is a regression
+DEFAULT_TOLERANCE = 0.25
+# Differences smaller than this are timer noise whatever their ratio
+DEFAULT_MIN_DELTA = 0.001
+
+
+@dataclass
+class Measurement:
+    name: str
+    median: float  # seconds
+    iqr: float
+    min: float
+    runs: int
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: Measurement | None
+    current: Measurement | None
+    status: str  # "ok", "regressed", "improved", "new" or "missing"
+
+    @property
+    def ratio(self) -> float | None:
+        if self.baseline is None or self.current is None or self.baseline.median <= 0:
+            return None
+        return self.current.median / self.baseline.median
+
+
+def summarize(name: str, times: list[float]) -> Measurement:
+    """Median, interquartile range and minimum of per-run times"""
+    if not times:
+        msg = f"No timings recorded for {name}"
+        raise ValueError(msg)
+    if len(times) > 1:
+        q1, _, q3 = statistics.quantiles(times, n=4, method="inclusive")
+    else:
+        q1 = q3 = times[0]
+    return Measurement(name, statistics.median(times), q3 - q1, min(times), len(times))
+
+
+def measure(
+    name: str,
+    fn: Callable[[], object],
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+    setup: Callable[[], object] | None = None,
+) -> Measurement:
+    """
+    Time `fn` over `repeat` runs after `warmup` untimed ones
+
+    `setup` runs untimed before every call, e.g. to drop caches a run must
+    not inherit from the previous one.
+    """
+    times: list[float] = []
+    for i in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            times.append(elapsed)
+    return summarize(name, times)
+
+
+def environment() -> dict[str, Any]:
+    """Where the numbers came from; baselines only compare well on similar machines"""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def write_results(path: Path, results: list[Measurement]) -> None:
+    data = {
+        "environment": environment(),
+        "results": {m.name: {k: v for k, v in asdict(m).items() if k != "name"} for m in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> dict[str, Measurement]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {name: Measurement(name=name, **fields) for name, fields in data["results"].items()}
+
+
+def compare(
+    current: dict[str, Measurement],
+    baseline: dict[str, Measurement],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_delta: float = DEFAULT_MIN_DELTA,
+) -> list[Comparison]:
+    """
+    One Comparison per benchmark in either run, in name order
+
+    A change counts only when it exceeds `tolerance` relative to the baseline
+    median and also the noise floor: min_delta seconds or the mean of the two
+    IQRs, whichever is larger.
+    """
+    comparisons = []
+    for name in sorted(current.keys() | baseline.keys()):
+        now, base = current.get(name), baseline.get(name)
+        if base is None:
+            status = "new"
+        elif now is None:
+            status = "missing"
+        elif abs(now.median - base.median) <= max(min_delta, (now.iqr + base.iqr) / 2):
+            status = "ok"
+        elif now.median > base.median * (1 + tolerance):
+            status = "regressed"
+        elif now.median * (1 + tolerance) < base.median:
+            status = "improved"
+        else:
+            status = "ok"
+        comparisons.append(Comparison(name, base, now, status))
+    return comparisons
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds * 1e6:.0f} us"
+
+
+def format_measurement(m: Measurement) -> str:
+    return f"{format_seconds(m.median)} (IQR {format_seconds(m.iqr)})"
+
+
+def print_comparisons(comparisons: list[Comparison]) -> None:
+    width = max((len(c.name) for c in comparisons), default=len("benchmark"))
+    print(f"{'benchmark':<{width}}  {'baseline':>24}  {'current':>24}  {'ratio':>6}  status")
+    for c in comparisons:
+        base = format_measurement(c.baseline) if c.baseline else "-"
+        now = format_measurement(c.current) if c.current else "-"
+        ratio = f"{c.ratio:.2f}x" if c.ratio is not None else ""
+        print(f"{c.name:<{width}}  {base:>24}  {now:>24}  {ratio:>6}  {c.status}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Compare benchmark results against a baseline")
+    sub = ap.add_subparsers(dest="command", required=True)
+    cmp = sub.add_parser("compare", help="Fail when any benchmark regressed beyond the tolerance")
+    cmp.add_argument("current", type=Path, help="Results JSON of the run to check")
+    cmp.add_argument("baseline", type=Path, help="Baseline results JSON")
+    cmp.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Allowed relative slowdown of the median (default: {DEFAULT_TOLERANCE})",
+    )
+    cmp.add_argument(
+        "--min-delta",
+        type=float,
+        default=DEFAULT_MIN_DELTA,
+        help=f"Ignore differences below this many seconds (default: {DEFAULT_MIN_DELTA})",
+    )
+    cmp.add_argument(
+        "--fail-on-missing",
+        action="store_true",
+        help="Also fail when a baseline benchmark did not run",
+    )
+    args = ap.parse_args(argv)
+
+    try:
+        current, baseline = load_results(args.current), load_results(args.baseline)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"ERROR: cannot read results: {e}", file=sys.stderr)
+        return 2
+    comparisons = compare(current, baseline, args.tolerance, args.min_delta)
+    print_comparisons(comparisons)
+
+    failing = {"regressed", "missing"} if args.fail_on_missing else {"regressed"}
+    failed = [c for c in comparisons if c.status in failing]
+    if failed:
+        print(
+            f"\n{len(failed)} benchmark(s) {' or '.join(sorted(failing))}"
+            f" beyond {args.tolerance:.0%} of the baseline",
+            file=sys.stderr,
+        )
+        return 1
+    print(f"\nNo regressions beyond {args.tolerance:.0%} of the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,17 +6,20 @@ Uses TF-IDF vectorization for simplicity (no external ML dependencies)
 
 from __future__ import annotations
 
+import argparse
 import json
 import pickle
 from pathlib import Path
 from typing import Any
 
-from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore[import-untyped]
+from profiling import add_profiling_args, profiled, span
 
+REPO_ROOT = Path(__file__).parent.parent
 
-def load_skills_index() -> list[dict[str, Any]]:
+
+def load_skills_index(root: Path | None = None) -> list[dict[str, Any]]:
     """Load skills index"""
-    index_path = Path(__file__).parent.parent / "index" / "skills-index.json"
+    index_path = (root or REPO_ROOT) / "index" / "skills-index.json"
     with open(index_path) as f:
         result: list[dict[str, Any]] = json.load(f)
         return result
@@ -51,6 +54,8 @@ def build_skill_documents(skills: list[dict[str, Any]]) -> tuple[list[str], list
 
 def build_embeddings(skills: list[dict[str, Any]]) -> dict[str, Any]:
     """Build TF-IDF embeddings for all skills"""
+    from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore[import-untyped]
+
     slugs, documents = build_skill_documents(skills)
 
     # Create TF-IDF vectorizer
@@ -65,7 +70,8 @@ def build_embeddings(skills: list[dict[str, Any]]) -> dict[str, Any]:
     )
 
     # Fit and transform
-    tfidf_matrix = vectorizer.fit_transform(documents)
+    with span("vectorize", documents=len(documents)):
+        tfidf_matrix = vectorizer.fit_transform(documents)
 
     return {
         "slugs": slugs,
@@ -101,17 +107,32 @@ def save_embeddings(embeddings: dict[str, Any], output_dir: Path | str) -> None:
         json.dump(embeddings["metadata"], f, indent=2)
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Build TF-IDF routing embeddings")
+    ap.add_argument(
+        "--root",
+        type=Path,
+        default=Path("."),
+        help="Repo root; reads and writes <root>/index (default: .)",
+    )
+    add_profiling_args(ap)
+    args = ap.parse_args(argv)
+    with profiled(args):
+        run(args)
+
+
+def run(args: argparse.Namespace) -> None:
     print("Building skill embeddings...")
 
-    skills = load_skills_index()
+    skills = load_skills_index(args.root)
     print(f"Loaded {len(skills)} skills")
 
     embeddings = build_embeddings(skills)
     print(f"Built embeddings: {embeddings['metadata']}")
 
-    output_dir = Path(__file__).parent.parent / "index" / "embeddings"
-    save_embeddings(embeddings, output_dir)
+    output_dir = args.root / "index" / "embeddings"
+    with span("write"):
+        save_embeddings(embeddings, output_dir)
 
     print(f"Saved embeddings to: {output_dir}")
     print(f"  - vectorizer.pkl ({output_dir / 'vectorizer.pkl'})")
@@ -3,18 +3,16 @@ from __future__ import annotations
 
 import argparse
 import json
-import re
 import subprocess
 import sys
 from pathlib import Path
 from typing import Any
 
-try:
-    import yaml  # type: ignore[import-untyped,unused-ignore]
-except Exception:  # pragma: no cover
-    yaml = None  # type: ignore[assignment]
-
-FRONT_MATTER_DELIM = re.compile(r"^---\s*$")
+import catalog_db
+from profiling import add_profiling_args, profiled, span
+from skill_document import MarkdownDocument, load_document
+from token_budget import Tokenizer, available_tokenizers, estimate_skill_tokens, get_tokenizer
+from validate_catalog import collect_targets, iter_catalog_results, validate_data
 
 META_FIELDS = [
     "slug",
@@ -31,31 +29,69 @@ def read_text(p: Path) -> str:
 
 
 def extract_front_matter(md_text: str) -> dict[str, Any]:
-    lines = md_text.splitlines()
-    if not lines or not FRONT_MATTER_DELIM.match(lines[0]):
-        msg = "Missing starting '---' for front matter"
-        raise ValueError(msg)
-    end_idx = None
-    for i in range(1, len(lines)):
-        if FRONT_MATTER_DELIM.match(lines[i]):
-            end_idx = i
-            break
-    if end_idx is None:
-        msg = "Missing closing '---' for front matter"
-        raise ValueError(msg)
-
-    fm_text = "\n".join(lines[1:end_idx])
-    if yaml is None:
-        msg = "PyYAML not installed. Please add 'pyyaml'."
-        raise RuntimeError(msg)
-    meta = yaml.safe_load(fm_text) or {}
-    if not isinstance(meta, dict):
-        msg = "Front matter must be a YAML mapping"
-        raise ValueError(msg)
-    return meta
-
-
-def main() -> int:
+    return MarkdownDocument.from_text(md_text).meta
+
+
+def load_agents_index(index_dir: Path) -> list[dict[str, Any]]:
+    agents_path = index_dir / "agents-index.json"
+    if not agents_path.exists():
+        return []
+    result: list[dict[str, Any]] = json.loads(read_text(agents_path))
+    return result
+
+
+def load_skill_dependencies(skills_dir: Path) -> dict[str, list[str]]:
+    """Collect skill->skill `dependencies` declared in skills/*/index-entry.json"""
+    deps: dict[str, list[str]] = {}
+    for entry_path in sorted(skills_dir.glob("*/index-entry.json")):
+        entry = json.loads(read_text(entry_path))
+        declared = entry.get("dependencies") or []
+        if declared:
+            deps[entry.get("slug") or entry_path.parent.name] = [str(d) for d in declared]
+    return deps
+
+
+def build_entry(skill_md: Path, tokenizer: Tokenizer) -> dict[str, Any]:
+    """skills-index.json entry for one SKILL.md"""
+    doc = load_document(skill_md)
+    data = doc.data
+    meta = doc.meta
+    missing = [k for k in META_FIELDS if k not in meta]
+    if missing:
+        print(f"WARN: {skill_md} missing fields: {', '.join(missing)}", file=sys.stderr)
+    # Copies: estimate_skill_tokens annotates them, the cached document stays clean
+    sections = [dict(s) for s in doc.sections]
+    with span("estimate tokens"):
+        tokens = estimate_skill_tokens(data, sections, tokenizer)
+    return {
+        "slug": meta.get("slug"),
+        "name": meta.get("name"),
+        "summary": (meta.get("description") or "").strip()[:160],
+        "keywords": meta.get("keywords", []),
+        "owner": meta.get("owner"),
+        "version": meta.get("version"),
+        "entry": str(skill_md.as_posix()),
+        "bytes": len(data),
+        "tokens": tokens,
+        "sections": sections,
+    }
+
+
+def check_catalog_schemas(root: Path, entries: list[dict[str, Any]], out: Path) -> bool:
+    """Schema-check catalog sources and the generated entries; False if any are broken"""
+    try:
+        targets = collect_targets(root, ["index-entry", "agents-index"])
+        issues = [i for _, file_issues in iter_catalog_results(targets) for i in file_issues]
+        issues.extend(validate_data(entries, "skills-index", out))
+    except RuntimeError as e:
+        print(f"WARN: skipping schema checks ({e})", file=sys.stderr)
+        return True
+    for issue in issues:
+        print(f"ERROR: {issue.path}: {issue.message}", file=sys.stderr)
+    return not issues
+
+
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Build skills-index.json from SKILL.md files")
     ap.add_argument("--root", type=Path, default=Path("."), help="Repo root")
     ap.add_argument(
@@ -69,8 +105,35 @@ def main() -> int:
         action="store_true",
         help="Also rebuild embeddings after building index",
     )
-    args = ap.parse_args()
+    ap.add_argument(
+        "--db",
+        type=Path,
+        default=None,
+        help="SQLite catalog path (default: catalog.db next to --out)",
+    )
+    ap.add_argument(
+        "--no-db",
+        action="store_true",
+        help="Skip writing the SQLite catalog",
+    )
+    ap.add_argument(
+        "--tokenizer",
+        choices=available_tokenizers(),
+        default="chars",
+        help="Tokenizer for per-section token estimates (default: chars, offline)",
+    )
+    ap.add_argument(
+        "--no-schema-check",
+        action="store_true",
+        help="Skip JSON Schema checks of index entries, agents index and the output",
+    )
+    add_profiling_args(ap)
+    args = ap.parse_args(argv)
+    with profiled(args):
+        return run(args)
+
 
+def run(args: argparse.Namespace) -> int:
     root: Path = args.root.resolve()
     skills_dir = root / "skills"
     index_dir = root / "index"
@@ -81,22 +144,12 @@ def main() -> int:
         return 2
     index_dir.mkdir(parents=True, exist_ok=True)
 
+    tokenizer = get_tokenizer(args.tokenizer)
     entries: list[dict[str, Any]] = []
-    for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
-        meta = extract_front_matter(read_text(skill_md))
-        missing = [k for k in META_FIELDS if k not in meta]
-        if missing:
-            print(f"WARN: {skill_md} missing fields: {', '.join(missing)}", file=sys.stderr)
-        entry = {
-            "slug": meta.get("slug"),
-            "name": meta.get("name"),
-            "summary": (meta.get("description") or "").strip()[:160],
-            "keywords": meta.get("keywords", []),
-            "owner": meta.get("owner"),
-            "version": meta.get("version"),
-            "entry": str(skill_md.as_posix()),
-        }
-        entries.append(entry)
+    with span("parse skills"):
+        for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
+            with span("skill"):
+                entries.append(build_entry(skill_md, tokenizer))
 
     # Deterministic order
     entries = sorted(entries, key=lambda e: (e.get("slug") or ""))
@@ -107,10 +160,24 @@ def main() -> int:
         print("ERROR: duplicate slugs in skills", file=sys.stderr)
         return 1
 
+    if not args.no_schema_check:
+        with span("schema check"):
+            schemas_ok = check_catalog_schemas(root, entries, out)
+        if not schemas_ok:
+            return 1
+
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(json.dumps(entries, indent=2) + "\n", encoding="utf-8")
+    with span("write index"):
+        out.write_text(json.dumps(entries, indent=2) + "\n", encoding="utf-8")
     print(f"Wrote {out} with {len(entries)} entr(y/ies)")
 
+    if not args.no_db:
+        db_path = args.db or (out.parent / catalog_db.DEFAULT_DB_NAME)
+        agents = load_agents_index(index_dir)
+        with span("write catalog db"):
+            catalog_db.write_catalog(db_path, entries, agents, load_skill_dependencies(skills_dir))
+        print(f"Wrote {db_path} ({len(entries)} skills, {len(agents)} agents)")
+
     # Optionally rebuild embeddings
     if args.with_embeddings:
         print("\nRebuilding embeddings...")
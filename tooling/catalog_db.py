@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+SQLite catalog of skills and agents
+Indexed lookups and FTS5 (bm25) search over the same data as the JSON indexes
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+DEFAULT_DB_NAME = "catalog.db"
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE skills (
+    slug TEXT PRIMARY KEY,
+    name TEXT,
+    summary TEXT,
+    owner TEXT,
+    version TEXT,
+    entry TEXT
+);
+CREATE TABLE agents (
+    slug TEXT PRIMARY KEY,
+    name TEXT,
+    description TEXT,
+    model TEXT,
+    owner TEXT,
+    version TEXT,
+    entry TEXT
+);
+CREATE TABLE keywords (
+    kind TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    PRIMARY KEY (kind, slug, keyword)
+);
+CREATE INDEX idx_keywords_keyword ON keywords (keyword);
+CREATE TABLE dependencies (
+    skill TEXT NOT NULL,
+    depends_on TEXT NOT NULL,
+    PRIMARY KEY (skill, depends_on)
+);
+CREATE INDEX idx_dependencies_depends_on ON dependencies (depends_on);
+CREATE TABLE sections (
+    slug TEXT NOT NULL,
+    heading TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    tokens INTEGER,
+    PRIMARY KEY (slug, offset)
+);
+CREATE VIRTUAL TABLE catalog_fts USING fts5(
+    slug UNINDEXED,
+    kind UNINDEXED,
+    name,
+    summary,
+    keywords,
+    tokenize = 'porter unicode61'
+);
+"""
+
+# Column weights for bm25(): slug, kind, name, summary, keywords.
+# Mirrors build_embeddings.py (name 3x, summary 2x, keywords 1x).
+BM25_WEIGHTS = (0.0, 0.0, 3.0, 2.0, 1.0)
+
+QUERY_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def default_db_path() -> Path:
+    return Path(__file__).parent.parent / "index" / DEFAULT_DB_NAME
+
+
+def write_catalog(
+    db_path: Path,
+    skills: list[dict[str, Any]],
+    agents: Iterable[dict[str, Any]] = (),
+    dependencies: dict[str, list[str]] | None = None,
+) -> None:
+    """Write the catalog database atomically (readers never see a partial file)"""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+        )
+        for skill in skills:
+            keywords = [str(k) for k in skill.get("keywords") or []]
+            conn.execute(
+                "INSERT INTO skills (slug, name, summary, owner, version, entry)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    skill.get("slug"),
+                    skill.get("name"),
+                    skill.get("summary"),
+                    skill.get("owner"),
+                    _as_text(skill.get("version")),
+                    skill.get("entry"),
+                ),
+            )
+            _insert_keywords(conn, "skill", skill.get("slug"), keywords)
+            _insert_fts(conn, "skill", skill, skill.get("summary"), keywords)
+            conn.executemany(
+                "INSERT INTO sections (slug, heading, offset, length, tokens)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [
+                    (skill.get("slug"), s["heading"], s["offset"], s["length"], s.get("tokens"))
+                    for s in skill.get("sections") or []
+                ],
+            )
+
+        for agent in agents:
+            keywords = [str(k) for k in agent.get("keywords") or []]
+            conn.execute(
+                "INSERT INTO agents (slug, name, description, model, owner, version, entry)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    agent.get("slug"),
+                    agent.get("name"),
+                    agent.get("description"),
+                    agent.get("model"),
+                    agent.get("owner"),
+                    _as_text(agent.get("version")),
+                    agent.get("entry"),
+                ),
+            )
+            _insert_keywords(conn, "agent", agent.get("slug"), keywords)
+            _insert_fts(conn, "agent", agent, agent.get("description"), keywords)
+
+        for skill_slug, deps in sorted((dependencies or {}).items()):
+            conn.executemany(
+                "INSERT OR IGNORE INTO dependencies (skill, depends_on) VALUES (?, ?)",
+                [(skill_slug, dep) for dep in deps],
+            )
+
+        conn.execute("INSERT INTO catalog_fts (catalog_fts) VALUES ('optimize')")
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+
+
+def _as_text(value: Any) -> str | None:
+    return None if value is None else str(value)
+
+
+def _insert_keywords(
+    conn: sqlite3.Connection, kind: str, slug: str | None, keywords: list[str]
+) -> None:
+    conn.executemany(
+        "INSERT OR IGNORE INTO keywords (kind, slug, keyword) VALUES (?, ?, ?)",
+        [(kind, slug, k) for k in keywords],
+    )
+
+
+def _insert_fts(
+    conn: sqlite3.Connection,
+    kind: str,
+    item: dict[str, Any],
+    summary: str | None,
+    keywords: list[str],
+) -> None:
+    conn.execute(
+        "INSERT INTO catalog_fts (slug, kind, name, summary, keywords) VALUES (?, ?, ?, ?, ?)",
+        (item.get("slug"), kind, item.get("name") or "", summary or "", " ".join(keywords)),
+    )
+
+
+def connect(db_path: Path | str | None = None) -> sqlite3.Connection:
+    """Open the catalog read-only; any number of processes may read concurrently"""
+    path = Path(db_path) if db_path is not None else default_db_path()
+    if not path.exists():
+        msg = f"Catalog database not found: {path}"
+        raise FileNotFoundError(msg)
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def get_skill(conn: sqlite3.Connection, slug: str) -> dict[str, Any] | None:
+    """Look up a single skill by slug (primary-key seek)"""
+    row = conn.execute("SELECT * FROM skills WHERE slug = ?", (slug,)).fetchone()
+    if row is None:
+        return None
+    skill = dict(row)
+    skill["keywords"] = skill_keywords(conn, slug)
+    return skill
+
+
+def get_agent(conn: sqlite3.Connection, slug: str) -> dict[str, Any] | None:
+    """Look up a single agent by slug (primary-key seek)"""
+    row = conn.execute("SELECT * FROM agents WHERE slug = ?", (slug,)).fetchone()
+    if row is None:
+        return None
+    agent = dict(row)
+    agent["keywords"] = [
+        r["keyword"]
+        for r in conn.execute(
+            "SELECT keyword FROM keywords WHERE kind = 'agent' AND slug = ? ORDER BY keyword",
+            (slug,),
+        )
+    ]
+    return agent
+
+
+def skill_keywords(conn: sqlite3.Connection, slug: str) -> list[str]:
+    return [
+        r["keyword"]
+        for r in conn.execute(
+            "SELECT keyword FROM keywords WHERE kind = 'skill' AND slug = ? ORDER BY keyword",
+            (slug,),
+        )
+    ]
+
+
+def find_by_keyword(conn: sqlite3.Connection, keyword: str, kind: str = "skill") -> list[str]:
+    """Return slugs tagged with an exact keyword (index seek on keywords.keyword)"""
+    return [
+        r["slug"]
+        for r in conn.execute(
+            "SELECT slug FROM keywords WHERE keyword = ? AND kind = ? ORDER BY slug",
+            (keyword, kind),
+        )
+    ]
+
+
+def dependencies_of(conn: sqlite3.Connection, skill: str) -> list[str]:
+    """Skills that `skill` declares as dependencies"""
+    return [
+        r["depends_on"]
+        for r in conn.execute(
+            "SELECT depends_on FROM dependencies WHERE skill = ? ORDER BY depends_on", (skill,)
+        )
+    ]
+
+
+def dependents_of(conn: sqlite3.Connection, skill: str) -> list[str]:
+    """Skills that declare `skill` as a dependency"""
+    return [
+        r["skill"]
+        for r in conn.execute(
+            "SELECT skill FROM dependencies WHERE depends_on = ? ORDER BY skill", (skill,)
+        )
+    ]
+
+
+def skill_sections(conn: sqlite3.Connection, slug: str) -> list[dict[str, Any]]:
+    """Section offset table of a skill, in file order"""
+    return [
+        dict(r)
+        for r in conn.execute(
+            "SELECT heading, offset, length, tokens FROM sections WHERE slug = ? ORDER BY offset",
+            (slug,),
+        )
+    ]
+
+
+def fts_query(text: str) -> str | None:
+    """Turn free text into an FTS5 OR-query of quoted tokens (no FTS syntax injection)"""
+    tokens = dict.fromkeys(QUERY_TOKEN.findall(text.lower()))
+    if not tokens:
+        return None
+    return " OR ".join(f'"{t}"' for t in tokens)
+
+
+def search(
+    conn: sqlite3.Connection, query: str, kind: str = "skill", limit: int = 10
+) -> list[tuple[str, float]]:
+    """Return (slug, bm25) pairs, best first. bm25 is negative; lower is better."""
+    match = fts_query(query)
+    if match is None:
+        return []
+    weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+    # S608: only the constant BM25_WEIGHTS are interpolated; user text is bound
+    sql = (
+        f"SELECT slug, bm25(catalog_fts, {weights}) AS rank FROM catalog_fts"  # noqa: S608
+        " WHERE catalog_fts MATCH ? AND kind = ? ORDER BY rank LIMIT ?"
+    )
+    return [(r["slug"], float(r["rank"])) for r in conn.execute(sql, (match, kind, limit))]
+
+
+class FtsSkillRouter:
+    """Route tasks to relevant skills using FTS5 bm25 ranking over the catalog database"""
+
+    def __init__(self, db_path: Path | str | None = None) -> None:
+        self.conn = connect(db_path)
+
+    def route(self, query: str, top_k: int = 2, min_score: float = 0.1) -> list[dict[str, Any]]:
+        """
+        Find most relevant skills for a query
+
+        Same contract as SkillRouter.route(). bm25 is unbounded, so it is mapped
+        onto 0-1 with r / (1 + r) (r = -bm25) to keep min_score meaningful.
+        """
+        results: list[dict[str, Any]] = []
+        for slug, rank in search(self.conn, query, kind="skill", limit=top_k):
+            relevance = max(0.0, -rank)
+            score = relevance / (1.0 + relevance)
+            if score >= min_score:
+                results.append({"slug": slug, "score": score, "rank": len(results) + 1})
+        return results
+
+    def route_with_explanation(self, query: str, top_k: int = 2) -> str:
+        """Route with human-readable explanation"""
+        results = self.route(query, top_k)
+
+        output = []
+        output.append(f"Query: {query}")
+        output.append(f"\nTop {len(results)} skill(s):")
+
+        for r in results:
+            output.append(f"  {r['rank']}. {r['slug']} (score: {r['score']:.3f})")
+
+        return "\n".join(output)
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Query the SQLite skill catalog")
+    ap.add_argument("query", nargs="+", help="Free-text search query")
+    ap.add_argument("--db", type=Path, default=None, help="Catalog database path")
+    ap.add_argument("--kind", choices=["skill", "agent"], default="skill")
+    ap.add_argument("--limit", type=int, default=10)
+    args = ap.parse_args()
+
+    try:
+        conn = connect(args.db)
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}. Run build_index.py first.", file=sys.stderr)
+        return 2
+
+    try:
+        hits = search(conn, " ".join(args.query), kind=args.kind, limit=args.limit)
+    finally:
+        conn.close()
+    print(json.dumps([{"slug": s, "bm25": r} for s, r in hits], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
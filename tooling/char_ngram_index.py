@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Character n-gram index for typo-tolerant term lookup
+Terms are split into char_wb n-grams (the word padded with a space on each
+side, as scikit-learn's analyzer="char_wb" does) and stored as an inverted
+index n-gram -> term ids. A lookup scores only the terms that share an
+n-gram with the query word, by the Dice coefficient of their n-gram sets, so
+it reads a few short posting lists instead of scanning the vocabulary
+"""
+
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+
+DEFAULT_N = 3
+# Dice similarity a match must reach: "kubernets" -> "kubernetes" scores 0.74,
+# "modul" -> "module" 0.73
+MIN_SIMILARITY = 0.6
+# Shorter words have too few n-grams to tell a typo from a different word
+MIN_WORD_LEN = 4
+# Words nearest() remembers; the least recently looked up are dropped first
+MAX_MEMO_WORDS = 4096
+
+
+def char_wb_ngrams(word: str, n: int = DEFAULT_N) -> set[str]:
+    """Distinct n-grams of ` word ` (shorter padded words are their own n-gram)"""
+    padded = f" {word} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i : i + n] for i in range(len(padded) - n + 1)}
+
+
+class CharNgramIndex:
+    """Inverted n-gram index over a fixed set of terms"""
+
+    def __init__(self, terms: Iterable[str], n: int = DEFAULT_N) -> None:
+        self.n = n
+        self.terms = sorted(set(terms))
+        self._ids = {term: i for i, term in enumerate(self.terms)}
+        self._sizes: list[int] = []
+        self.postings: dict[str, list[int]] = {}
+        for i, term in enumerate(self.terms):
+            grams = char_wb_ngrams(term, n)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(i)
+        # word -> correction (None: no term close enough); queries repeat words a lot
+        self._memo: OrderedDict[tuple[str, float], str | None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __contains__(self, term: object) -> bool:
+        return term in self._ids
+
+    def candidates(self, word: str, limit: int = 5) -> list[tuple[str, float]]:
+        """Up to `limit` (term, Dice similarity) pairs sharing an n-gram with word, best first"""
+        grams = char_wb_ngrams(word, self.n)
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+        scored = [
+            (self.terms[i], 2 * count / (len(grams) + self._sizes[i]))
+            for i, count in shared.items()
+        ]
+        # Ties go to the term closest in length, then alphabetically, so results are stable
+        scored.sort(key=lambda ts: (-ts[1], abs(len(ts[0]) - len(word)), ts[0]))
+        return scored[:limit]
+
+    def nearest(self, word: str, min_similarity: float = MIN_SIMILARITY) -> str | None:
+        """The indexed term most similar to word, if any reaches min_similarity"""
+        key = (word, min_similarity)
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            return self._memo[key]
+        best = self.candidates(word, limit=1)
+        term = best[0][0] if best and best[0][1] >= min_similarity else None
+        self._memo[key] = term
+        if len(self._memo) > MAX_MEMO_WORDS:
+            self._memo.popitem(last=False)
+        return term
+
+    def correct(
+        self,
+        tokens: list[str],
+        skip: Iterable[str] = (),
+        min_similarity: float = MIN_SIMILARITY,
+    ) -> list[str]:
+        """
+        tokens with unknown words replaced by indexed terms
+
+        A token that is not a term is first joined with its neighbour when the
+        pair spells one ("graph ql" -> "graphql"), otherwise replaced by its
+        nearest term. Known terms, words in `skip` (e.g. stop words), short
+        words and words with non-letters are kept as they are.
+        """
+        skipped = frozenset(skip)
+        out: list[str] = []
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            following = tokens[i + 1] if i + 1 < len(tokens) else None
+            if following is not None and (token not in self or following not in self):
+                joined = token + following
+                if joined in self:
+                    out.append(joined)
+                    i += 2
+                    continue
+            if (
+                token in self
+                or token in skipped
+                or len(token) < MIN_WORD_LEN
+                or not token.isalpha()
+            ):
+                out.append(token)
+            else:
+                out.append(self.nearest(token, min_similarity) or token)
+            i += 1
+        return out
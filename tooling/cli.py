@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+toolworks command-line entry point
+One command for the tooling scripts: `toolworks <command> [args]` runs the
+matching script's main() with the remaining arguments. Scripts are imported
+only when their command runs, so numpy/scikit-learn load for `embed` and
+`route` alone and lightweight commands start quickly. --profile, --trace and
+--memprofile before the command profile any of them (see profiling.py)
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from pathlib import Path
+
+PROG = "toolworks"
+
+# command -> (module in tooling/, one-line help)
+COMMANDS: dict[str, tuple[str, str]] = {
+    "index": ("build_index", "Build index/skills-index.json and the catalog database"),
+    "embed": ("build_embeddings", "Build TF-IDF routing embeddings (needs scikit-learn)"),
+    "route": ("route_skills", "Route a task description to skills"),
+    "validate": ("validate_skill", "Validate SKILL.md files against the spec"),
+    "lint": ("lint_skill", "Lint SKILL.md files for style and broken links"),
+    "deps": ("analyze_agent_dependencies", "Analyze agent -> skill dependencies"),
+    "coverage": ("analyze_coverage", "Report catalog coverage and gaps"),
+    "init": ("init_repo_structure", "Create the repo layout or a synthetic catalog"),
+    "evals": ("run_evals", "Run eval scenarios against a skill executor"),
+    "graph": ("dependency_graph", "Query the skill dependency graph"),
+}
+
+
+def usage() -> str:
+    width = max(map(len, COMMANDS))
+    lines = [f"usage: {PROG} [--profile PATH] [--trace PATH] [--memprofile] <command> [args]"]
+    lines += ["", "commands:"]
+    lines += [f"  {name:<{width}}  {help_}" for name, (_, help_) in COMMANDS.items()]
+    lines += ["", f"Run '{PROG} <command> --help' for the options of a command."]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in {"-h", "--help"}:
+        print(usage())
+        return 0
+
+    # The scripts import their siblings by bare name, installed or not
+    tooling_dir = str(Path(__file__).resolve().parent)
+    if tooling_dir not in sys.path:
+        sys.path.insert(0, tooling_dir)
+    from profiling import add_profiling_args, profiled
+
+    ap = argparse.ArgumentParser(prog=PROG, usage=usage(), add_help=False)
+    add_profiling_args(ap)
+    ap.add_argument("command")
+    ap.add_argument("args", nargs=argparse.REMAINDER)
+    args = ap.parse_args(argv)
+    name, rest = args.command, args.args
+    if name not in COMMANDS:
+        print(f"{PROG}: unknown command '{name}'\n\n{usage()}", file=sys.stderr)
+        return 2
+
+    # argparse derives usage lines from argv[0]
+    sys.argv[0] = f"{PROG} {name}"
+
+    with profiled(args):
+        module = importlib.import_module(COMMANDS[name][0])
+        result = module.main(rest)
+    return int(result or 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
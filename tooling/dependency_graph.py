@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Persisted agent/skill dependency graph
+Agent->skill and agent->agent mentions (analyze_agent_dependencies.py) and
+skill->skill `dependencies` (index-entry.json) are stored as CSR adjacency
+arrays in both directions, together with transitive-closure bitsets, so impact
+questions are a bitset lookup instead of a re-run of the analysis
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+GRAPH_FORMAT = 1
+DEFAULT_GRAPH_NAME = "dependency-graph.json"
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def default_graph_path(root: Path | None = None) -> Path:
+    return (root or REPO_ROOT) / "index" / DEFAULT_GRAPH_NAME
+
+
+def _csr(n: int, edges: Iterable[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    """(offsets, targets): the successors of node i are targets[offsets[i]:offsets[i + 1]]"""
+    buckets: list[set[int]] = [set() for _ in range(n)]
+    for src, dst in edges:
+        if src != dst:
+            buckets[src].add(dst)
+    offsets = [0]
+    targets: list[int] = []
+    for bucket in buckets:
+        targets.extend(sorted(bucket))
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def _closure(offsets: list[int], targets: list[int]) -> list[int]:
+    """
+    Reachability bitset of every node (excluding the node itself unless on a cycle)
+
+    Iterative Tarjan: strongly connected components come out successors
+    first, so each component's closure is the union of its members' direct
+    successors and their (already final) closures.
+    """
+    n = len(offsets) - 1
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    comp_of = [-1] * n
+    comp_bits: list[int] = []
+    stack: list[int] = []
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        work = [(root, offsets[root])]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        while work:
+            v, i = work[-1]
+            if i < offsets[v + 1]:
+                work[-1] = (v, i + 1)
+                w = targets[i]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, offsets[w]))
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+            if low[v] != index[v]:
+                continue
+            members = []
+            while True:
+                w = stack.pop()
+                on_stack[w] = False
+                comp_of[w] = len(comp_bits)
+                members.append(w)
+                if w == v:
+                    break
+            bits = 0
+            for m in members:
+                for t in targets[offsets[m] : offsets[m + 1]]:
+                    bits |= 1 << t
+                    if comp_of[t] != len(comp_bits):
+                        bits |= comp_bits[comp_of[t]]
+            comp_bits.append(bits)
+
+    return [comp_bits[comp_of[v]] for v in range(n)]
+
+
+class DependencyGraph:
+    """
+    Compact bidirectional dependency graph
+
+    Nodes are agent and skill slugs; an edge A -> B means A needs B. `needs`
+    and `affected` answer from precomputed closure bitsets, so a query is one
+    lookup plus decoding the result, however deep the dependency chains are.
+    """
+
+    def __init__(
+        self,
+        nodes: list[str],
+        kinds: list[str],
+        offsets: list[int],
+        targets: list[int],
+        needs_bits: list[int] | None = None,
+        affected_bits: list[int] | None = None,
+    ) -> None:
+        self.nodes = nodes
+        self.kinds = kinds
+        self.ids = {slug: i for i, slug in enumerate(nodes)}
+        self.offsets = offsets
+        self.targets = targets
+        self.rev_offsets, self.rev_targets = _csr(
+            len(nodes),
+            ((targets[j], i) for i in range(len(nodes)) for j in range(offsets[i], offsets[i + 1])),
+        )
+        self.needs_bits = needs_bits if needs_bits is not None else _closure(offsets, targets)
+        self.affected_bits = (
+            affected_bits
+            if affected_bits is not None
+            else _closure(self.rev_offsets, self.rev_targets)
+        )
+        self.agent_mask = sum(1 << i for i, kind in enumerate(kinds) if kind == "agent")
+
+    @classmethod
+    def from_edges(
+        cls,
+        agents: Iterable[str],
+        skills: Iterable[str],
+        edges: Iterable[tuple[str, str]],
+    ) -> DependencyGraph:
+        """Build from (source, target) slug pairs; unknown slugs become skill nodes"""
+        edge_list = list(edges)
+        kind_of = dict.fromkeys(sorted(skills), "skill")
+        for src, dst in edge_list:
+            kind_of.setdefault(src, "skill")
+            kind_of.setdefault(dst, "skill")
+        kind_of.update(dict.fromkeys(agents, "agent"))
+        nodes = sorted(kind_of)
+        ids = {slug: i for i, slug in enumerate(nodes)}
+        offsets, targets = _csr(len(nodes), ((ids[s], ids[d]) for s, d in edge_list))
+        return cls(nodes, [kind_of[s] for s in nodes], offsets, targets)
+
+    def _id(self, slug: str) -> int:
+        try:
+            return self.ids[slug]
+        except KeyError:
+            msg = f"Unknown agent or skill: {slug}"
+            raise ValueError(msg) from None
+
+    def _slugs(self, bits: int, kind: str | None = None) -> list[str]:
+        if kind == "agent":
+            bits &= self.agent_mask
+        elif kind == "skill":
+            bits &= ~self.agent_mask
+        # Least significant bit first, so slugs come out in node (sorted) order
+        return [self.nodes[i] for i, bit in enumerate(reversed(bin(bits)[2:])) if bit == "1"]
+
+    def kind(self, slug: str) -> str:
+        return self.kinds[self._id(slug)]
+
+    def direct_needs(self, slug: str) -> list[str]:
+        i = self._id(slug)
+        return [self.nodes[t] for t in self.targets[self.offsets[i] : self.offsets[i + 1]]]
+
+    def direct_dependents(self, slug: str) -> list[str]:
+        i = self._id(slug)
+        return [
+            self.nodes[t] for t in self.rev_targets[self.rev_offsets[i] : self.rev_offsets[i + 1]]
+        ]
+
+    def needs(self, slug: str, kind: str | None = None) -> list[str]:
+        """Everything `slug` transitively needs, optionally only agents or skills"""
+        i = self._id(slug)
+        return self._slugs(self.needs_bits[i] & ~(1 << i), kind)
+
+    def affected(self, slug: str, kind: str | None = None) -> list[str]:
+        """Everything that transitively needs `slug`, i.e. is affected when it changes"""
+        i = self._id(slug)
+        return self._slugs(self.affected_bits[i] & ~(1 << i), kind)
+
+    def affected_by(self, slugs: Iterable[str], kind: str | None = None) -> list[str]:
+        """Union of affected() over several changed slugs, excluding the slugs themselves"""
+        bits = changed = 0
+        for slug in slugs:
+            i = self._id(slug)
+            bits |= self.affected_bits[i]
+            changed |= 1 << i
+        return self._slugs(bits & ~changed, kind)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "format": GRAPH_FORMAT,
+            "nodes": self.nodes,
+            "kinds": self.kinds,
+            "offsets": self.offsets,
+            "targets": self.targets,
+            # Closure bitsets as hex; bit i stands for nodes[i]
+            "needs": [format(b, "x") for b in self.needs_bits],
+            "affected": [format(b, "x") for b in self.affected_bits],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> DependencyGraph:
+        if data.get("format") != GRAPH_FORMAT:
+            msg = f"Unsupported dependency graph format: {data.get('format')}"
+            raise ValueError(msg)
+        return cls(
+            data["nodes"],
+            data["kinds"],
+            data["offsets"],
+            data["targets"],
+            [int(h, 16) for h in data["needs"]],
+            [int(h, 16) for h in data["affected"]],
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the graph atomically"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(self.to_json(), separators=(",", ":")) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path | None = None) -> DependencyGraph:
+        path = path or default_graph_path()
+        if not path.exists():
+            msg = f"Dependency graph not found: {path}"
+            raise FileNotFoundError(msg)
+        return cls.from_json(json.loads(path.read_text(encoding="utf-8")))
+
+
+def graph_edges(
+    dependencies: dict[str, dict[str, Any]], skill_dependencies: dict[str, list[str]]
+) -> Iterator[tuple[str, str]]:
+    """Edges from build_dependency_graph() output plus index-entry.json dependencies"""
+    for agent, data in dependencies.items():
+        for target in [*data["skills"], *data.get("agents", [])]:
+            yield agent, target
+    for skill, deps in skill_dependencies.items():
+        for dep in deps:
+            yield skill, dep
+
+
+def build_graph(
+    dependencies: dict[str, dict[str, Any]],
+    skill_dependencies: dict[str, list[str]],
+    skills: Iterable[str],
+) -> DependencyGraph:
+    return DependencyGraph.from_edges(
+        dependencies, skills, graph_edges(dependencies, skill_dependencies)
+    )
+
+
+def slug_from_arg(arg: str) -> str:
+    """Accept a slug or a path inside skills/<slug>/ or agents/<slug>/"""
+    parts = Path(arg).parts
+    for marker in ("skills", "agents"):
+        if marker in parts:
+            i = parts.index(marker)
+            if i + 1 < len(parts):
+                return parts[i + 1]
+    return arg
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Build and query the agent/skill dependency graph")
+    ap.add_argument("--graph", type=Path, default=None, help="Graph file path")
+    ap.add_argument(
+        "--root",
+        type=Path,
+        default=Path("."),
+        help="Repo root; the graph defaults to <root>/index (default: .)",
+    )
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Analyze agents and skills and write the graph")
+    build.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Scan agents across N processes (0 = one per CPU; default: 1)",
+    )
+
+    for name, text in (
+        ("affected", "What transitively depends on the given skills/agents"),
+        ("needs", "What the given skills/agents transitively need"),
+    ):
+        query = sub.add_parser(name, help=text)
+        query.add_argument("slugs", nargs="+", help="Slugs or paths under skills/ or agents/")
+        query.add_argument("--kind", choices=["agent", "skill"], default=None)
+        query.add_argument("--json", action="store_true", help="Print JSON")
+
+    args = ap.parse_args(argv)
+    path: Path = args.graph or default_graph_path(args.root)
+
+    if args.command == "build":
+        from analyze_agent_dependencies import build_dependency_graph, load_skills_index
+        from build_index import load_skill_dependencies
+
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        dependencies, _ = build_dependency_graph(jobs, root=args.root)
+        graph = build_graph(
+            dependencies,
+            load_skill_dependencies(args.root / "skills"),
+            (s["slug"] for s in load_skills_index(args.root)),
+        )
+        graph.save(path)
+        print(f"Wrote {path} ({len(graph.nodes)} nodes, {len(graph.targets)} edges)")
+        return 0
+
+    try:
+        graph = DependencyGraph.load(path)
+        slugs = [slug_from_arg(a) for a in args.slugs]
+        if args.command == "affected":
+            result = {"affected": graph.affected_by(slugs, args.kind)}
+        else:
+            result = {s: graph.needs(s, args.kind) for s in slugs}
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}. Run dependency_graph.py build first.", file=sys.stderr)
+        return 2
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for key, values in result.items():
+            print(f"{key}:")
+            for value in values:
+                print(f"  {graph.kind(value)}\t{value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
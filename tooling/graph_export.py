@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Export the dependency graph as Graphviz DOT, JSON adjacency or GraphML
+Writers stream one line per node or edge to the output, group nodes into
+clusters by slug domain prefix, and switch to a domain-level summary when the
+graph is too large to render; output is byte-identical across runs
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import Counter
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+from dependency_graph import DependencyGraph
+
+FORMATS = ("dot", "json", "graphml")
+# Above this many edges the full graph is unreadable; emit the domain summary instead
+SUMMARY_EDGE_THRESHOLD = 2000
+
+
+def domain_of(slug: str) -> str:
+    """Domain prefix of a slug: `cloud-aws-architect` -> `cloud`"""
+    return slug.split("-", 1)[0]
+
+
+def iter_edges(graph: DependencyGraph) -> Iterator[tuple[str, str]]:
+    """Direct edges in node order"""
+    for i, source in enumerate(graph.nodes):
+        for t in graph.targets[graph.offsets[i] : graph.offsets[i + 1]]:
+            yield source, graph.nodes[t]
+
+
+def domain_summary(
+    graph: DependencyGraph,
+) -> tuple[dict[str, Counter[str]], dict[tuple[str, str], int]]:
+    """({domain: Counter(kind)}, {(source domain, target domain): edge count}), sorted"""
+    members: dict[str, Counter[str]] = {}
+    for slug, kind in zip(graph.nodes, graph.kinds, strict=True):
+        members.setdefault(domain_of(slug), Counter())[kind] += 1
+    edges = Counter((domain_of(s), domain_of(t)) for s, t in iter_edges(graph))
+    return dict(sorted(members.items())), dict(sorted(edges.items()))
+
+
+def use_summary(graph: DependencyGraph, threshold: int = SUMMARY_EDGE_THRESHOLD) -> bool:
+    return len(graph.targets) > threshold
+
+
+def _dot_id(value: str) -> str:
+    return json.dumps(value)  # a quoted, escaped DOT ID
+
+
+def _count_label(counts: Counter[str]) -> str:
+    return ", ".join(f"{counts[k]} {k}s" for k in ("agent", "skill") if counts[k])
+
+
+def write_dot(
+    graph: DependencyGraph, out: TextIO, summary: bool = False, clusters: bool = True
+) -> None:
+    out.write("digraph dependencies {\n")
+    out.write("  rankdir=LR;\n")
+    out.write("  node [fontname=Helvetica, fontsize=10];\n")
+    if summary:
+        members, edges = domain_summary(graph)
+        for domain, counts in members.items():
+            label = f"{domain}\\n{_count_label(counts)}"
+            out.write(f'  {_dot_id(domain)} [shape=folder, label="{label}"];\n')
+        for (source, target), weight in edges.items():
+            out.write(f'  {_dot_id(source)} -> {_dot_id(target)} [label="{weight}"];\n')
+        out.write("}\n")
+        return
+
+    shapes = {"agent": "box", "skill": "ellipse"}
+    current = None
+    for slug, kind in sorted(zip(graph.nodes, graph.kinds, strict=True), key=_cluster_key):
+        domain = domain_of(slug)
+        if clusters and domain != current:
+            if current is not None:
+                out.write("  }\n")
+            out.write(f"  subgraph {_dot_id('cluster_' + domain)} {{\n")
+            out.write(f"    label={_dot_id(domain)};\n")
+            current = domain
+        indent = "    " if clusters else "  "
+        out.write(f"{indent}{_dot_id(slug)} [shape={shapes.get(kind, 'ellipse')}];\n")
+    if clusters and current is not None:
+        out.write("  }\n")
+    for source, target in iter_edges(graph):
+        out.write(f"  {_dot_id(source)} -> {_dot_id(target)};\n")
+    out.write("}\n")
+
+
+def _cluster_key(item: tuple[str, str]) -> tuple[str, str]:
+    return domain_of(item[0]), item[0]
+
+
+def write_json(graph: DependencyGraph, out: TextIO, summary: bool = False) -> None:
+    """Adjacency JSON: nodes list plus {source: [targets]} (summary: {source: {target: n}})"""
+    dumps = json.dumps
+    out.write(f'{{\n  "directed": true,\n  "summary": {dumps(summary)},\n  "nodes": [')
+    if summary:
+        members, edges = domain_summary(graph)
+        for n, (domain, counts) in enumerate(members.items()):
+            node = {"id": domain, "agents": counts["agent"], "skills": counts["skill"]}
+            out.write(("," if n else "") + "\n    " + dumps(node, sort_keys=True))
+        out.write('\n  ],\n  "adjacency": {')
+        grouped: dict[str, dict[str, int]] = {}
+        for (source, target), weight in edges.items():
+            grouped.setdefault(source, {})[target] = weight
+        for n, (source, targets) in enumerate(grouped.items()):
+            out.write(("," if n else "") + f"\n    {dumps(source)}: {dumps(targets)}")
+    else:
+        for n, (slug, kind) in enumerate(zip(graph.nodes, graph.kinds, strict=True)):
+            node = {"id": slug, "kind": kind, "domain": domain_of(slug)}
+            out.write(("," if n else "") + "\n    " + dumps(node, sort_keys=True))
+        out.write('\n  ],\n  "adjacency": {')
+        n = 0
+        for i, source in enumerate(graph.nodes):
+            ids = graph.targets[graph.offsets[i] : graph.offsets[i + 1]]
+            if ids:
+                names = [graph.nodes[t] for t in ids]
+                out.write(("," if n else "") + f"\n    {dumps(source)}: {dumps(names)}")
+                n += 1
+    out.write("\n  }\n}\n")
+
+
+def write_graphml(graph: DependencyGraph, out: TextIO, summary: bool = False) -> None:
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+    out.write('  <key id="kind" for="node" attr.name="kind" attr.type="string"/>\n')
+    out.write('  <key id="domain" for="node" attr.name="domain" attr.type="string"/>\n')
+    out.write('  <key id="count" for="node" attr.name="count" attr.type="int"/>\n')
+    out.write('  <key id="weight" for="edge" attr.name="weight" attr.type="int"/>\n')
+    out.write('  <graph id="dependencies" edgedefault="directed">\n')
+    if summary:
+        members, edges = domain_summary(graph)
+        for domain, counts in members.items():
+            out.write(f"    <node id={quoteattr(domain)}>")
+            out.write('<data key="kind">domain</data>')
+            out.write(f'<data key="count">{sum(counts.values())}</data></node>\n')
+        for (source, target), weight in edges.items():
+            out.write(f"    <edge source={quoteattr(source)} target={quoteattr(target)}>")
+            out.write(f'<data key="weight">{weight}</data></edge>\n')
+    else:
+        for slug, kind in zip(graph.nodes, graph.kinds, strict=True):
+            out.write(f"    <node id={quoteattr(slug)}>")
+            out.write(f'<data key="kind">{escape(kind)}</data>')
+            out.write(f'<data key="domain">{escape(domain_of(slug))}</data></node>\n')
+        for source, target in iter_edges(graph):
+            out.write(f"    <edge source={quoteattr(source)} target={quoteattr(target)}/>\n")
+    out.write("  </graph>\n</graphml>\n")
+
+
+WRITERS: dict[str, Callable[..., None]] = {
+    "dot": write_dot,
+    "json": write_json,
+    "graphml": write_graphml,
+}
+
+
+def export_graph(
+    graph: DependencyGraph,
+    fmt: str,
+    out: TextIO,
+    summary: bool | None = None,
+    threshold: int = SUMMARY_EDGE_THRESHOLD,
+) -> bool:
+    """Write `graph` in `fmt`; summary=None decides by size. Returns whether a summary was written"""
+    if fmt not in WRITERS:
+        msg = f"Unknown export format: {fmt} (expected one of {', '.join(FORMATS)})"
+        raise ValueError(msg)
+    as_summary = use_summary(graph, threshold) if summary is None else summary
+    WRITERS[fmt](graph, out, summary=as_summary)
+    return as_summary
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Export the agent/skill dependency graph")
+    ap.add_argument("--graph", type=Path, default=None, help="Graph file (dependency_graph.py)")
+    ap.add_argument("--format", "-f", choices=FORMATS, default="dot")
+    ap.add_argument("--out", "-o", type=Path, default=None, help="Output file (default: stdout)")
+    view = ap.add_mutually_exclusive_group()
+    view.add_argument("--summary", action="store_true", default=None, help="Domain summary")
+    view.add_argument("--full", dest="summary", action="store_false", help="Every node and edge")
+    ap.set_defaults(summary=None)
+    ap.add_argument(
+        "--summary-threshold",
+        type=int,
+        default=SUMMARY_EDGE_THRESHOLD,
+        help=f"Edge count above which the summary is used (default: {SUMMARY_EDGE_THRESHOLD})",
+    )
+    args = ap.parse_args()
+
+    try:
+        graph = DependencyGraph.load(args.graph)
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}. Run dependency_graph.py build first.", file=sys.stderr)
+        return 2
+
+    if args.out is None:
+        export_graph(graph, args.format, sys.stdout, args.summary, args.summary_threshold)
+        return 0
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    # newline="\n" keeps the bytes identical across platforms
+    with args.out.open("w", encoding="utf-8", newline="\n") as out:
+        summary = export_graph(graph, args.format, out, args.summary, args.summary_threshold)
+    view_name = "summary" if summary else "full"
+    print(f"Wrote {args.out} ({args.format}, {view_name} view)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,9 @@ Initialize Anthropic Skills repo structure with .gitkeep files.
 - Optionally pre-creates skill skeleton folders under skills/<slug> with
   examples/, resources/, scripts/ and .gitkeep files.
 - Optionally adds arbitrary extra directories (relative, safe-checked).
+- Optionally generates a synthetic catalog of N skills and M agents (valid
+  front matter, every required section, index entries with dependencies,
+  agents index) for scale testing; output is reproducible from --seed.
 - Supports dry-run mode.
 
 Designed to pass common linting and security scans:
@@ -18,10 +21,14 @@ Designed to pass common linting and security scans:
 from __future__ import annotations
 
 import argparse
+import json
+import random
 import sys
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
+from lint_skill import REQUIRED_SECTIONS_ORDER
+
 DEFAULT_DIRS: list[str] = [
     "index",
     "index/embeddings",
@@ -38,6 +45,43 @@ SKILL_SUBDIRS: list[str] = [
     "scripts",
 ]
 
+AGENT_SECTIONS: list[str] = [
+    "## Purpose & When-To-Use",
+    "## System Prompt",
+    "## Tool Usage Guidelines",
+    "## Workflow Patterns",
+    "## Skills Integration",
+    "## Examples",
+    "## Quality Gates",
+    "## Resources",
+]
+
+# Vocabulary of the synthetic catalog; keywords follow a Zipf-like distribution
+# over SYNTHETIC_TOPICS (earlier topics are more popular), as real catalogs do.
+SYNTHETIC_DOMAINS: list[str] = [
+    "api", "cloud", "security", "testing", "database", "observability", "frontend",
+    "data", "compliance", "integration", "mobile", "devops", "ml", "cost", "incident",
+]  # fmt: skip
+SYNTHETIC_TOPICS: list[str] = [
+    "kubernetes", "terraform", "latency", "schema", "migration", "pipeline", "gateway",
+    "secrets", "logging", "tracing", "caching", "queue", "contract", "drift", "policy",
+    "backup", "replication", "sharding", "autoscaling", "encryption", "identity", "audit",
+    "budget", "rollout", "canary", "chaos", "fixtures", "mocking", "coverage", "profiling",
+    "indexing", "streaming", "batch", "serverless", "edge", "containers", "registry",
+    "dashboards", "alerts", "runbook", "postmortem", "accessibility", "localization",
+    "versioning", "pagination", "throttling", "webhooks", "graphql", "grpc", "oauth",
+    "rbac", "sbom", "vulnerability", "feature-flags", "retention", "anonymization",
+    "forecasting", "embeddings", "labeling", "notebooks",
+]  # fmt: skip
+SYNTHETIC_ACTIONS: list[str] = [
+    "validator", "designer", "generator", "analyzer", "architect", "optimizer",
+    "auditor", "planner", "scanner", "advisor",
+]  # fmt: skip
+SYNTHETIC_TOOLS: list[str] = ["Read", "Write", "Bash", "Grep", "Glob", "WebFetch"]
+ZIPF_EXPONENT = 1.1
+# Files are rendered and written this many skills/agents at a time
+SYNTHETIC_BATCH = 1000
+
 
 def _safe_join(root: Path, rel: str) -> Path:
     """
@@ -105,6 +149,292 @@ def _create_structure(
             _create_skill_skeleton(root, normalized, dry_run)
 
 
+def _zipf_weights(n: int) -> list[float]:
+    return [1.0 / (rank + 1) ** ZIPF_EXPONENT for rank in range(n)]
+
+
+def _unique_slug(base: str, taken: dict[str, int]) -> str:
+    """
+    base, then base-2, base-3, ... skipping every slug already in taken.
+
+    taken[base] is the last suffix tried for base; each returned slug is
+    added too, so a later run never reuses an earlier run's base-2.
+    """
+    count = taken.get(base, 0)
+    while True:
+        count += 1
+        slug = base if count == 1 else f"{base}-{count}"
+        if slug not in taken:
+            break
+    taken[base] = count
+    taken.setdefault(slug, 1)
+    return slug
+
+
+def _title(slug: str) -> str:
+    return " ".join(part.capitalize() for part in slug.split("-"))
+
+
+def _yaml_list(items: Iterable[str], indent: str = "  ") -> str:
+    return "\n".join(f"{indent}- {item}" for item in items)
+
+
+def _render_skill(
+    slug: str, domain: str, topic: str, action: str, keywords: list[str], deps: list[str]
+) -> tuple[str, str, dict[str, object]]:
+    """
+    Render (SKILL.md, example file, index entry) for one synthetic skill.
+    """
+    name = _title(slug)
+    subject = f"{topic.replace('-', ' ')} {domain}"
+    description = (
+        f"{action.capitalize()} for {subject} work: checks inputs, applies"
+        f" {keywords[0]} rules and emits a structured report."
+    )
+    links = [f"https://example.com/{domain}/{topic}", f"https://example.org/docs/{action}"]
+    sections = {
+        "## Purpose & When-To-Use": (
+            f"Use this skill to run the {action} workflow for {subject} tasks. "
+            f"It covers {', '.join(keywords)}."
+        ),
+        "## Pre-Checks": "- Inputs are present and parse\n- Target environment is reachable",
+        "## Procedure": (
+            f"**T1** (quick {action} pass, <=2k tokens): validate the {topic} input.\n\n"
+            f"**T2** (full {subject} review, <=6k tokens): apply every rule.\n\n"
+            "**T3** (deep dive, <=12k tokens): add remediation plans.\n\n"
+            f"```bash\n{action} --target ./{topic} --format json\n```"
+        ),
+        "## Decision Rules": "\n".join(
+            [f"- Escalate to T2 when the {topic} check finds errors"]
+            + [f"- Delegate shared steps to `{dep}`" for dep in deps]
+        ),
+        "## Output Contract": (
+            f'```json\n{{"skill": "{slug}", "status": "pass|fail", "findings": []}}\n```'
+        ),
+        "## Examples": (
+            f"```yaml\n# {name}\ninputs:\n  target: ./{topic}\n  tier: T1\n"
+            "expected:\n  status: pass\n```"
+        ),
+        "## Quality Gates": "- Output validates against the contract\n- Token budget respected",
+        "## Resources": "\n".join(f"- [{_title(url.rsplit('/', 1)[1])}]({url})" for url in links),
+    }
+    front = "\n".join(
+        [
+            "---",
+            f'name: "{name}"',
+            f"slug: {slug}",
+            f'description: "{description[:160]}"',
+            "capabilities:",
+            _yaml_list([f"{action}_{topic.replace('-', '_')}", "report_findings"]),
+            "inputs:",
+            "  target:",
+            "    type: string",
+            f'    description: "{subject} artifact to process"',
+            "    required: true",
+            "outputs:",
+            "  report:",
+            "    type: json",
+            '    description: "Structured findings"',
+            "keywords:",
+            _yaml_list(keywords),
+            'version: "1.0.0"',
+            'owner: "cognitive-toolworks"',
+            'license: "Apache-2.0"',
+            "security:",
+            '  pii: "none"',
+            '  secrets: "never embed"',
+            "links:",
+            _yaml_list(links),
+            "---",
+        ]
+    )
+    body = "\n\n".join(f"{heading}\n\n{sections[heading]}" for heading in REQUIRED_SECTIONS_ORDER)
+    example = f"# {name} example\ntarget: ./{topic}\ntier: T1\n"
+    entry: dict[str, object] = {
+        "slug": slug,
+        "name": name,
+        "summary": description[:160],
+        "category": domain,
+        "keywords": keywords,
+        "dependencies": deps,
+        "token_budget": "T2",
+        "owner": "cognitive-toolworks",
+        "version": "1.0.0",
+        "entry": f"/skills/{slug}/SKILL.md",
+    }
+    return f"{front}\n\n{body}\n", example, entry
+
+
+def _render_agent(
+    slug: str, domain: str, topic: str, skills: list[str]
+) -> tuple[str, dict[str, object]]:
+    """
+    Render (AGENT.md, agents-index entry) for one synthetic agent.
+    """
+    name = _title(slug)
+    description = (
+        f"Orchestrates {domain} {topic.replace('-', ' ')} workflows across {len(skills)} skills."
+    )
+    keywords = [domain, topic, "orchestration"]
+    sections = {
+        "## Purpose & When-To-Use": f"Invoke for multi-step {domain} work around {topic}.",
+        "## System Prompt": f"You coordinate {domain} specialists. Reference skills by slug only.",
+        "## Tool Usage Guidelines": "- Read before Write\n- Bash only for validation commands",
+        "## Workflow Patterns": "1. Gather inputs\n2. Run skills in order\n3. Merge findings",
+        "## Skills Integration": "\n".join(f"- `{skill}`" for skill in skills),
+        "## Examples": f"```text\nUser: review the {topic} setup\nAgent: runs `{skills[0]}`\n```",
+        "## Quality Gates": "- Every finding cites its skill",
+        "## Resources": f"- [{domain} docs](https://example.com/{domain})",
+    }
+    front = "\n".join(
+        [
+            "---",
+            f'name: "{name}"',
+            f'slug: "{slug}"',
+            f'description: "{description}"',
+            'model: "inherit"',
+            f"tools: {json.dumps(SYNTHETIC_TOOLS[:4])}",
+            'version: "1.0.0"',
+            'owner: "cognitive-toolworks"',
+            'license: "Apache-2.0"',
+            f"keywords: {json.dumps(keywords)}",
+            "---",
+        ]
+    )
+    body = "\n\n".join(f"{heading}\n\n{sections[heading]}" for heading in AGENT_SECTIONS)
+    entry: dict[str, object] = {
+        "slug": slug,
+        "name": name,
+        "description": description,
+        "keywords": keywords,
+        "model": "inherit",
+        "tools": SYNTHETIC_TOOLS[:4],
+        "version": "1.0.0",
+        "owner": "cognitive-toolworks",
+        "entry": f"agents/{slug}/AGENT.md",
+    }
+    return f"{front}\n\n{body}\n", entry
+
+
+def _iter_synthetic_skills(
+    n: int, rng: random.Random, taken: dict[str, int]
+) -> Iterator[tuple[str, str, str, str, dict[str, object]]]:
+    """
+    Yield (slug, domain, SKILL.md, example, index entry) for n skills.
+
+    Dependencies point at earlier skills, preferring the oldest ones
+    (preferential attachment), so the graph stays acyclic with popular hubs.
+    """
+    topic_weights = _zipf_weights(len(SYNTHETIC_TOPICS))
+    slugs: list[str] = []
+    for _ in range(n):
+        domain = rng.choice(SYNTHETIC_DOMAINS)
+        topic, *extra = rng.choices(SYNTHETIC_TOPICS, topic_weights, k=4)
+        action = rng.choice(SYNTHETIC_ACTIONS)
+        slug = _unique_slug(f"{domain}-{topic}-{action}", taken)
+        keywords = list(dict.fromkeys([topic, domain, action, *extra]))
+        deps = (
+            sorted({slugs[int(len(slugs) * rng.random() ** 2)] for _ in range(rng.randint(0, 3))})
+            if slugs
+            else []
+        )
+        skill_md, example, entry = _render_skill(slug, domain, topic, action, keywords, deps)
+        slugs.append(slug)
+        yield slug, domain, skill_md, example, entry
+
+
+def _existing_slugs(directory: Path) -> dict[str, int]:
+    """
+    Names already present, so synthetic ones never overwrite real skills or agents.
+    """
+    if not directory.is_dir():
+        return {}
+    return {p.name: 1 for p in directory.iterdir()}
+
+
+def _write_batch(files: list[tuple[Path, str]], dry_run: bool, keep_existing: bool = False) -> None:
+    """
+    Write a batch of rendered files, creating each directory once.
+
+    With keep_existing, files that already exist are left untouched.
+    """
+    if dry_run:
+        return
+    for directory in sorted({path.parent for path, _ in files}):
+        directory.mkdir(parents=True, exist_ok=True)
+    mode = "x" if keep_existing else "w"
+    for path, text in files:
+        try:
+            with path.open(mode, encoding="utf-8", newline="\n") as f:
+                f.write(text)
+        except FileExistsError:
+            continue
+
+
+def generate_synthetic_catalog(
+    root: Path, n_skills: int, n_agents: int, seed: int = 0, dry_run: bool = False
+) -> tuple[list[str], list[str]]:
+    """
+    Generate n_skills skills and n_agents agents under root; returns their slugs.
+
+    Each skill gets SKILL.md (valid front matter, every required section,
+    code blocks, links), an example and index-entry.json with dependencies;
+    each agent gets AGENT.md referencing 3-12 skills, mostly from its own
+    domain. Existing skills and agents are never overwritten, and
+    index/agents-index.json keeps existing agents and adds the new ones.
+    The same seed on the same starting tree produces byte-identical files.
+    """
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data, not security
+    skills_dir = _safe_join(root, "skills")
+    skill_slugs: list[str] = []
+    by_domain: dict[str, list[str]] = {}
+    batch: list[tuple[Path, str]] = []
+    synthetic = _iter_synthetic_skills(n_skills, rng, _existing_slugs(skills_dir))
+    for slug, domain, skill_md, example, entry in synthetic:
+        base = skills_dir / slug
+        batch.append((base / "SKILL.md", skill_md))
+        batch.append((base / "examples" / "example.yaml", example))
+        batch.append((base / "index-entry.json", json.dumps(entry, indent=2) + "\n"))
+        skill_slugs.append(slug)
+        by_domain.setdefault(domain, []).append(slug)
+        if len(batch) >= 3 * SYNTHETIC_BATCH:
+            _write_batch(batch, dry_run, keep_existing=True)
+            batch = []
+    _write_batch(batch, dry_run, keep_existing=True)
+
+    agent_slugs: list[str] = []
+    agent_entries: list[dict[str, object]] = []
+    batch = []
+    agents_dir = _safe_join(root, "agents")
+    taken = _existing_slugs(agents_dir)
+    for _ in range(n_agents if skill_slugs else 0):
+        domain = rng.choice(sorted(by_domain))
+        topic = rng.choice(SYNTHETIC_TOPICS)
+        slug = _unique_slug(f"{domain}-{topic}-orchestrator", taken)
+        local = by_domain[domain]
+        count = rng.randint(3, 12)
+        picks = rng.sample(local, min(len(local), count - count // 4))
+        picks += rng.sample(skill_slugs, min(len(skill_slugs), count // 4))
+        agent_md, entry = _render_agent(slug, domain, topic, sorted(set(picks)))
+        batch.append((agents_dir / slug / "AGENT.md", agent_md))
+        agent_slugs.append(slug)
+        agent_entries.append(entry)
+        if len(batch) >= SYNTHETIC_BATCH:
+            _write_batch(batch, dry_run, keep_existing=True)
+            batch = []
+    _write_batch(batch, dry_run, keep_existing=True)
+
+    if agent_entries:
+        index_path = _safe_join(root, "index/agents-index.json")
+        existing: list[dict[str, object]] = []
+        if index_path.exists():
+            existing = json.loads(index_path.read_text(encoding="utf-8"))
+        new = set(agent_slugs)
+        merged = [a for a in existing if a.get("slug") not in new] + agent_entries
+        _write_batch([(index_path, json.dumps(merged, indent=2) + "\n")], dry_run)
+    return skill_slugs, agent_slugs
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Initialize Skills repository folder structure with .gitkeep files."
@@ -136,6 +466,24 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         action="store_true",
         help="Print actions without writing to disk.",
     )
+    parser.add_argument(
+        "--synthetic-skills",
+        type=int,
+        default=0,
+        help="Generate N synthetic skills under skills/ for scale testing.",
+    )
+    parser.add_argument(
+        "--synthetic-agents",
+        type=int,
+        default=0,
+        help="Generate M synthetic agents under agents/ referencing the synthetic skills.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for the synthetic catalog (default: 0).",
+    )
     return parser.parse_args(argv)
 
 
@@ -174,6 +522,12 @@ def main(argv: list[str]) -> int:
 
     try:
         _create_structure(root, dirs, skills_list, args.dry_run)
+        if args.synthetic_skills > 0:
+            skill_slugs, agent_slugs = generate_synthetic_catalog(
+                root, args.synthetic_skills, args.synthetic_agents, args.seed, args.dry_run
+            )
+            verb = "Would generate" if args.dry_run else "Generated"
+            print(f"{verb} {len(skill_slugs)} synthetic skills and {len(agent_slugs)} agents.")
     except ValueError as ve:
         print(f"ERROR: {ve}", file=sys.stderr)
         return 1
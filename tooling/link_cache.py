@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Persistent link-status cache for lint_skill.py --validate-links
+SQLite table of URL -> last result, check time and HTTP validators; fresh
+entries are replayed, expired ones are revalidated conditionally, and offline
+runs report from the cache alone
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from link_checker import LinkChecker, LinkResult
+
+DEFAULT_CACHE_NAME = "links.sqlite"
+DEFAULT_TTL_HOURS = 7 * 24.0
+DEFAULT_BAD_TTL_HOURS = 24.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    url TEXT PRIMARY KEY,
+    ok INTEGER NOT NULL,
+    status INTEGER,
+    error TEXT,
+    final_url TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    checked_at REAL NOT NULL
+);
+"""
+
+
+class LinkCache:
+    """URL status store with separate lifetimes for good and bad results"""
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        bad_ttl_hours: float = DEFAULT_BAD_TTL_HOURS,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.bad_ttl = bad_ttl_hours * 3600
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def get(self, url: str) -> tuple[LinkResult, float] | None:
+        """Cached (result, checked_at) for `url`, regardless of age"""
+        row = self.conn.execute(
+            "SELECT ok, status, error, final_url, etag, last_modified, checked_at"
+            " FROM links WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        ok, status, error, final_url, etag, last_modified, checked_at = row
+        return LinkResult(url, bool(ok), error, status, final_url, etag, last_modified), checked_at
+
+    def is_fresh(self, result: LinkResult, checked_at: float, now: float | None = None) -> bool:
+        age = (time.time() if now is None else now) - checked_at
+        return age < (self.ttl if result.ok else self.bad_ttl)
+
+    def put_many(self, results: Iterable[LinkResult], checked_at: float | None = None) -> None:
+        stamp = time.time() if checked_at is None else checked_at
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO links VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        r.url,
+                        int(r.ok),
+                        r.status,
+                        r.error,
+                        r.final_url,
+                        r.etag,
+                        r.last_modified,
+                        stamp,
+                    )
+                    for r in results
+                ],
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def conditional_headers(result: LinkResult) -> dict[str, str]:
+    """Revalidation headers from a previous good result"""
+    headers: dict[str, str] = {}
+    if result.ok and result.etag:
+        headers["If-None-Match"] = result.etag
+    if result.ok and result.last_modified:
+        headers["If-Modified-Since"] = result.last_modified
+    return headers
+
+
+def check_links_cached(
+    urls: Iterable[str],
+    checker: LinkChecker | None,
+    cache: LinkCache,
+    offline: bool = False,
+) -> dict[str, LinkResult]:
+    """
+    Results for `urls`, touching the network only for new or expired entries
+
+    Expired good results are revalidated with their ETag/Last-Modified. In
+    offline mode (or with no checker) nothing is fetched: cached results are
+    reported whatever their age and unknown URLs are left out.
+    """
+    results: dict[str, LinkResult] = {}
+    to_check: list[str] = []
+    validators: dict[str, dict[str, str]] = {}
+    now = time.time()
+    for url in dict.fromkeys(urls):
+        cached = cache.get(url)
+        if cached is not None and (offline or checker is None or cache.is_fresh(*cached, now)):
+            results[url] = cached[0]
+            continue
+        if offline or checker is None:
+            continue
+        to_check.append(url)
+        if cached is not None:
+            validators[url] = conditional_headers(cached[0])
+
+    if to_check and checker is not None:
+        fetched = checker.check_many(to_check, validators)
+        cache.put_many(fetched.values())
+        results.update(fetched)
+    return results
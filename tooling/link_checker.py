@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Concurrent external link checker
+Deduplicates URLs across files, keeps one pool of keep-alive connections per
+host, and caps per-host concurrency and request rate so a full catalog run
+stays polite while finishing in roughly the time of the slowest host
+"""
+
+from __future__ import annotations
+
+import http.client
+import socket
+import ssl
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = "SkillLinter/1.0"
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Servers that refuse HEAD commonly answer with one of these
+HEAD_REJECTED_STATUSES = {403, 405, 501}
+
+
+@dataclass(frozen=True)
+class LinkResult:
+    url: str
+    ok: bool
+    error: str | None = None
+    status: int | None = None
+    final_url: str | None = None  # after redirects
+    # Validators for conditional revalidation (If-None-Match / If-Modified-Since)
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class _Host:
+    """Idle keep-alive connections, a concurrency cap and a rate limit for one host"""
+
+    def __init__(self, max_connections: int, min_interval: float) -> None:
+        self.slots = threading.BoundedSemaphore(max_connections)
+        self.idle: list[http.client.HTTPConnection] = []
+        self.lock = threading.Lock()
+        self.min_interval = min_interval
+        self.next_start = 0.0
+
+    def wait_turn(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class LinkChecker:
+    """
+    Check HTTP(S) links from a thread pool
+
+    Each request tries HEAD first and falls back to GET with `Range: bytes=0-0`
+    when the server rejects HEAD. Redirects are followed up to max_redirects.
+    """
+
+    def __init__(
+        self,
+        workers: int = 16,
+        per_host: int = 2,
+        min_interval: float = 0.1,
+        timeout: float = 5.0,
+        max_redirects: int = 5,
+        user_agent: str = USER_AGENT,
+    ) -> None:
+        self.workers = workers
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.user_agent = user_agent
+        self._hosts: dict[tuple[str, str], _Host] = {}
+        self._hosts_lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+
+    def _host(self, scheme: str, netloc: str) -> _Host:
+        with self._hosts_lock:
+            host = self._hosts.get((scheme, netloc))
+            if host is None:
+                host = self._hosts[(scheme, netloc)] = _Host(self.per_host, self.min_interval)
+            return host
+
+    def _connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        if scheme == "https":
+            return http.client.HTTPSConnection(
+                netloc, timeout=self.timeout, context=self._ssl_context
+            )
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def _request(
+        self, url: str, method: str, extra_headers: dict[str, str] | None = None
+    ) -> http.client.HTTPResponse:
+        """One request over a pooled connection; returns the drained response"""
+        parts = urlsplit(url)
+        scheme, netloc = parts.scheme.lower(), parts.netloc
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        headers = {"User-Agent": self.user_agent, "Accept": "*/*", **(extra_headers or {})}
+
+        host = self._host(scheme, netloc)
+        with host.slots:
+            host.wait_turn()
+            fresh = False
+            while True:
+                conn = None
+                if not fresh:
+                    with host.lock:
+                        conn = host.idle.pop() if host.idle else None
+                reused = conn is not None
+                if conn is None:
+                    conn = self._connect(scheme, netloc)
+                try:
+                    conn.request(method, target, headers=headers)
+                    response = conn.getresponse()
+                    # Drain (HEAD and Range GET bodies are tiny) so the connection can be reused
+                    response.read()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    if reused:
+                        fresh = True  # Stale keep-alive connection: retry on a new one
+                        continue
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+                if response.will_close:
+                    conn.close()
+                else:
+                    with host.lock:
+                        host.idle.append(conn)
+                return response
+
+    def check(self, url: str, validators: dict[str, str] | None = None) -> LinkResult:
+        """
+        Check one URL, following redirects
+
+        `validators` are conditional request headers from an earlier check
+        (If-None-Match / If-Modified-Since); a 304 answer counts as reachable.
+        """
+        current = url
+        conditional = validators or {}
+        try:
+            for _ in range(self.max_redirects + 1):
+                parts = urlsplit(current)
+                if parts.scheme.lower() not in {"http", "https"} or not parts.netloc:
+                    return LinkResult(url, False, "Invalid URL format")
+
+                response = self._request(current, "HEAD", conditional)
+                if response.status in HEAD_REJECTED_STATUSES:
+                    ranged = {**conditional, "Range": "bytes=0-0"}
+                    response = self._request(current, "GET", ranged)
+                status, location = response.status, response.getheader("Location")
+                if status in REDIRECT_STATUSES and location:
+                    current = urljoin(current, location)
+                    continue
+                etag = response.getheader("ETag") or conditional.get("If-None-Match")
+                last_modified = response.getheader("Last-Modified") or conditional.get(
+                    "If-Modified-Since"
+                )
+                if status < 400:
+                    return LinkResult(url, True, None, status, current, etag, last_modified)
+                return LinkResult(url, False, f"HTTP {status}", status, current)
+            return LinkResult(url, False, f"Too many redirects (>{self.max_redirects})")
+        except (socket.gaierror, ConnectionRefusedError) as e:
+            return LinkResult(url, False, f"URL error: {e}")
+        except TimeoutError:
+            return LinkResult(url, False, "URL error: timed out")
+        except Exception as e:
+            return LinkResult(url, False, f"Error: {str(e)[:50]}")
+
+    def check_many(
+        self, urls: Iterable[str], validators: dict[str, dict[str, str]] | None = None
+    ) -> dict[str, LinkResult]:
+        """Check each distinct URL once; results keyed by URL in first-seen order"""
+        unique = list(dict.fromkeys(urls))
+        if not unique:
+            return {}
+        # Interleave hosts so the pool is not stuck behind one host's concurrency cap
+        by_host: dict[str, list[str]] = defaultdict(list)
+        for url in unique:
+            by_host[urlsplit(url).netloc].append(url)
+        order: list[str] = []
+        queues = list(by_host.values())
+        for i in range(max(len(q) for q in queues)):
+            order.extend(q[i] for q in queues if i < len(q))
+
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as pool:
+            futures = [pool.submit(self.check, url, (validators or {}).get(url)) for url in order]
+            results = {url: f.result() for url, f in zip(order, futures, strict=True)}
+        return {url: results[url] for url in unique}
+
+    def close(self) -> None:
+        """Close idle keep-alive connections"""
+        with self._hosts_lock:
+            hosts = list(self._hosts.values())
+        for host in hosts:
+            with host.lock:
+                for conn in host.idle:
+                    conn.close()
+                host.idle.clear()
@@ -6,23 +6,37 @@ Checks:
 - Code fences are properly closed
 - External links are valid (HTTP status check)
 """
+
 from __future__ import annotations
 
 import argparse
-import re
 import sys
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
-
-try:
-    import yaml  # type: ignore[import-untyped,unused-ignore]
-except Exception:  # pragma: no cover
-    yaml = None  # type: ignore[assignment]
 
-FRONT_MATTER_DELIM = re.compile(r"^---\s*$")
+from link_cache import (
+    DEFAULT_BAD_TTL_HOURS,
+    DEFAULT_CACHE_NAME,
+    DEFAULT_TTL_HOURS,
+    LinkCache,
+    check_links_cached,
+)
+from link_checker import LinkChecker, LinkResult
+from result_cache import CACHE_DIR_NAME, ResultCache, tool_fingerprint
+from skill_document import load_document
+from skill_rules import (
+    FENCE_CLOSE,
+    FENCE_OPEN,
+    HEADING,
+    LineEvent,
+    LinkCollector,
+    Rule,
+    RuleIssue,
+    run_events,
+    run_rules,
+    split_front_matter,
+)
 
 # Required body sections in exact order per CLAUDE.md §3
 REQUIRED_SECTIONS_ORDER = [
@@ -36,6 +50,9 @@ REQUIRED_SECTIONS_ORDER = [
     "## Resources",
 ]
 
+# Modules whose source changes invalidate cached lint results
+CACHE_MODULES = ["lint_skill", "skill_document", "skill_rules"]
+
 
 @dataclass
 class LintIssue:
@@ -50,180 +67,178 @@ def read_text(p: Path) -> str:
 
 def extract_body(md_text: str) -> str:
     """Extract body text after front matter."""
-    lines = md_text.splitlines()
-    if not lines or not FRONT_MATTER_DELIM.match(lines[0]):
-        return md_text  # No front matter, return as-is
+    fm_lines, body_lines, _ = split_front_matter(md_text.splitlines())
+    if fm_lines is None:
+        return md_text  # No (or unclosed) front matter, return as-is
+    return "\n".join(body_lines)
+
+
+def body_lines(md_text: str) -> Iterator[str]:
+    """Body lines after front matter (the whole file if there is none)."""
+    _, lines, _ = split_front_matter(md_text.splitlines())
+    return lines
+
+
+class HeadingOrderRule(Rule):
+    """Required sections appear in REQUIRED_SECTIONS_ORDER; missing ones are warnings."""
+
+    kinds = frozenset({HEADING})
+
+    def __init__(self, order: list[str] = REQUIRED_SECTIONS_ORDER) -> None:
+        self.order = order
+        self.positions = {h: i for i, h in enumerate(order)}
+        self.expected_idx = 0
+        self.found: set[str] = set()
+        self.issues: list[RuleIssue] = []
+
+    def visit(self, event: LineEvent) -> None:
+        if event.level != 2:
+            return
+        heading = event.text
+        self.found.add(heading)
+        actual_idx = self.positions.get(heading)
+        if actual_idx is None:
+            return  # Heading not in required list, skip
+        if actual_idx < self.expected_idx:
+            previous = self.order[self.expected_idx - 1] if self.expected_idx > 0 else "start"
+            self.issues.append(
+                RuleIssue(f"Heading '{heading}' appears out of order (expected after '{previous}')")
+            )
+        self.expected_idx = max(self.expected_idx, actual_idx + 1)
 
-    # Find closing '---'
-    end_idx = None
-    for i in range(1, len(lines)):
-        if FRONT_MATTER_DELIM.match(lines[i]):
-            end_idx = i
-            break
+    def finish(self) -> list[RuleIssue]:
+        missing = [
+            RuleIssue(f"Missing required section: {required}", severity="WARN")
+            for required in self.order
+            if required not in self.found
+        ]
+        return self.issues + missing
 
-    if end_idx is None:
-        return md_text
 
-    return "\n".join(lines[end_idx + 1 :])
+class CodeFenceRule(Rule):
+    """Every code fence is closed."""
 
+    kinds = frozenset({FENCE_OPEN, FENCE_CLOSE})
 
-def check_heading_order(body: str, path: Path) -> list[LintIssue]:
-    """Verify required sections appear in the correct order."""
-    issues: list[LintIssue] = []
+    def __init__(self) -> None:
+        self.open_line: int | None = None
 
-    # Find all h2 headings
-    h2_pattern = re.compile(r"^## (.+)$", re.MULTILINE)
-    found_headings = [m.group(0) for m in h2_pattern.finditer(body)]
+    def visit(self, event: LineEvent) -> None:
+        self.open_line = event.lineno if event.kind == FENCE_OPEN else None
 
-    # Extract only the required headings in order they appear
-    required_found = [h for h in found_headings if h in REQUIRED_SECTIONS_ORDER]
-
-    # Check if they appear in the correct order
-    expected_idx = 0
-    for heading in required_found:
-        try:
-            actual_idx = REQUIRED_SECTIONS_ORDER.index(heading)
-            if actual_idx < expected_idx:
-                issues.append(
-                    LintIssue(
-                        path,
-                        f"Heading '{heading}' appears out of order (expected after '{REQUIRED_SECTIONS_ORDER[expected_idx - 1] if expected_idx > 0 else 'start'}')",
-                    )
-                )
-            expected_idx = max(expected_idx, actual_idx + 1)
-        except ValueError:
-            pass  # Heading not in required list, skip
+    def finish(self) -> list[RuleIssue]:
+        if self.open_line is None:
+            return []
+        return [RuleIssue(f"Unclosed code fence starting at line {self.open_line}")]
 
-    # Check for missing required sections
-    for required in REQUIRED_SECTIONS_ORDER:
-        if required not in found_headings:
-            issues.append(
-                LintIssue(
-                    path,
-                    f"Missing required section: {required}",
-                    severity="WARN",
-                )
-            )
 
-    return issues
+def check_heading_order(body: str, path: Path) -> list[LintIssue]:
+    """Verify required sections appear in the correct order."""
+    return _lint_issues(path, run_rules(body.splitlines(), [HeadingOrderRule()]))
 
 
 def check_code_fences(body: str, path: Path) -> list[LintIssue]:
     """Verify all code fences are properly closed."""
-    issues: list[LintIssue] = []
-    fence_pattern = re.compile(r"^```")
-    lines = body.splitlines()
-
-    open_line: int | None = None
-    for i, line in enumerate(lines, start=1):
-        if fence_pattern.match(line):
-            open_line = i if open_line is None else None
-
-    if open_line is not None:
-        issues.append(
-            LintIssue(
-                path,
-                f"Unclosed code fence starting at line {open_line}",
-            )
-        )
-
-    return issues
+    return _lint_issues(path, run_rules(body.splitlines(), [CodeFenceRule()]))
 
 
 def extract_links(body: str) -> list[str]:
     """Extract all HTTP(S) URLs from markdown."""
-    # Match markdown links [text](url) and bare URLs
-    md_link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
-    bare_url_pattern = re.compile(r'https?://[^\s<>"\)]+')
-
-    urls = []
+    collector = LinkCollector()
+    run_rules(body.splitlines(), [collector])
+    return list(collector.urls)
 
-    # Extract from markdown links
-    for match in md_link_pattern.finditer(body):
-        url = match.group(2)
-        if url.startswith(("http://", "https://")):
-            urls.append(url)
 
-    # Extract bare URLs (not already in markdown links)
-    body_no_md = md_link_pattern.sub("", body)
-    for match in bare_url_pattern.finditer(body_no_md):
-        urls.append(match.group(0))
-
-    return list(set(urls))  # Deduplicate
+def _lint_issues(path: Path, issues: list[RuleIssue]) -> list[LintIssue]:
+    return [LintIssue(path, i.message, severity=i.severity) for i in issues]
 
 
 def check_link_validity(url: str, timeout: int = 5) -> tuple[bool, str | None]:
     """Check if URL is accessible. Returns (is_valid, error_message)."""
+    # Skip fragment-only or anchor links
+    if url.startswith("#"):
+        return True, None
+    checker = LinkChecker(workers=1, timeout=timeout)
     try:
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            return False, "Invalid URL format"
-
-        # Skip fragment-only or anchor links
-        if url.startswith("#"):
-            return True, None
-
-        # Make HEAD request to check accessibility
-        # S310: URL validation is intentional for link checking; URLs from skill docs
-        req = Request(url, method="HEAD")  # noqa: S310
-        req.add_header("User-Agent", "SkillLinter/1.0")
-
-        with urlopen(req, timeout=timeout) as response:  # noqa: S310
-            if response.status < 400:
-                return True, None
-            return False, f"HTTP {response.status}"
-
-    except HTTPError as e:
-        return False, f"HTTP {e.code}"
-    except URLError as e:
-        return False, f"URL error: {e.reason}"
-    except Exception as e:
-        return False, f"Error: {str(e)[:50]}"
+        result = checker.check(url)
+    finally:
+        checker.close()
+    return result.ok, result.error
 
 
 def check_links(body: str, path: Path, validate: bool = False) -> list[LintIssue]:
     """Check external links. If validate=True, perform HTTP checks."""
+    return _check_urls(extract_links(body), path, validate)
+
+
+def _check_urls(urls: list[str], path: Path, validate: bool) -> list[LintIssue]:
+    if not validate or not urls:
+        return []
+    checker = LinkChecker()
+    try:
+        return link_issues(urls, path, checker.check_many(urls))
+    finally:
+        checker.close()
+
+
+def link_issues(urls: list[str], path: Path, results: dict[str, LinkResult]) -> list[LintIssue]:
+    """Broken-link warnings for `urls` of one file from shared check results."""
     issues: list[LintIssue] = []
-    urls = extract_links(body)
-
-    if not urls:
-        return issues
-
-    if validate:
-        for url in urls:
-            is_valid, error = check_link_validity(url)
-            if not is_valid:
-                issues.append(
-                    LintIssue(
-                        path,
-                        f"Broken link '{url}': {error}",
-                        severity="WARN",
-                    )
+    for url in urls:
+        result = results.get(url)
+        if result is not None and not result.ok:
+            issues.append(
+                LintIssue(
+                    path,
+                    f"Broken link '{url}': {result.error}",
+                    severity="WARN",
                 )
-
+            )
     return issues
 
 
+# Body rules in reporting order; each file gets fresh instances
+LINT_RULES: list[type[Rule]] = [HeadingOrderRule, CodeFenceRule]
+
+
 def lint_skill_file(path: Path, validate_links: bool = False) -> list[LintIssue]:
     """Run all lint checks on a SKILL.md file."""
-    issues: list[LintIssue] = []
+    issues, urls = lint_document(path)
+    issues.extend(_check_urls(urls, path, validate_links))
+    return issues
+
 
+def lint_document(path: Path) -> tuple[list[LintIssue], list[str]]:
+    """Offline checks for one file: (issues, external URLs to validate)."""
     try:
-        content = read_text(path)
-        body = extract_body(content)
+        doc = load_document(path)
+        events = doc.events
     except Exception as e:
-        issues.append(LintIssue(path, f"Failed to read file: {e}"))
-        return issues
+        return [LintIssue(path, f"Failed to read file: {e}")], []
 
-    # Run checks
-    issues.extend(check_heading_order(body, path))
-    issues.extend(check_code_fences(body, path))
-    issues.extend(check_links(body, path, validate=validate_links))
+    # Heading order and code fences share the document's tokenized events
+    issues = _lint_issues(path, run_events(events, [r() for r in LINT_RULES]))
+    return issues, doc.links
 
-    return issues
 
+def lint_cached(path: Path, cache: ResultCache | None) -> tuple[list[LintIssue], list[str]]:
+    """lint_document() that replays results from `cache` when the file is unchanged.
+
+    Link validation depends on remote state, so only the URL list is cached.
+    """
+    stored = cache.get(str(path), [path]) if cache is not None else None
+    if stored is not None:
+        issues = [LintIssue(path, m, severity=sev) for m, sev in stored["issues"]]
+        urls: list[str] = stored["urls"]
+    else:
+        issues, urls = lint_document(path)
+        if cache is not None:
+            result = {"issues": [[i.message, i.severity] for i in issues], "urls": urls}
+            cache.put(str(path), [path], result)
+    return issues, urls
 
-def main() -> int:
+
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Lint SKILL.md files for style consistency")
     ap.add_argument(
         "--root",
@@ -236,7 +251,53 @@ def main() -> int:
         action="store_true",
         help="Perform HTTP validation of external links (slow)",
     )
-    args = ap.parse_args()
+    ap.add_argument(
+        "--link-workers",
+        type=int,
+        default=16,
+        help="Concurrent link checks (default: 16)",
+    )
+    ap.add_argument(
+        "--per-host",
+        type=int,
+        default=2,
+        help="Concurrent connections per host (default: 2)",
+    )
+    ap.add_argument(
+        "--link-cache",
+        type=Path,
+        default=None,
+        help=f"Link status cache (default: <cache dir>/{DEFAULT_CACHE_NAME}; off with --no-cache)",
+    )
+    ap.add_argument(
+        "--link-ttl",
+        type=float,
+        default=DEFAULT_TTL_HOURS,
+        help=f"Hours a working link stays cached (default: {DEFAULT_TTL_HOURS:g})",
+    )
+    ap.add_argument(
+        "--link-bad-ttl",
+        type=float,
+        default=DEFAULT_BAD_TTL_HOURS,
+        help=f"Hours a broken link stays cached (default: {DEFAULT_BAD_TTL_HOURS:g})",
+    )
+    ap.add_argument(
+        "--offline",
+        action="store_true",
+        help="Report link status from the cache only (implies --validate-links)",
+    )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-lint every file instead of replaying cached results",
+    )
+    ap.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=f"Result cache directory (default: <root>/{CACHE_DIR_NAME})",
+    )
+    args = ap.parse_args(argv)
 
     root: Path = args.root.resolve()
     skills_dir = root / "skills"
@@ -250,9 +311,47 @@ def main() -> int:
         print("No skills found.")
         return 0
 
+    if args.offline and args.no_cache:
+        print("ERROR: --offline needs the link cache (drop --no-cache)", file=sys.stderr)
+        return 2
+
+    cache_dir: Path = args.cache_dir or (root / CACHE_DIR_NAME)
+    cache = None
+    if not args.no_cache:
+        cache = ResultCache(cache_dir / "lint.json", tool_fingerprint(CACHE_MODULES))
+
+    documents = [(p, *lint_cached(p, cache)) for p in md_files]
+    if cache is not None:
+        cache.save()
+
+    # Check every distinct URL once across all files
+    link_results: dict[str, LinkResult] = {}
+    if args.validate_links or args.offline:
+        all_urls = [url for _, _, urls in documents for url in urls]
+        checker = None
+        if not args.offline:
+            checker = LinkChecker(workers=args.link_workers, per_host=args.per_host)
+        link_cache = None
+        if not args.no_cache:
+            link_cache = LinkCache(
+                args.link_cache or (cache_dir / DEFAULT_CACHE_NAME),
+                ttl_hours=args.link_ttl,
+                bad_ttl_hours=args.link_bad_ttl,
+            )
+        try:
+            if link_cache is not None:
+                link_results = check_links_cached(all_urls, checker, link_cache, args.offline)
+            elif checker is not None:
+                link_results = checker.check_many(all_urls)
+        finally:
+            if checker is not None:
+                checker.close()
+            if link_cache is not None:
+                link_cache.close()
+
     total_issues: list[LintIssue] = []
-    for p in md_files:
-        issues = lint_skill_file(p, validate_links=args.validate_links)
+    for p, file_issues, urls in documents:
+        issues = file_issues + link_issues(urls, p, link_results)
         if issues:
             for issue in issues:
                 prefix = "[WARN]" if issue.severity == "WARN" else "[FAIL]"
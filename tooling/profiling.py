@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling, tracing and memory reporting for the tooling scripts
+add_profiling_args() adds --profile (cProfile stats file), --trace (nested
+timing spans as Chrome trace JSON, viewable in chrome://tracing or Perfetto)
+and --memprofile (tracemalloc peak and top allocation sites); profiled(args)
+turns on whichever were requested around a command. Code marks its phases
+with `with span("yaml load"):`; with no trace running span() returns a shared
+no-op context manager, so instrumented code costs one list check
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any
+
+# Rows printed for the --profile summary and the --memprofile report
+PROFILE_TOP = 20
+MEMPROFILE_TOP = 10
+# Stack depth tracemalloc records per allocation (1 = just the allocating line)
+MEMPROFILE_FRAMES = 1
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Records completed spans as Chrome trace "X" (complete) events"""
+
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+        self.pid = os.getpid()
+        self._origin = time.perf_counter_ns()
+
+    @contextmanager
+    def span(self, name: str, args: dict[str, Any]) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": (start - self._origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            # list.append is atomic, so worker threads can record spans too
+            self.events.append(event)
+
+    def to_json(self) -> dict[str, Any]:
+        process = {
+            "name": "process_name",
+            "ph": "M",
+            "pid": self.pid,
+            "args": {"name": Path(sys.argv[0]).name or "python"},
+        }
+        return {"traceEvents": [process, *self.events], "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_json()) + "\n", encoding="utf-8")
+
+
+# Active tracers, innermost last; span() records into the last one
+_tracers: list[Tracer] = []
+
+
+def span(name: str, **args: Any) -> Any:
+    """Context manager timing `name` in the active trace; a no-op when not tracing"""
+    if not _tracers:
+        return _NULL_SPAN
+    return _tracers[-1].span(name, args)
+
+
+@contextmanager
+def tracing() -> Iterator[Tracer]:
+    """Record span() calls into a fresh Tracer until the block exits"""
+    tracer = Tracer()
+    _tracers.append(tracer)
+    try:
+        yield tracer
+    finally:
+        _tracers.remove(tracer)
+
+
+def add_profiling_args(ap: argparse.ArgumentParser) -> None:
+    group = ap.add_argument_group("profiling")
+    group.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Write cProfile stats to PATH (pstats/snakeviz) and print the top functions",
+    )
+    group.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Write timing spans to PATH as Chrome trace JSON (worker processes not included)",
+    )
+    group.add_argument(
+        "--memprofile",
+        action="store_true",
+        help="Report peak traced memory and the top allocation sites (slows the run)",
+    )
+
+
+@contextmanager
+def profiled(args: argparse.Namespace) -> Iterator[None]:
+    """Run the block under whatever add_profiling_args() options were given"""
+    with profiling_session(
+        getattr(args, "profile", None),
+        getattr(args, "trace", None),
+        getattr(args, "memprofile", False),
+    ):
+        yield
+
+
+@contextmanager
+def profiling_session(
+    profile: Path | None = None, trace: Path | None = None, memprofile: bool = False
+) -> Iterator[None]:
+    """
+    Profile, trace and/or memory-profile the block; reports go to stderr
+
+    Outputs are written even when the block raises (including SystemExit).
+    """
+    if profile is None and trace is None and not memprofile:
+        yield
+        return
+
+    profiler = None
+    if profile is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    with tracing() if trace is not None else nullcontext() as tracer:
+        if memprofile:
+            tracemalloc.start(MEMPROFILE_FRAMES)
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            if memprofile:
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                report_memory(snapshot, peak)
+            if tracer is not None and trace is not None:
+                tracer.write(trace)
+                print(f"Wrote {len(tracer.events)} trace span(s) to {trace}", file=sys.stderr)
+            if profiler is not None and profile is not None:
+                report_profile(profiler, profile)
+
+
+def report_profile(profiler: Any, path: Path) -> None:
+    import pstats
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(str(path))
+    print(
+        f"\nWrote cProfile stats to {path}; top {PROFILE_TOP} by cumulative time:", file=sys.stderr
+    )
+    pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(PROFILE_TOP)
+
+
+def report_memory(snapshot: Any, peak: int, top: int = MEMPROFILE_TOP) -> None:
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+    stats = snapshot.statistics("lineno")
+    print(f"\nPeak traced memory: {format_bytes(peak)}", file=sys.stderr)
+    print(f"Top {min(top, len(stats))} allocation site(s) still held at exit:", file=sys.stderr)
+    for stat in stats[:top]:
+        frame = stat.traceback[0]
+        print(
+            f"  {format_bytes(stat.size):>10}  {stat.count:>8} block(s)  "
+            f"{frame.filename}:{frame.lineno}",
+            file=sys.stderr,
+        )
+
+
+def format_bytes(n: int) -> str:
+    return f"{n / (1 << 20):.1f} MiB" if n >= 1 << 20 else f"{n / 1024:.1f} KiB"
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Routing query log and streaming demand analytics
+QueryLogWriter appends one JSON line per SkillRouter.route() call from a
+background thread, rotating by size; analyze_query_log() reads any number of
+(rotated) logs in constant memory and reports latency percentiles, skill
+demand, low-confidence queries and clusters of unmet demand
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import os
+import queue
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+DEFAULT_MAX_BYTES = 64 << 20
+DEFAULT_BACKUPS = 5
+QUEUE_SIZE = 10_000
+
+QUERY_TOKEN = re.compile(r"[a-z0-9]+")
+# Too common in task descriptions to say anything about a cluster
+_STOP_WORDS_TEXT = """
+a an and are as at be by can do for from help how i in is it me my need of on or
+please the this to use using we what with
+"""
+STOP_WORDS = frozenset(_STOP_WORDS_TEXT.split())
+
+
+class QueryLogWriter:
+    """
+    Buffered, size-rotated JSON-lines writer
+
+    log() only enqueues; a daemon thread batches records to disk, so routing
+    never waits on I/O. When the queue is full (the disk cannot keep up)
+    records are dropped and counted rather than blocking the caller.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(QUEUE_SIZE)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="query-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def log(self, record: dict[str, Any]) -> None:
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            first = self._queue.get()
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            # Gather whatever arrives within the flush interval into one write
+            while first is not None and batch[-1] is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            records = [r for r in batch if r is not None]
+            if records:
+                self._write(records)
+            if batch[-1] is None:
+                return
+
+    def _write(self, records: list[dict[str, Any]]) -> None:
+        lines = [json.dumps(r, separators=(",", ":")) + "\n" for r in records]
+        try:
+            size = self.path.stat().st_size if self.path.exists() else 0
+            chunk: list[str] = []
+            for line in lines:
+                # Rotate before the line that would overflow (a file always gets one line)
+                if self.max_bytes > 0 and size and size + len(line) > self.max_bytes:
+                    self._append(chunk)
+                    chunk = []
+                    self._rotate()
+                    size = 0
+                chunk.append(line)
+                size += len(line)
+            self._append(chunk)
+        except OSError:
+            self.dropped += len(records)  # Logging is best effort
+
+    def _append(self, lines: list[str]) -> None:
+        if lines:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write("".join(lines))
+
+    def _rotate(self) -> None:
+        """log -> log.1 -> ... -> log.N, dropping the oldest"""
+        for i in range(self.backups - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{i}")
+            if src.exists():
+                os.replace(src, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backups > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+    def close(self) -> None:
+        """Flush pending records and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        atexit.unregister(self.close)
+
+
+def route_record(
+    query: str,
+    slugs: list[str],
+    scores: list[float],
+    latency_ms: float,
+    min_score: float,
+) -> dict[str, Any]:
+    """Log record for one route() call; scores are the top raw scores, before min_score"""
+    return {
+        "ts": round(time.time(), 3),
+        "query": query,
+        "slugs": slugs,
+        "scores": [round(s, 4) for s in scores],
+        "min_score": min_score,
+        "latency_ms": round(latency_ms, 3),
+    }
+
+
+def log_files(path: Path) -> list[Path]:
+    """`path` and its rotated backups, oldest first"""
+    backups = []
+    for p in path.parent.glob(f"{path.name}.*"):
+        suffix = p.name[len(path.name) + 1 :]
+        if suffix.isdigit():
+            backups.append((int(suffix), p))
+    files = [p for _, p in sorted(backups, reverse=True)]
+    if path.exists():
+        files.append(path)
+    return files
+
+
+def iter_records(paths: Iterable[Path]) -> Iterator[dict[str, Any]]:
+    """Records from each log (and its backups), one line at a time; bad lines are skipped"""
+    for path in paths:
+        for log_path in log_files(path):
+            with log_path.open(encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Torn write from a crash or a partial copy
+                    if isinstance(record, dict) and isinstance(record.get("query"), str):
+                        yield record
+
+
+class LogHistogram:
+    """Fixed log-spaced buckets: percentiles within ~2% in constant memory"""
+
+    def __init__(self, base: float = 1.02, floor: float = 0.001) -> None:
+        self.log_base = math.log(base)
+        self.floor = floor
+        self.buckets: Counter[int] = Counter()
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.buckets[int(math.log(max(value, self.floor) / self.floor) / self.log_base)] += 1
+        self.count += 1
+
+    def percentile(self, pct: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = pct / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return self._value(bucket)
+        return self._value(max(self.buckets))
+
+    def _value(self, bucket: int) -> float:
+        """Geometric midpoint of a bucket"""
+        return self.floor * math.exp((bucket + 0.5) * self.log_base)
+
+
+class FrequentItems:
+    """
+    Misra-Gries heavy hitters: frequent items of an unbounded stream in `capacity` counters
+
+    Counts are lower bounds, off by at most stream length / capacity; the
+    decrement step is amortized O(1) per item.
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self.capacity = capacity
+        self.counts: dict[str, int] = {}
+
+    def add(self, item: str) -> None:
+        if item in self.counts:
+            self.counts[item] += 1
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = 1
+        else:
+            self.counts = {k: c - 1 for k, c in self.counts.items() if c > 1}
+
+    def top(self, n: int) -> list[tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))[:n]
+
+
+class Reservoir:
+    """Uniform sample of an unbounded stream (Algorithm R)"""
+
+    def __init__(self, size: int, seed: int = 0) -> None:
+        self.size = size
+        self.items: list[str] = []
+        self.seen = 0
+        self._rng = random.Random(seed)  # noqa: S311 - sampling, not security
+
+    def add(self, item: str) -> None:
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append(item)
+        else:
+            j = self._rng.randrange(self.seen)
+            if j < self.size:
+                self.items[j] = item
+
+
+def query_tokens(query: str) -> frozenset[str]:
+    return frozenset(t for t in QUERY_TOKEN.findall(query.lower()) if t not in STOP_WORDS)
+
+
+@dataclass
+class QueryCluster:
+    terms: list[str]
+    size: int  # sampled queries in the cluster
+    examples: list[str]
+
+
+def cluster_queries(
+    queries: Iterable[str], threshold: float = 0.3, max_examples: int = 3
+) -> list[QueryCluster]:
+    """
+    Greedy leader clustering on token-set Jaccard similarity
+
+    Each query joins the first cluster whose leader it overlaps by at least
+    `threshold`; run on a bounded sample, so the cost does not grow with the log.
+    """
+    leaders: list[frozenset[str]] = []
+    members: list[list[str]] = []
+    terms: list[Counter[str]] = []
+    for query in queries:
+        tokens = query_tokens(query)
+        if not tokens:
+            continue
+        for i, leader in enumerate(leaders):
+            if len(tokens & leader) / len(tokens | leader) >= threshold:
+                members[i].append(query)
+                terms[i].update(tokens)
+                break
+        else:
+            leaders.append(tokens)
+            members.append([query])
+            terms.append(Counter(tokens))
+    clusters = [
+        QueryCluster(
+            terms=[t for t, _ in sorted(c.items(), key=lambda kv: (-kv[1], kv[0]))[:4]],
+            size=len(m),
+            examples=sorted(set(m))[:max_examples],
+        )
+        for c, m in zip(terms, members, strict=True)
+    ]
+    return sorted(clusters, key=lambda c: (-c.size, c.terms))
+
+
+@dataclass
+class QueryLogStats:
+    total: int = 0
+    low_confidence: int = 0
+    latency: LogHistogram = field(default_factory=LogHistogram)
+    skill_demand: Counter[str] = field(default_factory=Counter)
+    unmet_queries: FrequentItems = field(default_factory=FrequentItems)
+    unmet_sample: Reservoir = field(default_factory=lambda: Reservoir(2000))
+
+    def add(self, record: dict[str, Any]) -> None:
+        self.total += 1
+        latency = record.get("latency_ms")
+        if isinstance(latency, (int, float)):
+            self.latency.add(float(latency))
+        scores = record.get("scores") or []
+        slugs = record.get("slugs") or []
+        min_score = record.get("min_score", 0.1)
+        if slugs and scores and scores[0] >= min_score:
+            self.skill_demand[slugs[0]] += 1
+        else:
+            self.low_confidence += 1
+            normalized = " ".join(record["query"].lower().split())
+            self.unmet_queries.add(normalized)
+            self.unmet_sample.add(normalized)
+
+    def clusters(self, threshold: float = 0.3) -> list[QueryCluster]:
+        return cluster_queries(self.unmet_sample.items, threshold)
+
+
+def analyze_query_log(paths: Iterable[Path]) -> QueryLogStats:
+    """One streaming pass over the logs; memory is bounded whatever their size"""
+    stats = QueryLogStats()
+    for record in iter_records(paths):
+        stats.add(record)
+    return stats
+
+
+def generate_demand_report(stats: QueryLogStats, top_n: int = 10) -> list[str]:
+    """Markdown lines for the measured-demand gap analysis of the coverage report"""
+    md = ["## Gap Analysis (Measured Demand)", ""]
+    if not stats.total:
+        md.extend(["No routed queries logged yet.", ""])
+        return md
+
+    pct = stats.low_confidence / stats.total * 100
+    md.append(f"- **Queries**: {stats.total}")
+    md.append(
+        f"- **Low-confidence** (top score below min_score): {stats.low_confidence} ({pct:.1f}%)"
+    )
+    md.append(
+        "- **Latency**: "
+        + ", ".join(f"p{p} {stats.latency.percentile(p):.2f} ms" for p in (50, 90, 99))
+    )
+    md.append("")
+
+    md.append("### Most-Requested Skills")
+    md.append("")
+    md.append("| Skill | Queries |")
+    md.append("|-------|---------|")
+    for slug, count in sorted(stats.skill_demand.items(), key=lambda kv: (-kv[1], kv[0]))[:top_n]:
+        md.append(f"| {slug} | {count} |")
+    md.append("")
+
+    md.append("### Most Frequent Unserved Queries")
+    md.append("")
+    for query, count in stats.unmet_queries.top(top_n):
+        md.append(f"- {query} ({count})")
+    md.append("")
+
+    clusters = stats.clusters()
+    md.append(f"### Unmet Demand Clusters ({len(clusters)})")
+    md.append("")
+    md.append("Candidate skills, largest first (from a sample of low-confidence queries):")
+    md.append("")
+    for i, cluster in enumerate(clusters[:top_n], start=1):
+        examples = "; ".join(cluster.examples)
+        md.append(f"{i}. **{' '.join(cluster.terms)}** ({cluster.size} queries), e.g. {examples}")
+    md.append("")
+    return md
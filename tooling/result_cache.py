@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Persistent per-file result cache for the validate and lint tools
+Entries are keyed on the content hash of the checked files and replayed while
+the tool fingerprint (source of the rule modules plus run options) is unchanged;
+a (size, mtime_ns) stamp lets unchanged files skip hashing altogether
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR_NAME = ".skill-cache"
+CACHE_FORMAT = 1
+
+TOOLING_DIR = Path(__file__).resolve().parent
+
+
+def tool_fingerprint(modules: Iterable[str], options: Any = None) -> str:
+    """Hash of the named tooling modules' source and the JSON-serializable run options"""
+    h = hashlib.sha256(f"format={CACHE_FORMAT}\n".encode())
+    for name in sorted(modules):
+        h.update(name.encode("utf-8") + b"\0")
+        h.update((TOOLING_DIR / f"{name}.py").read_bytes())
+    h.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _stamp(files: Sequence[Path]) -> list[list[int]]:
+    stamps = []
+    for f in files:
+        st = f.stat()
+        stamps.append([st.st_size, st.st_mtime_ns])
+    return stamps
+
+
+def _content_hash(files: Sequence[Path]) -> str:
+    h = hashlib.sha256()
+    for f in files:
+        h.update(str(f).encode("utf-8") + b"\0")
+        h.update(f.read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    JSON-backed cache of tool results, one file per tool
+
+    get()/put() take the key (usually the SKILL.md path) plus every file the
+    result depends on. Entries not touched during a run are pruned on save(),
+    and a fingerprint change discards the whole cache.
+    """
+
+    def __init__(self, path: Path, fingerprint: str) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.used: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return  # Missing or corrupt cache: start empty
+        if isinstance(data, dict) and data.get("fingerprint") == self.fingerprint:
+            self.entries = data.get("entries", {})
+        else:
+            self._dirty = True  # Stale fingerprint: rewrite on save
+
+    def get(self, key: str, files: Sequence[Path]) -> Any | None:
+        """Cached result for `key`, or None when any of `files` changed"""
+        entry = self.entries.get(key)
+        self.used.add(key)
+        if entry is None or entry.get("files") != [str(f) for f in files]:
+            self.misses += 1
+            return None
+        try:
+            stamp = _stamp(files)
+            if stamp != entry["stamp"]:
+                # Touched but maybe unchanged (checkout, copy): compare content
+                if _content_hash(files) != entry["sha256"]:
+                    self.misses += 1
+                    return None
+                entry["stamp"] = stamp
+                self._dirty = True
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["result"]
+
+    def put(self, key: str, files: Sequence[Path], result: Any) -> None:
+        try:
+            stamp = _stamp(files)
+            digest = _content_hash(files)
+        except OSError:
+            return
+        self.entries[key] = {
+            "files": [str(f) for f in files],
+            "stamp": stamp,
+            "sha256": digest,
+            "result": result,
+        }
+        self.used.add(key)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Prune entries not seen this run and write the cache atomically"""
+        stale = set(self.entries) - self.used
+        for key in stale:
+            del self.entries[key]
+        if not (self._dirty or stale):
+            return
+        data = {"fingerprint": self.fingerprint, "entries": self.entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            return  # Read-only checkout: caching is best effort
+        self._dirty = False
@@ -6,22 +6,54 @@ Find most relevant skills for a given task description
 
 from __future__ import annotations
 
+import argparse
 import json
 import pickle
+import sys
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import numpy as np  # type: ignore[import-untyped,unused-ignore]
-from sklearn.metrics.pairwise import cosine_similarity  # type: ignore[import-untyped,unused-ignore]
+from catalog_db import DEFAULT_DB_NAME, FtsSkillRouter
+from char_ngram_index import CharNgramIndex
+from profiling import add_profiling_args, profiled, span
+from query_log import QueryLogWriter, route_record
+from skill_sections import normalize_heading
+from token_budget import CHARS_PER_TOKEN, select_within_budget
 
 
 class SkillRouter:
     """Route tasks to relevant skills using embeddings"""
 
-    def __init__(self, embeddings_dir: Path | str | None = None) -> None:
+    def __init__(
+        self,
+        embeddings_dir: Path | str | None = None,
+        index_path: Path | str | None = None,
+        query_log: QueryLogWriter | Path | str | None = None,
+        typo_tolerant: bool = False,
+    ) -> None:
         if embeddings_dir is None:
             embeddings_dir = Path(__file__).parent.parent / "index" / "embeddings"
         self.embeddings_dir = Path(embeddings_dir)
+        # skills-index.json, loaded on first budget-aware query
+        self.index_path = (
+            Path(index_path) if index_path else self.embeddings_dir.parent / "skills-index.json"
+        )
+        self._skills_by_slug: dict[str, dict[str, Any]] | None = None
+        # Opt-in JSON-lines log of every route() call (see query_log.py)
+        self.query_log = (
+            query_log
+            if query_log is None or isinstance(query_log, QueryLogWriter)
+            else QueryLogWriter(query_log)
+        )
+        # Map misspelled query words onto the vocabulary before scoring (see correct_query)
+        self.typo_tolerant = typo_tolerant
+        self._term_index: CharNgramIndex | None = None
+        # The vectorizer's own analyzer steps, so corrected words match its vocabulary
+        self._tokenize: Callable[[str], list[str]] | None = None
+        self._preprocess: Callable[[str], str] | None = None
+        self._stop_words: frozenset[str] | None = None
 
         # Load embeddings
         self._load_embeddings()
@@ -29,10 +61,10 @@ class SkillRouter:
     def _load_embeddings(self) -> None:
         """Load pre-built embeddings from disk"""
         # S301: Pickle files are locally generated by build_embeddings.py (trusted)
-        with open(self.embeddings_dir / "vectorizer.pkl", "rb") as f:
+        with span("load vectorizer"), open(self.embeddings_dir / "vectorizer.pkl", "rb") as f:
             self.vectorizer = pickle.load(f)  # noqa: S301
 
-        with open(self.embeddings_dir / "vectors.pkl", "rb") as f:
+        with span("load vectors"), open(self.embeddings_dir / "vectors.pkl", "rb") as f:
             self.vectors = pickle.load(f)  # noqa: S301
 
         with open(self.embeddings_dir / "slugs.json") as f:
@@ -41,6 +73,31 @@ class SkillRouter:
         with open(self.embeddings_dir / "metadata.json") as f:
             self.metadata = json.load(f)
 
+    def correct_query(self, query: str) -> str:
+        """
+        The query as the vectorizer's words, unknown ones mapped to vocabulary terms
+
+        "kubernets" becomes "kubernetes" and "graph ql" becomes "graphql", so
+        they score like the spelling the embeddings were built from. The term
+        index covers the vectorizer's single-word vocabulary and is built on
+        first use.
+        """
+        if (
+            self._term_index is None
+            or self._tokenize is None
+            or self._preprocess is None
+            or self._stop_words is None
+        ):
+            with span("build term index"):
+                self._term_index = CharNgramIndex(
+                    t for t in self.vectorizer.vocabulary_ if " " not in t
+                )
+                self._tokenize = self.vectorizer.build_tokenizer()
+                self._preprocess = self.vectorizer.build_preprocessor()
+                self._stop_words = frozenset(self.vectorizer.get_stop_words() or ())
+        tokens = self._tokenize(self._preprocess(query))
+        return " ".join(self._term_index.correct(tokens, skip=self._stop_words))
+
     def route(self, query: str, top_k: int = 2, min_score: float = 0.1) -> list[dict[str, Any]]:
         """
         Find most relevant skills for a query
@@ -53,14 +110,24 @@ class SkillRouter:
         Returns:
             List of (slug, score) tuples, sorted by relevance
         """
+        # Deferred so `--help` and the FTS backend never load numpy/scikit-learn
+        import numpy as np  # type: ignore[import-untyped,unused-ignore]
+        from sklearn.metrics.pairwise import (  # type: ignore[import-untyped,unused-ignore]
+            cosine_similarity,
+        )
+
+        start = time.perf_counter()
         # Transform query using same vectorizer
-        query_vec = self.vectorizer.transform([query])
+        with span("vectorize"):
+            text = self.correct_query(query) if self.typo_tolerant else query
+            query_vec = self.vectorizer.transform([text])
 
-        # Compute cosine similarity
-        similarities = cosine_similarity(query_vec, self.vectors)[0]
+        with span("score", skills=len(self.slugs)):
+            # Compute cosine similarity
+            similarities = cosine_similarity(query_vec, self.vectors)[0]
 
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+            # Get top-k indices
+            top_indices = np.argsort(similarities)[::-1][:top_k]
 
         # Filter by min_score and return results
         results: list[dict[str, Any]] = []
@@ -71,8 +138,87 @@ class SkillRouter:
                     {"slug": self.slugs[idx], "score": float(score), "rank": len(results) + 1}
                 )
 
+        if self.query_log is not None:
+            self.query_log.log(
+                route_record(
+                    query,
+                    [self.slugs[i] for i in top_indices],
+                    [float(similarities[i]) for i in top_indices],
+                    (time.perf_counter() - start) * 1000,
+                    min_score,
+                )
+            )
+        return results
+
+    def route_within_budget(
+        self,
+        query: str,
+        token_budget: int,
+        candidates: int = 10,
+        min_score: float = 0.1,
+        sections: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Pick the highest-scoring set of skills that fits a token budget
+
+        Args:
+            query: Task description string
+            token_budget: Maximum total tokens to load
+            candidates: How many top-ranked skills to consider
+            min_score: Minimum similarity score (0-1)
+            sections: Load only these sections (plus front matter) of each skill;
+                default is the whole SKILL.md
+
+        Returns:
+            Selected skills sorted by relevance, each with its token cost and
+            the sections to load
+        """
+        ranked = self.route(query, top_k=candidates, min_score=min_score)
+        with span("select within budget"):
+            costs = {r["slug"]: self._token_cost(r["slug"], sections) for r in ranked}
+            chosen = set(
+                select_within_budget(
+                    [(r["slug"], r["score"], costs[r["slug"]][0]) for r in ranked], token_budget
+                )
+            )
+
+        results: list[dict[str, Any]] = []
+        for r in ranked:
+            if r["slug"] in chosen:
+                tokens, loaded = costs[r["slug"]]
+                results.append(
+                    {
+                        "slug": r["slug"],
+                        "score": r["score"],
+                        "rank": len(results) + 1,
+                        "tokens": tokens,
+                        "sections": loaded,
+                    }
+                )
         return results
 
+    def _token_cost(self, slug: str, sections: list[str] | None) -> tuple[int, list[str] | None]:
+        """Token cost of loading a skill (or some of its sections) from the index"""
+        if self._skills_by_slug is None:
+            with open(self.index_path) as f:
+                self._skills_by_slug = {s["slug"]: s for s in json.load(f)}
+
+        entry = self._skills_by_slug.get(slug, {})
+        tokens = entry.get("tokens")
+        if tokens is None:
+            # Index predates token estimates; fall back to the file size
+            size = entry.get("bytes")
+            if size is None and entry.get("entry") and Path(entry["entry"]).exists():
+                size = Path(entry["entry"]).stat().st_size
+            return int((size or 0) / CHARS_PER_TOKEN), sections
+
+        if sections is None:
+            return int(tokens["total"]), None
+        wanted = {normalize_heading(h) for h in sections}
+        loaded = [s for s in entry.get("sections", []) if s["heading"] in wanted]
+        cost = int(tokens["front_matter"]) + sum(int(s.get("tokens", 0)) for s in loaded)
+        return cost, [s["heading"] for s in loaded]
+
     def route_with_explanation(self, query: str, top_k: int = 2) -> str:
         """Route with human-readable explanation"""
         results = self.route(query, top_k)
@@ -87,20 +233,85 @@ class SkillRouter:
         return "\n".join(output)
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """CLI demo of skill routing"""
-    import sys
+    ap = argparse.ArgumentParser(description="Route a task description to skills")
+    ap.add_argument("query", nargs="*", help="Task description")
+    ap.add_argument(
+        "--backend",
+        choices=["embeddings", "fts"],
+        default="embeddings",
+        help="TF-IDF embeddings (default) or SQLite FTS5 bm25 over index/catalog.db",
+    )
+    ap.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="Token budget: pick the best set of skills that fits (embeddings backend)",
+    )
+    ap.add_argument(
+        "--section",
+        action="append",
+        default=None,
+        help="With --budget, load only these sections of each skill (repeatable)",
+    )
+    ap.add_argument(
+        "--query-log",
+        type=Path,
+        default=None,
+        help="Append this routing call to a JSON-lines query log (embeddings backend)",
+    )
+    ap.add_argument(
+        "--root",
+        type=Path,
+        default=Path("."),
+        help="Repo root whose index/ to route over (default: .)",
+    )
+    ap.add_argument(
+        "--typo-tolerant",
+        action="store_true",
+        help="Map misspelled query words onto the vocabulary first (embeddings backend)",
+    )
+    add_profiling_args(ap)
+    args = ap.parse_args(argv)
+    if args.backend == "fts" and args.budget is not None:
+        ap.error("--budget needs the embeddings backend (token costs come from its router)")
+    with profiled(args):
+        run(args)
 
-    if len(sys.argv) < 2:
+
+def run(args: argparse.Namespace) -> None:
+    embeddings_dir = args.root / "index" / "embeddings"
+    db_path = args.root / "index" / DEFAULT_DB_NAME
+
+    if not args.query:
         print("Usage: python route_skills.py '<task description>'")
         print("\nExample:")
         print("  python route_skills.py 'validate kubernetes security'")
         sys.exit(1)
 
-    query = " ".join(sys.argv[1:])
+    query = " ".join(args.query)
 
     try:
-        router = SkillRouter()
+        if args.budget is not None:
+            selected = SkillRouter(
+                embeddings_dir, query_log=args.query_log, typo_tolerant=args.typo_tolerant
+            ).route_within_budget(query, args.budget, sections=args.section)
+            print(f"Query: {query}")
+            print(f"\nSelected {len(selected)} skill(s) within {args.budget} tokens:")
+            for r in selected:
+                print(f"  {r['rank']}. {r['slug']} (score: {r['score']:.3f}, {r['tokens']} tokens)")
+            print(json.dumps(selected, indent=2))
+            return
+
+        router: SkillRouter | FtsSkillRouter
+        router = (
+            FtsSkillRouter(db_path)
+            if args.backend == "fts"
+            else SkillRouter(
+                embeddings_dir, query_log=args.query_log, typo_tolerant=args.typo_tolerant
+            )
+        )
         print(router.route_with_explanation(query, top_k=3))
 
         # Also show raw results
@@ -109,7 +320,10 @@ def main() -> None:
         print(json.dumps(results, indent=2))
 
     except FileNotFoundError as e:
-        print("Error: Embeddings not found. Run build_embeddings.py first.")
+        if args.backend == "fts":
+            print("Error: Catalog database not found. Run build_index.py first.")
+        else:
+            print("Error: Embeddings not found. Run build_embeddings.py first.")
         print(f"Details: {e}")
         sys.exit(1)
 
@@ -0,0 +1,550 @@
+#!/usr/bin/env python3
+"""
+Eval scenario runner for tests/evals_*.yaml
+Loads every scenario, runs them concurrently through an executor (the offline
+stub by default, or any command that answers JSON), checks each result against
+the scenario's expected outputs and reports per-scenario wall time. Results are
+cached by scenario content and skill files, so reruns only execute scenarios
+whose eval entry or skill changed
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from result_cache import CACHE_DIR_NAME, ResultCache, tool_fingerprint
+from validate_catalog import load_data
+
+# Top-level keys that hold the scenario list, in the layouts the eval files use
+SCENARIO_LIST_KEYS = ("scenarios", "evals", "evaluations", "test_scenarios", "cases")
+EXPECTED_KEYS = ("expected_outputs", "expected_output", "expected", "expect")
+INPUT_KEYS = ("inputs", "input")
+# Modules whose source changes invalidate cached eval results
+CACHE_MODULES = ("run_evals", "validate_catalog")
+DEFAULT_TIMEOUT = 120.0
+SLOWEST_LIMIT = 5
+
+# ">0", "<= 2000", ">= 2.5": numeric comparison against the actual value
+COMPARISON = re.compile(r"^\s*(<=|>=|==|!=|<|>)\s*(-?\d+(?:\.\d+)?)\s*$")
+# "<path> <op> <value>" statements from list-style expected outputs
+STATEMENT = re.compile(
+    r"^(?P<path>[A-Za-z_][\w.\-]*(?:\[\d+\])*(?:\.[\w\-]+(?:\[\d+\])*)*)\s+"
+    r"(?P<op>contains|includes|matches|is present|==|!=|>=|<=|>|<)\s*(?P<value>.*)$"
+)
+PATH_PART = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+# Dict-style values that only require the key to be there ("migration_notes: not_null")
+PRESENCE_VALUES = frozenset({"present", "not_null", "non-empty", "non-empty array"})
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+MISSING: Any = _Missing()
+
+
+@dataclass(frozen=True)
+class Check:
+    """One machine-checkable expectation: `op` applied to the value at `path` ("" = whole output)"""
+
+    path: str
+    op: str  # match, contains, matches, present or a comparison operator
+    value: Any
+    source: str
+
+
+@dataclass
+class Scenario:
+    skill: str
+    file: Path
+    id: str
+    inputs: dict[str, Any]
+    expected: Any
+    raw: dict[str, Any]
+
+    @property
+    def key(self) -> str:
+        return f"{self.skill}::{self.id}"
+
+    @property
+    def digest(self) -> str:
+        text = json.dumps(self.raw, sort_keys=True, default=str)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class ScenarioResult:
+    key: str
+    status: str  # pass, fail or error
+    seconds: float
+    checks: int = 0
+    manual: int = 0  # free-text expectations left for a human reviewer
+    failures: list[str] = field(default_factory=list)
+    cached: bool = False
+
+
+def _literal(text: str) -> Any:
+    """JSON literal ("x", 3, true) or the bare text"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def _statement_check(text: str) -> Check | None:
+    """Check for a "<path> <op> <value>" statement, or None when it is free text"""
+    m = STATEMENT.match(text.strip())
+    if not m:
+        return None
+    path, op, value = m["path"], m["op"], m["value"].strip()
+    if op == "is present":
+        return Check(path, "present", None, text) if not value else None
+    if op == "matches":
+        pattern = re.fullmatch(r"/(.+)/", value)
+        return Check(path, "matches", pattern[1], text) if pattern else None
+    literal = _literal(value)
+    if op in {"contains", "includes"}:
+        # A quoted string or a single token; "contains error handling" is prose
+        if isinstance(literal, str) and (value.startswith('"') or re.fullmatch(r"\S+", value)):
+            return Check(path, "contains", literal, text)
+        return None
+    if value.startswith('"') or isinstance(literal, (bool, int, float)) or literal is None:
+        return Check(path, op, literal, text)
+    return None
+
+
+def parse_checks(expected: Any) -> tuple[list[Check], int]:
+    """(checks, number of free-text expectations) for a scenario's expected outputs"""
+    checks: list[Check] = []
+    manual = 0
+    items = expected if isinstance(expected, list) else [expected]
+    for item in items:
+        if isinstance(item, dict):
+            for key, value in item.items():
+                if key == "contains" and len(item) == 1:
+                    checks.append(Check("", "contains", value, f"contains {value!r}"))
+                elif isinstance(value, str) and value in PRESENCE_VALUES:
+                    checks.append(Check(str(key), "present", None, f"{key}: {value}"))
+                elif isinstance(value, str) and value.startswith(("contains ", "includes ")):
+                    # "path: contains \"x\"" is a statement split at the colon
+                    check = _statement_check(f"{key} {value}")
+                    if check is None:
+                        manual += 1
+                    else:
+                        checks.append(check)
+                else:
+                    checks.append(Check(str(key), "match", value, f"{key}: {value!r}"))
+        elif isinstance(item, str):
+            check = _statement_check(item)
+            if check is None:
+                manual += 1
+            else:
+                checks.append(check)
+        elif item is not None:
+            checks.append(Check("", "match", item, repr(item)))
+    return checks, manual
+
+
+def resolve(output: Any, path: str) -> Any:
+    """Value at a dotted path with [i] indexes, or MISSING"""
+    value = output
+    for key, index in PATH_PART.findall(path):
+        if index:
+            if not isinstance(value, list) or int(index) >= len(value):
+                return MISSING
+            value = value[int(index)]
+        elif isinstance(value, dict) and key in value:
+            value = value[key]
+        else:
+            return MISSING
+    return value
+
+
+def _text(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value, sort_keys=True, default=str)
+
+
+def _compare(actual: Any, op: str, expected: Any) -> bool:
+    if op in {"==", "!="}:
+        return bool(actual == expected) == (op == "==")
+    if isinstance(actual, bool) or not isinstance(actual, (int, float)):
+        return False
+    if op == "<":
+        return bool(actual < expected)
+    if op == "<=":
+        return bool(actual <= expected)
+    if op == ">":
+        return bool(actual > expected)
+    return bool(actual >= expected)
+
+
+def matches(actual: Any, expected: Any) -> bool:
+    """
+    Structural match of an actual value against an expected-output value
+
+    Dicts match key by key; a list matches an actual list containing every
+    item, or an actual scalar equal to any item (["fail", "warning"]);
+    strings like ">0" compare numerically; anything else must be equal.
+    """
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            k in actual and matches(actual[k], v) for k, v in expected.items()
+        )
+    if isinstance(expected, list):
+        if isinstance(actual, list):
+            if not expected:
+                return not actual
+            return all(any(matches(a, e) for a in actual) for e in expected)
+        return any(matches(actual, e) for e in expected)
+    if isinstance(expected, str):
+        comparison = COMPARISON.match(expected)
+        if comparison and not isinstance(actual, str):
+            return _compare(actual, comparison[1], float(comparison[2]))
+    return bool(actual == expected)
+
+
+def run_check(check: Check, output: Any) -> bool:
+    actual = resolve(output, check.path)
+    if check.op == "present":
+        return actual is not MISSING and actual not in (None, "", [], {})
+    if actual is MISSING:
+        return False
+    if check.op == "match":
+        return matches(actual, check.value)
+    if check.op == "contains":
+        if isinstance(actual, list) and check.value in actual:
+            return True
+        return str(check.value) in _text(actual)
+    if check.op == "matches":
+        return re.search(check.value, _text(actual)) is not None
+    return _compare(actual, check.op, check.value)
+
+
+def _example(value: Any) -> Any:
+    """A value that matches() the expected value"""
+    if isinstance(value, dict):
+        return {k: _example(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_example(v) for v in value]
+    if isinstance(value, str) and (comparison := COMPARISON.match(value)):
+        op, bound = comparison[1], float(comparison[2])
+        shift = {"<": -1.0, ">": 1.0, "!=": 1.0}.get(op, 0.0)
+        number = bound + shift
+        return int(number) if number.is_integer() else number
+    return value
+
+
+def _assign(output: dict[str, Any], path: str, value: Any) -> None:
+    parts = PATH_PART.findall(path)
+    target: Any = output
+    for i, (key, index) in enumerate(parts):
+        last = i == len(parts) - 1
+        container: Any = [] if i + 1 < len(parts) and parts[i + 1][1] else {}
+        if index:
+            while len(target) <= int(index):
+                target.append(container if not last else None)
+            if last:
+                target[int(index)] = value
+            else:
+                target = target[int(index)]
+        elif last:
+            target[key] = value
+        else:
+            if not isinstance(target.get(key), (dict, list)):
+                target[key] = container
+            target = target[key]
+
+
+class StubExecutor:
+    """
+    Deterministic offline executor
+
+    Answers each scenario with the reference output its checks describe, so a
+    run exercises loading, matching and caching end to end; a failure means an
+    expectation that no output can satisfy.
+    """
+
+    id = "stub"
+
+    def __call__(self, scenario: Scenario) -> Any:
+        checks, _ = parse_checks(scenario.expected)
+        output: dict[str, Any] = {}
+        texts: dict[str, list[str]] = {}
+        for check in checks:
+            if check.op == "match" and check.path:
+                _assign(output, check.path, _example(check.value))
+            elif check.op == "contains":
+                texts.setdefault(check.path, []).append(str(check.value))
+            elif check.op == "matches":
+                # Literal text of the pattern: enough for the escaped names evals use
+                texts.setdefault(check.path, []).append(re.sub(r"\\(.)", r"\1", check.value))
+            elif check.op == "present":
+                _assign(output, check.path, True)
+            elif check.op == "==":
+                _assign(output, check.path, check.value)
+            elif check.op == "!=":
+                _assign(output, check.path, None if check.value is not None else "")
+            elif check.op != "match":
+                _assign(output, check.path, _example(f"{check.op}{check.value}"))
+        for path, parts in texts.items():
+            if path:
+                _assign(output, path, "\n".join(parts))
+            else:
+                output["text"] = "\n".join(parts)
+        return output
+
+
+class CommandExecutor:
+    """
+    Runs a command per scenario: the scenario as JSON on stdin, the output on stdout
+
+    Output that is not JSON is taken as plain text under the "text" key.
+    """
+
+    def __init__(self, command: str, timeout: float = DEFAULT_TIMEOUT) -> None:
+        self.argv = shlex.split(command)
+        self.timeout = timeout
+        self.id = f"command:{command}"
+
+    def __call__(self, scenario: Scenario) -> Any:
+        request = {"skill": scenario.skill, "scenario": scenario.id, "inputs": scenario.inputs}
+        # S603: The command is supplied by the user running the evals
+        result = subprocess.run(  # noqa: S603
+            self.argv,
+            input=json.dumps(request, default=str),
+            capture_output=True,
+            text=True,
+            timeout=self.timeout,
+            check=False,
+        )
+        if result.returncode != 0:
+            msg = f"exit {result.returncode}: {result.stderr.strip()[-200:]}"
+            raise RuntimeError(msg)
+        try:
+            return json.loads(result.stdout)
+        except ValueError:
+            return {"text": result.stdout}
+
+
+def _scenario_entries(data: Any) -> list[Any]:
+    if isinstance(data, list):
+        return data
+    if not isinstance(data, dict):
+        return []
+    for key in SCENARIO_LIST_KEYS:
+        if isinstance(data.get(key), list):
+            return list(data[key])
+    return [v for k, v in data.items() if k.startswith("scenario_")]
+
+
+def _first(entry: dict[str, Any], keys: Iterable[str]) -> Any:
+    return next((entry[k] for k in keys if k in entry), None)
+
+
+def load_scenarios(path: Path) -> list[Scenario]:
+    """Scenarios of one eval file; the skill is the file's slug (evals_<slug>.yaml)"""
+    skill = path.stem.removeprefix("evals_")
+    scenarios: list[Scenario] = []
+    seen: set[str] = set()
+    for i, entry in enumerate(_scenario_entries(load_data(path)), start=1):
+        if not isinstance(entry, dict):
+            continue
+        name = entry.get("id") or entry.get("name") or entry.get("scenario") or f"scenario-{i}"
+        sid = str(name)
+        if sid in seen:
+            sid = f"{sid}#{i}"
+        seen.add(sid)
+        inputs = _first(entry, INPUT_KEYS)
+        scenarios.append(
+            Scenario(
+                skill=skill,
+                file=path,
+                id=sid,
+                inputs=inputs if isinstance(inputs, dict) else {},
+                expected=_first(entry, EXPECTED_KEYS),
+                raw=entry,
+            )
+        )
+    return scenarios
+
+
+def skill_files(root: Path, skill: str) -> list[Path]:
+    """Files a skill's results depend on: its whole skill directory"""
+    skill_dir = root / "skills" / skill
+    if not skill_dir.is_dir():
+        return []
+    return sorted(p for p in skill_dir.rglob("*") if p.is_file())
+
+
+def evaluate(scenario: Scenario, executor: Any) -> ScenarioResult:
+    """Run one scenario and check its output; executor errors become an error result"""
+    checks, manual = parse_checks(scenario.expected)
+    start = time.perf_counter()
+    try:
+        output = executor(scenario)
+    except Exception as e:  # Any executor failure is reported, not raised
+        seconds = time.perf_counter() - start
+        return ScenarioResult(scenario.key, "error", seconds, len(checks), manual, [str(e)])
+    failures = [c.source for c in checks if not run_check(c, output)]
+    seconds = time.perf_counter() - start
+    status = "fail" if failures else "pass"
+    return ScenarioResult(scenario.key, status, seconds, len(checks), manual, failures)
+
+
+def run_scenarios(
+    scenarios: list[Scenario],
+    executor: Any,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    root: Path = Path("."),
+) -> Iterator[ScenarioResult]:
+    """
+    Results in scenario order, running uncached scenarios across `jobs` threads
+
+    Cache entries are keyed on the scenario's content and depend on its skill's
+    files; errors are never cached, so they are retried on the next run.
+    """
+    deps = {s.skill: skill_files(root, s.skill) for s in scenarios}
+    cached: dict[int, ScenarioResult] = {}
+    if cache is not None:
+        for i, s in enumerate(scenarios):
+            stored = cache.get(f"{s.key}@{s.digest}", deps[s.skill])
+            if stored is not None:
+                cached[i] = ScenarioResult(**{**stored, "cached": True})
+    todo = [s for i, s in enumerate(scenarios) if i not in cached]
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        fresh = pool.map(lambda s: evaluate(s, executor), todo)
+        for i, s in enumerate(scenarios):
+            if i in cached:
+                yield cached[i]
+                continue
+            result = next(fresh)
+            if cache is not None and result.status != "error":
+                cache.put(f"{s.key}@{s.digest}", deps[s.skill], asdict(result))
+            yield result
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Run skill eval scenarios (tests/evals_*.yaml)")
+    ap.add_argument("files", nargs="*", type=Path, help="Eval files (default: all)")
+    ap.add_argument("--root", type=Path, default=Path("."), help="Repo root (default: .)")
+    ap.add_argument(
+        "--command",
+        default=None,
+        help="Executor command: gets the scenario as JSON on stdin, prints the output"
+        " (default: the offline stub executor)",
+    )
+    ap.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f"Per-scenario timeout for --command, in seconds (default: {DEFAULT_TIMEOUT:g})",
+    )
+    ap.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Run scenarios across N threads (0 = one per CPU; default: 0)",
+    )
+    ap.add_argument(
+        "-k", dest="pattern", default=None, help="Only run scenarios whose skill::id contains this"
+    )
+    ap.add_argument(
+        "--no-cache", action="store_true", help="Run every scenario instead of replaying results"
+    )
+    ap.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=f"Result cache directory (default: <root>/{CACHE_DIR_NAME})",
+    )
+    ap.add_argument("--json", action="store_true", help="Print results as JSON")
+    ap.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fail when an eval file's skill has no skills/<slug> directory",
+    )
+    args = ap.parse_args(argv)
+
+    root: Path = args.root.resolve()
+    files = args.files or sorted((root / "tests").glob("evals_*.yaml"))
+    if not files:
+        print("No eval files found.")
+        return 0
+
+    scenarios: list[Scenario] = []
+    load_errors = 0
+    for path in files:
+        try:
+            scenarios.extend(load_scenarios(path))
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"[ERROR] {path}: {e}", file=sys.stderr)
+            load_errors += 1
+        except Exception as e:  # yaml.YAMLError
+            print(f"[ERROR] {path}: invalid YAML: {e}", file=sys.stderr)
+            load_errors += 1
+    if args.pattern:
+        scenarios = [s for s in scenarios if args.pattern in s.key]
+    # Their cached results depend on no skill files, so skill edits never re-run them
+    unmapped = {s.file: s.skill for s in scenarios if not (root / "skills" / s.skill).is_dir()}
+    for path, skill in sorted(unmapped.items()):
+        level = "ERROR" if args.strict else "WARN"
+        print(f"[{level}] {path}: no skills/{skill} directory for this eval", file=sys.stderr)
+
+    executor: Any = CommandExecutor(args.command, args.timeout) if args.command else StubExecutor()
+    cache = None
+    if not args.no_cache:
+        cache_dir: Path = args.cache_dir or (root / CACHE_DIR_NAME)
+        fingerprint = tool_fingerprint(CACHE_MODULES, {"executor": executor.id})
+        cache = ResultCache(cache_dir / "evals.json", fingerprint)
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    start = time.perf_counter()
+    results = []
+    for result in run_scenarios(scenarios, executor, jobs, cache, root):
+        results.append(result)
+        if not args.json:
+            note = " (cached)" if result.cached else ""
+            print(
+                f"[{result.status.upper():5}] {result.key} {result.seconds * 1000:.1f} ms"
+                f" ({result.checks} checks, {result.manual} manual){note}"
+            )
+            for failure in result.failures:
+                print(f"        {failure}")
+    elapsed = time.perf_counter() - start
+    if cache is not None:
+        cache.save()
+
+    failed = [r for r in results if r.status != "pass"]
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        reused = sum(r.cached for r in results)
+        print(
+            f"\n{len(results) - len(failed)}/{len(results)} scenario(s) passed"
+            f" in {elapsed:.2f}s ({reused} cached)"
+        )
+        slowest = sorted((r for r in results if not r.cached), key=lambda r: -r.seconds)
+        for r in slowest[:SLOWEST_LIMIT]:
+            print(f"  slowest: {r.key} {r.seconds * 1000:.1f} ms")
+    return 1 if failed or load_errors or (unmapped and args.strict) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Multi-pattern secret scanning with a literal prefilter
+Every detector declares the lowercase literals ("anchors") its matches must
+contain; one trie-compiled regex finds all anchor hits in a line and only the
+detectors behind those anchors run their full regex. The full regexes see the
+line plus any blank lines after it and the next CONTEXT_LINES non-blank lines,
+so a value below its key ("password:\n\n  hunter2secret") is still found
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import re
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from skill_rules import iter_lines
+from trie_regex import trie_pattern
+
+try:
+    import yaml  # type: ignore[import-untyped,unused-ignore]
+except Exception:  # pragma: no cover
+    yaml = None  # type: ignore[assignment]
+
+# Skill sub-directories covered by --scan-all
+ASSET_DIRS = ["examples", "resources", "scripts"]
+# Non-blank lines after the one a match starts on that the match may run into;
+# whitespace-only lines in between never count, as `\s*` crosses any number
+CONTEXT_LINES = 2
+
+
+@dataclass(frozen=True)
+class SecretPattern:
+    name: str
+    regex: re.Pattern[str]
+    # Lowercase literals every match contains; empty means "run on every line"
+    anchors: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class SecretFinding:
+    pattern: SecretPattern
+    line: int  # 1-based
+    column: int  # 1-based
+
+
+DEFAULT_PATTERNS: list[SecretPattern] = [
+    SecretPattern("aws-access-key-id", re.compile(r"AKIA[0-9A-Z]{16}"), ("akia",)),
+    SecretPattern(
+        "private-key-block", re.compile(r"BEGIN (?:RSA |EC |)PRIVATE KEY"), ("private key",)
+    ),
+    SecretPattern("ssh-rsa-key", re.compile(r"ssh-rsa "), ("ssh-rsa ",)),
+    SecretPattern(
+        "password-assignment", re.compile(r"(?i)password\s*[:=]\s*[^\s]{6,}"), ("password",)
+    ),
+    SecretPattern("secret-assignment", re.compile(r"(?i)secret\s*[:=]\s*[^\s]{6,}"), ("secret",)),
+]
+
+
+class SecretScanner:
+    """Scan text line by line; cost grows with anchor hits, not with pattern count"""
+
+    def __init__(self, patterns: Sequence[SecretPattern] = DEFAULT_PATTERNS) -> None:
+        self.patterns = list(patterns)
+        self.unanchored = [i for i, p in enumerate(self.patterns) if not p.anchors]
+
+        by_anchor: dict[str, set[int]] = {}
+        for i, p in enumerate(self.patterns):
+            for anchor in p.anchors:
+                by_anchor.setdefault(anchor.lower(), set()).add(i)
+        # At one position the prefilter reports only the longest anchor, so an
+        # anchor also triggers the detectors of every anchor that prefixes it
+        self.by_anchor: dict[str, list[int]] = {
+            anchor: sorted(
+                set().union(*(ids for other, ids in by_anchor.items() if anchor.startswith(other)))
+            )
+            for anchor in by_anchor
+        }
+        # Zero-width lookahead so overlapping anchor hits are all reported
+        self.prefilter = (
+            re.compile(f"(?=({trie_pattern(self.by_anchor)}))") if self.by_anchor else None
+        )
+
+    def candidates(self, line: str) -> set[int]:
+        """Indexes of the patterns whose anchors occur in line (plus the unanchored ones)"""
+        ids: set[int] = set(self.unanchored)
+        if self.prefilter is not None:
+            for m in self.prefilter.finditer(line.lower()):
+                ids.update(self.by_anchor[m.group(1)])
+        return ids
+
+    def scan_line(self, line: str, lineno: int = 1) -> list[SecretFinding]:
+        """Findings in one line on its own (no following lines)"""
+        return self.scan_lines([line], lineno)
+
+    def stream(self) -> SecretStream:
+        return SecretStream(self)
+
+    def scan_lines(self, lines: Iterable[str], first_lineno: int = 1) -> list[SecretFinding]:
+        stream = self.stream()
+        findings: list[SecretFinding] = []
+        for lineno, line in enumerate(lines, start=first_lineno):
+            findings.extend(stream.push(line, lineno))
+        findings.extend(stream.flush())
+        return findings
+
+    def scan_text(self, text: str) -> list[SecretFinding]:
+        return self.scan_lines(text.splitlines())
+
+
+class SecretStream:
+    """
+    Incremental scan over consecutive lines, finding what one regex pass
+    over the whole text would
+
+    A line's findings come out of push() once CONTEXT_LINES non-blank lines
+    follow it, so a key whose value sits below it stays pending across any
+    run of blank lines; flush() returns the rest at the end of the input.
+    Blank lines are scanned together with the line before them, and each
+    pattern resumes where its previous match ended, as finditer() would.
+    """
+
+    def __init__(self, scanner: SecretScanner, context_lines: int = CONTEXT_LINES) -> None:
+        self.scanner = scanner
+        self.context_lines = context_lines
+        self.window: deque[tuple[int, str, set[int]]] = deque()
+        self.non_blank = 0  # non-blank lines in the window
+        # pattern index -> (line, 0-based column) where its last match ended
+        self.resume: dict[int, tuple[int, int]] = {}
+
+    def push(self, line: str, lineno: int) -> list[SecretFinding]:
+        self.window.append((lineno, line, self.scanner.candidates(line)))
+        if line.strip():
+            self.non_blank += 1
+        return self._drain(final=False)
+
+    def flush(self) -> list[SecretFinding]:
+        return self._drain(final=True)
+
+    def _drain(self, final: bool) -> list[SecretFinding]:
+        findings: list[SecretFinding] = []
+        while self.window:
+            head_blank = not self.window[0][1].strip()
+            if not final and self.non_blank - (0 if head_blank else 1) < self.context_lines:
+                break
+            # The head and the blank lines right after it have the same lines ahead
+            heads = 1
+            while heads < len(self.window) and not self.window[heads][1].strip():
+                heads += 1
+            findings.extend(self._scan(heads))
+            for _ in range(heads):
+                _, line, _ = self.window.popleft()
+                if line.strip():
+                    self.non_blank -= 1
+        return findings
+
+    def _scan(self, heads: int) -> list[SecretFinding]:
+        """Findings that start on the first `heads` window lines, matching over the window"""
+        ids: set[int] = set().union(*(ids for _, _, ids in self.window))
+        if not ids:
+            return []
+        first = self.window[0][0]
+        lines = [line for _, line, _ in self.window]
+        starts = [0]
+        for line in lines[:-1]:
+            starts.append(starts[-1] + len(line) + 1)
+        text = "\n".join(lines)
+        # A match may start on the newline that ends the last head line
+        last = starts[heads - 1] + len(lines[heads - 1])
+
+        findings: list[SecretFinding] = []
+        for i in sorted(ids):
+            pattern = self.scanner.patterns[i]
+            resume_line, resume_column = self.resume.get(i, (first, 0))
+            pos = starts[resume_line - first] + resume_column if resume_line >= first else 0
+            for m in pattern.regex.finditer(text, pos):
+                if m.start() > last:
+                    break
+                row = bisect.bisect_right(starts, m.start()) - 1
+                findings.append(SecretFinding(pattern, first + row, m.start() - starts[row] + 1))
+                end_row = bisect.bisect_right(starts, m.end()) - 1
+                self.resume[i] = (first + end_row, m.end() - starts[end_row])
+        findings.sort(key=lambda f: (f.line, f.column))
+        return findings
+
+
+@lru_cache(maxsize=8)
+def get_scanner(patterns: tuple[SecretPattern, ...] | None = None) -> SecretScanner:
+    """Shared scanner per pattern set (compiling the prefilter once per process)"""
+    return SecretScanner(DEFAULT_PATTERNS if patterns is None else patterns)
+
+
+def load_patterns(path: Path) -> list[SecretPattern]:
+    """
+    Load extra detectors from YAML or JSON: a list of {name, pattern, anchors}
+
+    `anchors` should list lowercase literals every match contains; detectors
+    without anchors run their regex on every line.
+    """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix in {".yaml", ".yml"}:
+        if yaml is None:
+            msg = "PyYAML not installed. Please add 'pyyaml'."
+            raise RuntimeError(msg)
+        raw: Any = yaml.safe_load(text)
+    else:
+        raw = json.loads(text)
+    if not isinstance(raw, list):
+        msg = f"{path}: expected a list of secret patterns"
+        raise ValueError(msg)
+
+    patterns = []
+    for i, item in enumerate(raw):
+        if not isinstance(item, dict) or "pattern" not in item:
+            msg = f"{path}: entry {i} needs at least a 'pattern'"
+            raise ValueError(msg)
+        anchors = tuple(str(a).lower() for a in item.get("anchors") or [])
+        patterns.append(
+            SecretPattern(
+                str(item.get("name", f"custom-{i}")), re.compile(item["pattern"]), anchors
+            )
+        )
+    return patterns
+
+
+def iter_asset_files(skill_dir: Path) -> list[Path]:
+    """Files under a skill's examples/, resources/ and scripts/ directories"""
+    files: list[Path] = []
+    for sub in ASSET_DIRS:
+        base = skill_dir / sub
+        if base.is_dir():
+            files.extend(p for p in base.rglob("*") if p.is_file() and p.name != ".gitkeep")
+    return sorted(files)
+
+
+def scan_file(path: Path, scanner: SecretScanner) -> list[SecretFinding]:
+    """Scan a text file line by line; binary (non-UTF-8) files are skipped"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return scanner.scan_lines(iter_lines(f))
+    except UnicodeDecodeError:
+        return []
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Semantic coverage analysis over the routing embeddings
+Clusters the TF-IDF skill vectors from build_embeddings.py with mini-batch
+k-means, labels clusters by their heaviest terms and flags sparse regions from
+the data itself; every step is a sparse/array operation, so 100k-skill
+catalogs cluster in seconds
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np  # type: ignore[import-untyped,unused-ignore]
+from sklearn.cluster import MiniBatchKMeans  # type: ignore[import-untyped,unused-ignore]
+from sklearn.preprocessing import normalize  # type: ignore[import-untyped,unused-ignore]
+
+MAX_AUTO_CLUSTERS = 200
+TOP_TERMS = 5
+# Number of skills listed as least similar to their own centroid
+OUTLIER_LIMIT = 20
+
+
+@dataclass
+class SkillCluster:
+    id: int
+    size: int
+    terms: list[str]
+    cohesion: float  # mean cosine similarity of members to the centroid
+    members: list[str]  # closest to the centroid first
+    sparse: bool = False
+
+
+@dataclass
+class SemanticCoverage:
+    clusters: list[SkillCluster]
+    outliers: list[tuple[str, float]]  # (slug, similarity to own centroid), weakest first
+    size_threshold: float
+    cohesion_threshold: float
+
+
+def default_embeddings_dir() -> Path:
+    return Path(__file__).parent.parent / "index" / "embeddings"
+
+
+def load_embeddings(embeddings_dir: Path | None = None) -> tuple[list[str], Any, Any]:
+    """(slugs, L2-normalized CSR vectors, feature names) from build_embeddings.py output"""
+    embeddings_dir = embeddings_dir or default_embeddings_dir()
+    # S301: Pickle files are locally generated by build_embeddings.py (trusted)
+    with open(embeddings_dir / "vectors.pkl", "rb") as f:
+        vectors = pickle.load(f)  # noqa: S301
+    with open(embeddings_dir / "vectorizer.pkl", "rb") as f:
+        vectorizer = pickle.load(f)  # noqa: S301
+    slugs: list[str] = json.loads((embeddings_dir / "slugs.json").read_text(encoding="utf-8"))
+    if vectors.shape[0] != len(slugs):
+        msg = f"Embeddings out of sync: {vectors.shape[0]} vectors for {len(slugs)} slugs"
+        raise ValueError(msg)
+    return slugs, normalize(vectors.tocsr()), vectorizer.get_feature_names_out()
+
+
+def auto_cluster_count(n: int) -> int:
+    """Rule-of-thumb k = sqrt(n / 2), within [2, MAX_AUTO_CLUSTERS] and below n"""
+    return max(1, min(n - 1, MAX_AUTO_CLUSTERS, max(2, round(math.sqrt(n / 2)))))
+
+
+def cluster_vectors(vectors: Any, k: int, seed: int = 0) -> tuple[Any, Any]:
+    """(labels, L2-normalized centroids) from mini-batch k-means"""
+    model = MiniBatchKMeans(
+        n_clusters=k,
+        random_state=seed,
+        n_init=3,
+        batch_size=min(4096, vectors.shape[0]),
+    )
+    labels = model.fit_predict(vectors)
+    return labels, normalize(model.cluster_centers_)
+
+
+def analyze_semantic_coverage(
+    slugs: list[str],
+    vectors: Any,
+    terms: Any,
+    k: int | None = None,
+    seed: int = 0,
+    top_terms: int = TOP_TERMS,
+) -> SemanticCoverage:
+    """
+    Cluster skills and measure each cluster from the data
+
+    A cluster is sparse when it falls below the first quartile of cluster
+    sizes or of cohesion. Outliers are the skills least similar to their own centroid.
+    """
+    n = len(slugs)
+    if n < 2:
+        msg = f"Need at least 2 embedded skills for clustering, found {n}"
+        raise ValueError(msg)
+    k = min(k or auto_cluster_count(n), n)
+    labels, centers = cluster_vectors(vectors, k, seed)
+
+    # Similarity of each skill to its own centroid, computed over the nonzeros only
+    rows = np.repeat(np.arange(n), np.diff(vectors.indptr))
+    products = vectors.data * centers[labels[rows], vectors.indices]
+    similarity = np.bincount(rows, weights=products, minlength=n)
+    sizes = np.bincount(labels, minlength=k)
+    cohesion = np.bincount(labels, weights=similarity, minlength=k) / np.maximum(sizes, 1)
+
+    top = np.argsort(-centers, axis=1)[:, :top_terms]
+    order = np.lexsort((-similarity, labels))  # by cluster, closest first
+    bounds = np.concatenate(([0], np.cumsum(sizes)))
+
+    occupied = sizes > 0
+    size_threshold = float(np.percentile(sizes[occupied], 25))
+    cohesion_threshold = float(np.percentile(cohesion[occupied], 25))
+
+    clusters = []
+    for c in np.flatnonzero(occupied):
+        members = [slugs[i] for i in order[bounds[c] : bounds[c + 1]]]
+        clusters.append(
+            SkillCluster(
+                id=int(c),
+                size=int(sizes[c]),
+                terms=[str(terms[t]) for t in top[c] if centers[c, t] > 0],
+                cohesion=round(float(cohesion[c]), 4),
+                members=members,
+                sparse=bool(sizes[c] < size_threshold or cohesion[c] < cohesion_threshold),
+            )
+        )
+    clusters.sort(key=lambda cl: (-cl.size, cl.id))
+
+    weakest = np.argsort(similarity, kind="stable")[: min(OUTLIER_LIMIT, n)]
+    outliers = [(slugs[i], round(float(similarity[i]), 4)) for i in weakest]
+    return SemanticCoverage(clusters, outliers, size_threshold, cohesion_threshold)
+
+
+def generate_semantic_report(coverage: SemanticCoverage, total_skills: int) -> str:
+    """Markdown report of clusters, sparse regions and outliers"""
+    md = ["# Semantic Skill Coverage", ""]
+    md.append(f"**Total Skills**: {total_skills}")
+    md.append(f"**Clusters**: {len(coverage.clusters)}")
+    md.append("")
+
+    md.append("## Clusters")
+    md.append("")
+    md.append("| Cluster | Top Terms | Size | Cohesion | Skills (sample) |")
+    md.append("|---------|-----------|------|----------|-----------------|")
+    for cl in coverage.clusters:
+        preview = ", ".join(cl.members[:3])
+        if cl.size > 3:
+            preview += ", ..."
+        md.append(
+            f"| {cl.id} | {', '.join(cl.terms)} | {cl.size} | {cl.cohesion:.2f} | {preview} |"
+        )
+    md.append("")
+
+    sparse = [cl for cl in coverage.clusters if cl.sparse]
+    md.append(f"## Sparse Regions ({len(sparse)})")
+    md.append("")
+    md.append(
+        f"Clusters with fewer than {coverage.size_threshold:g} skills or cohesion below"
+        f" {coverage.cohesion_threshold:.2f} (bottom quartile of this catalog):"
+    )
+    md.append("")
+    for cl in sorted(sparse, key=lambda c: (c.size, c.cohesion, c.id)):
+        md.append(
+            f"- **{', '.join(cl.terms) or 'no terms'}** ({cl.size} skills,"
+            f" cohesion {cl.cohesion:.2f}): {', '.join(f'`{m}`' for m in cl.members[:5])}"
+        )
+    md.append("")
+
+    md.append("## Least Typical Skills")
+    md.append("")
+    md.append("Skills furthest from their cluster centroid (candidates for their own domain):")
+    md.append("")
+    for slug, score in coverage.outliers:
+        md.append(f"- `{slug}` ({score:.2f})")
+    md.append("")
+    return "\n".join(md)
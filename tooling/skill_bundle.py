@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Single-file skill bundle
+Packs the index, embeddings and every skill file into one archive with a
+central offset table, served through mmap without copying
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import mmap
+import os
+import pickle
+import statistics
+import struct
+import subprocess
+import sys
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from skill_sections import index_sections, normalize_heading
+
+MAGIC = b"CTWBNDL\x00"
+FORMAT_VERSION = 1
+# magic, format version, flags (reserved), TOC offset, TOC length
+HEADER = struct.Struct("<8sIIQQ")
+ALIGN = 8
+
+DEFAULT_BUNDLE_NAME = "skills.bundle"
+SKIP_NAMES = {".gitkeep", ".DS_Store"}
+
+
+def collect_bundle_files(root: Path) -> list[str]:
+    """Repo-relative POSIX paths to pack: index JSON, embeddings and all skill files"""
+    paths: list[Path] = []
+    index_dir = root / "index"
+    paths.extend(index_dir.glob("*.json"))
+    paths.extend(p for p in (index_dir / "embeddings").rglob("*") if p.is_file())
+    paths.extend(p for p in (root / "skills").rglob("*") if p.is_file())
+    return sorted(
+        p.relative_to(root).as_posix()
+        for p in paths
+        if p.name not in SKIP_NAMES and "__pycache__" not in p.parts
+    )
+
+
+def build_bundle(root: Path, out: Path, files: list[str] | None = None) -> dict[str, Any]:
+    """
+    Write a bundle of `files` (default: collect_bundle_files) under `root` to `out`
+
+    Layout: fixed header | 8-byte aligned file blobs | JSON table of contents.
+    The TOC maps each path to [offset, length] and each skill slug to its
+    '## ' sections with absolute offsets, so readers never scan SKILL.md.
+    Output is byte-identical for identical inputs.
+    """
+    files = collect_bundle_files(root) if files is None else sorted(files)
+    toc: dict[str, Any] = {"version": FORMAT_VERSION, "files": {}, "sections": {}}
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, 0, 0))
+        for rel in files:
+            data = (root / rel).read_bytes()
+            pad = -f.tell() % ALIGN
+            if pad:
+                f.write(b"\0" * pad)
+            offset = f.tell()
+            f.write(data)
+            toc["files"][rel] = [offset, len(data)]
+
+            parts = rel.split("/")
+            if len(parts) == 3 and parts[0] == "skills" and parts[2] == "SKILL.md":
+                toc["sections"][parts[1]] = [
+                    {
+                        "heading": s["heading"],
+                        "offset": offset + s["offset"],
+                        "length": s["length"],
+                    }
+                    for s in index_sections(data)
+                ]
+
+        toc_bytes = json.dumps(toc, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        toc_offset = f.tell()
+        f.write(toc_bytes)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, toc_offset, len(toc_bytes)))
+
+    os.replace(tmp, out)
+    return {"files": len(files), "bytes": out.stat().st_size, "skills": len(toc["sections"])}
+
+
+class SkillBundle:
+    """Read-only, zero-copy access to a bundle built by build_bundle()"""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+        try:
+            self._load_toc()
+        except Exception:
+            # Rejected files must not keep their mapping alive until GC
+            self.close()
+            raise
+
+    def _load_toc(self) -> None:
+        if len(self._mm) < HEADER.size:
+            msg = f"Not a skill bundle (truncated): {self.path}"
+            raise ValueError(msg)
+        magic, version, _flags, toc_offset, toc_length = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            msg = f"Not a skill bundle (bad magic): {self.path}"
+            raise ValueError(msg)
+        if version != FORMAT_VERSION:
+            msg = f"Unsupported bundle version {version} (expected {FORMAT_VERSION})"
+            raise ValueError(msg)
+
+        toc = json.loads(bytes(self._view[toc_offset : toc_offset + toc_length]))
+        self._files: dict[str, list[int]] = toc["files"]
+        self._sections: dict[str, list[dict[str, Any]]] = toc["sections"]
+
+    def names(self) -> list[str]:
+        return list(self._files)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._files
+
+    def read(self, name: str) -> memoryview:
+        """Zero-copy view of a packed file"""
+        try:
+            offset, length = self._files[name]
+        except KeyError:
+            msg = f"Not in bundle: {name}"
+            raise FileNotFoundError(msg) from None
+        return self._view[offset : offset + length]
+
+    def text(self, name: str) -> str:
+        return str(self.read(name), "utf-8")
+
+    def load_json(self, name: str) -> Any:
+        return json.loads(self.text(name))
+
+    def load_pickle(self, name: str) -> Any:
+        # S301: bundles are built locally from build_embeddings.py output (trusted)
+        return pickle.loads(self.read(name))  # noqa: S301
+
+    def skill(self, slug: str) -> memoryview:
+        return self.read(f"skills/{slug}/SKILL.md")
+
+    def skill_sections(self, slug: str) -> list[dict[str, Any]]:
+        return list(self._sections.get(slug, []))
+
+    def section(self, slug: str, heading: str) -> memoryview:
+        """Zero-copy view of one '## ' section of a skill (first occurrence)"""
+        wanted = normalize_heading(heading)
+        for sect in self._sections.get(slug, []):
+            if sect["heading"] == wanted:
+                return self._view[sect["offset"] : sect["offset"] + sect["length"]]
+        msg = f"Section '{wanted}' not found in skill {slug}"
+        raise KeyError(msg)
+
+    def close(self) -> None:
+        """Release the mapping (views handed out by read() must be released first)"""
+        self._view.release()
+        # If callers still hold views, the mapping is freed with the last one
+        with contextlib.suppress(BufferError):
+            self._mm.close()
+
+    def __enter__(self) -> SkillBundle:  # noqa: PYI034
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+# Cold-start workload: parse the index, unpickle the embeddings and pull the
+# 'Purpose & When-To-Use' section of every skill. Each run is a fresh process.
+_BENCH_LOOSE = """
+import json, pickle, sys, time
+from pathlib import Path
+sys.path.insert(0, {tooling!r})
+t0 = time.perf_counter()
+from skill_sections import index_sections
+root = Path({root!r})
+skills = json.loads((root / "index" / "skills-index.json").read_text(encoding="utf-8"))
+emb = root / "index" / "embeddings"
+vectors = pickle.loads((emb / "vectors.pkl").read_bytes())
+slugs = json.loads((emb / "slugs.json").read_text(encoding="utf-8"))
+n = 0
+for md in sorted((root / "skills").glob("*/SKILL.md")):
+    data = md.read_bytes()
+    for s in index_sections(data):
+        if s["heading"] == "Purpose & When-To-Use":
+            n += len(data[s["offset"]:s["offset"] + s["length"]].decode("utf-8"))
+            break
+print(time.perf_counter() - t0)
+"""
+
+_BENCH_BUNDLE = """
+import sys, time
+sys.path.insert(0, {tooling!r})
+t0 = time.perf_counter()
+from skill_bundle import SkillBundle
+b = SkillBundle({bundle!r})
+skills = b.load_json("index/skills-index.json")
+vectors = b.load_pickle("index/embeddings/vectors.pkl")
+slugs = b.load_json("index/embeddings/slugs.json")
+n = 0
+for name in b.names():
+    parts = name.split("/")
+    if len(parts) == 3 and parts[0] == "skills" and parts[2] == "SKILL.md":
+        n += len(str(b.section(parts[1], "Purpose & When-To-Use"), "utf-8"))
+print(time.perf_counter() - t0)
+"""
+
+
+def _time_snippet(code: str) -> float:
+    # S603: runs our own interpreter on a fixed, locally generated snippet
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark_cold_start(root: Path, bundle: Path, runs: int = 5) -> dict[str, Any]:
+    """Median cold-process load time: loose files vs bundle (page cache not dropped)"""
+    tooling = str(Path(__file__).resolve().parent)
+    loose_code = _BENCH_LOOSE.format(tooling=tooling, root=str(root))
+    bundle_code = _BENCH_BUNDLE.format(tooling=tooling, bundle=str(bundle))
+
+    loose: list[float] = []
+    packed: list[float] = []
+    for _ in range(runs):
+        loose.append(_time_snippet(loose_code))
+        packed.append(_time_snippet(bundle_code))
+
+    loose_median = statistics.median(loose)
+    bundle_median = statistics.median(packed)
+    return {
+        "runs": runs,
+        "loose_files": len(collect_bundle_files(root)),
+        "loose_median_s": loose_median,
+        "bundle_median_s": bundle_median,
+        "speedup": loose_median / bundle_median if bundle_median else float("inf"),
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Build, inspect and benchmark skill bundles")
+    ap.add_argument("--root", type=Path, default=Path("."), help="Repo root")
+    ap.add_argument(
+        "--bundle",
+        type=Path,
+        default=None,
+        help=f"Bundle path (default: <root>/index/{DEFAULT_BUNDLE_NAME})",
+    )
+    sub = ap.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="Pack the catalog into a bundle")
+    sub.add_parser("ls", help="List bundled files")
+    cat = sub.add_parser("cat", help="Print a bundled file or a skill section")
+    cat.add_argument("name", help="Bundled path, or a skill slug with --section")
+    cat.add_argument("--section", default=None, help="SKILL.md section heading")
+    bench = sub.add_parser("bench", help="Compare cold-start load time against loose files")
+    bench.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    root: Path = args.root.resolve()
+    bundle_path: Path = args.bundle or (root / "index" / DEFAULT_BUNDLE_NAME)
+
+    if args.command == "build":
+        if not (root / "skills").exists():
+            print(f"ERROR: skills dir not found: {root / 'skills'}", file=sys.stderr)
+            return 2
+        stats = build_bundle(root, bundle_path)
+        print(
+            f"Wrote {bundle_path}: {stats['files']} file(s), {stats['skills']} skill(s), "
+            f"{stats['bytes']} bytes"
+        )
+        return 0
+
+    if args.command == "bench":
+        if not bundle_path.exists():
+            build_bundle(root, bundle_path)
+        print(json.dumps(benchmark_cold_start(root, bundle_path, runs=args.runs), indent=2))
+        return 0
+
+    try:
+        bundle = SkillBundle(bundle_path)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    with bundle:
+        try:
+            if args.command == "ls":
+                for name in bundle.names():
+                    print(name)
+            elif args.section:
+                sys.stdout.write(str(bundle.section(args.name, args.section), "utf-8"))
+            else:
+                sys.stdout.buffer.write(bundle.read(args.name))
+        except (FileNotFoundError, KeyError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Shared document model for SKILL.md and AGENT.md files
+A document reads its file once and derives front matter, body, sections,
+line events, code blocks and links lazily on first access; load_document()
+memoizes documents per process so tools run together never re-read or
+re-tokenize a file
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from profiling import span
+from skill_rules import (
+    FRONT_MATTER_DELIM,
+    CodeBlockCollector,
+    LineEvent,
+    LinkCollector,
+    run_events,
+    tokenize,
+)
+from skill_sections import index_sections
+
+try:
+    import yaml  # type: ignore[import-untyped,unused-ignore]
+except Exception:  # pragma: no cover
+    yaml = None  # type: ignore[assignment]
+
+# Total file size of the documents load_document() keeps; the least recently
+# loaded are dropped first. Parsed views hold several times the file size.
+MAX_CACHED_BYTES = 8 << 20
+# Files larger than this are returned uncached (the streaming validator's job)
+MAX_CACHED_DOCUMENT_BYTES = 1 << 20
+
+_UNSET: Any = object()
+
+
+def load_front_matter(fm_lines: list[str]) -> dict[str, Any]:
+    """Parse front matter lines (without the '---' delimiters) into a mapping"""
+    if yaml is None:
+        msg = "PyYAML not installed. Please add 'pyyaml' and re-run validator."
+        raise RuntimeError(msg)
+    try:
+        with span("yaml load"):
+            meta = yaml.safe_load("\n".join(fm_lines)) or {}
+    except Exception as e:  # pragma: no cover
+        msg = f"Failed to parse front matter YAML: {e}"
+        raise ValueError(msg) from e
+    if not isinstance(meta, dict):
+        msg = "Front matter must be a YAML mapping (object)"
+        raise ValueError(msg)
+    return meta
+
+
+class MarkdownDocument:
+    """
+    One markdown file with '---' YAML front matter
+
+    Every derived view is computed on first access and kept; `meta` re-raises
+    the same error on each access when the front matter is missing or invalid.
+    Body line numbers (events, code_blocks) are 1-based from the first body
+    line; add `body_start - 1` for file line numbers.
+    """
+
+    __slots__ = (
+        "_code_blocks",
+        "_data",
+        "_events",
+        "_front",
+        "_lines",
+        "_links",
+        "_meta",
+        "_sections",
+        "_text",
+        "path",
+    )
+
+    def __init__(self, path: Path, data: bytes | None = None) -> None:
+        self.path = path
+        self._data = data
+        self._text: str | None = None
+        self._lines: list[str] | None = None
+        self._front: tuple[list[str] | None, int, str | None] | None = None
+        self._meta: Any = _UNSET
+        self._sections: list[dict[str, Any]] | None = None
+        self._events: list[LineEvent] | None = None
+        self._code_blocks: list[tuple[int, int]] | None = None
+        self._links: list[str] | None = None
+
+    @classmethod
+    def from_text(cls, text: str, path: Path | None = None) -> MarkdownDocument:
+        return cls(path or Path("<memory>"), text.encode("utf-8"))
+
+    @property
+    def data(self) -> bytes:
+        """File bytes; re-encoded from `text` once that has been decoded"""
+        if self._data is not None:
+            return self._data
+        if self._text is not None:
+            return self._text.encode("utf-8")
+        with span("read"):
+            self._data = self.path.read_bytes()
+        return self._data
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.data.decode("utf-8")
+            # Strict UTF-8 round-trips exactly, so only one copy is kept
+            self._data = None
+        return self._text
+
+    @property
+    def lines(self) -> list[str]:
+        if self._lines is None:
+            self._lines = self.text.splitlines()
+        return self._lines
+
+    def _front_matter(self) -> tuple[list[str] | None, int, str | None]:
+        """(front matter lines or None, index of the first body line, error)"""
+        if self._front is None:
+            lines = self.lines
+            if not lines or not FRONT_MATTER_DELIM.match(lines[0]):
+                self._front = (None, 0, "Missing starting '---' for front matter")
+            else:
+                end = next(
+                    (i for i in range(1, len(lines)) if FRONT_MATTER_DELIM.match(lines[i])), None
+                )
+                if end is None:
+                    self._front = (None, 0, "Missing closing '---' for front matter")
+                else:
+                    self._front = (lines[1:end], end + 1, None)
+        return self._front
+
+    @property
+    def front_matter_error(self) -> str | None:
+        return self._front_matter()[2]
+
+    @property
+    def body_start(self) -> int:
+        """File line number (1-based) of the first body line"""
+        return self._front_matter()[1] + 1
+
+    @property
+    def meta(self) -> dict[str, Any]:
+        """Parsed front matter; raises ValueError/RuntimeError like the validators did"""
+        if self._meta is _UNSET:
+            fm_lines, _, error = self._front_matter()
+            try:
+                if fm_lines is None:
+                    raise ValueError(error)
+                self._meta = load_front_matter(fm_lines)
+            except (ValueError, RuntimeError) as e:
+                self._meta = e
+        if isinstance(self._meta, Exception):
+            raise self._meta
+        result: dict[str, Any] = self._meta
+        return result
+
+    def body_lines(self) -> Iterator[str]:
+        """Body lines after the front matter (the whole file if there is none)"""
+        return itertools.islice(self.lines, self._front_matter()[1], None)
+
+    @property
+    def body(self) -> str:
+        return "\n".join(self.body_lines())
+
+    @property
+    def sections(self) -> list[dict[str, Any]]:
+        """'## ' sections as {heading, offset, length} byte ranges (see skill_sections)"""
+        if self._sections is None:
+            with span("index sections"):
+                self._sections = index_sections(self.data)
+        return self._sections
+
+    @property
+    def events(self) -> list[LineEvent]:
+        """Body line events, tokenized once and shared by every rule run"""
+        if self._events is None:
+            with span("parse"):
+                self._events = list(tokenize(self.body_lines()))
+        return self._events
+
+    @property
+    def code_blocks(self) -> list[tuple[int, int]]:
+        """(open, close) body line numbers of every complete fenced block"""
+        if self._code_blocks is None:
+            collector = CodeBlockCollector()
+            run_events(self.events, [collector])
+            self._code_blocks = collector.blocks
+        return self._code_blocks
+
+    @property
+    def links(self) -> list[str]:
+        """HTTP(S) URLs in the body, in first-seen order"""
+        if self._links is None:
+            collector = LinkCollector()
+            run_events(self.events, [collector])
+            self._links = list(collector.urls)
+        return self._links
+
+    @property
+    def slug(self) -> str:
+        """Front matter slug, falling back to the directory name"""
+        try:
+            slug = self.meta.get("slug")
+        except (ValueError, RuntimeError):
+            slug = None
+        return str(slug or self.path.parent.name)
+
+
+class SkillDocument(MarkdownDocument):
+    """A skills/<slug>/SKILL.md file"""
+
+    __slots__ = ()
+
+
+class AgentDocument(MarkdownDocument):
+    """An agents/<slug>/AGENT.md file"""
+
+    __slots__ = ()
+
+
+_CacheKey = tuple[type[MarkdownDocument], Path]
+
+
+class _DocumentCache:
+    """Least recently loaded documents, bounded by their total file size"""
+
+    def __init__(self) -> None:
+        self.entries: OrderedDict[_CacheKey, tuple[tuple[int, int], MarkdownDocument]] = (
+            OrderedDict()
+        )
+        self.size = 0
+
+    def get(self, key: _CacheKey, stamp: tuple[int, int]) -> MarkdownDocument | None:
+        cached = self.entries.get(key)
+        if cached is None or cached[0] != stamp:
+            return None
+        self.entries.move_to_end(key)
+        return cached[1]
+
+    def put(self, key: _CacheKey, stamp: tuple[int, int], doc: MarkdownDocument) -> None:
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= old[0][1]
+        if stamp[1] > MAX_CACHED_DOCUMENT_BYTES:
+            return
+        self.entries[key] = (stamp, doc)
+        self.size += stamp[1]
+        while self.size > MAX_CACHED_BYTES:
+            _, (evicted, _) = self.entries.popitem(last=False)
+            self.size -= evicted[1]
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.size = 0
+
+
+_cache = _DocumentCache()
+
+
+def load_document(path: Path, kind: type[MarkdownDocument] = SkillDocument) -> MarkdownDocument:
+    """
+    Process-wide memoized document for `path`
+
+    Entries are keyed on the resolved path and revalidated against
+    (mtime_ns, size), so an edited file is re-read on the next call. Files
+    above MAX_CACHED_DOCUMENT_BYTES get a fresh, uncached document.
+    """
+    key = (kind, path.resolve())
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    doc = _cache.get(key, stamp)
+    if doc is None:
+        doc = kind(path)
+        _cache.put(key, stamp, doc)
+    return doc
+
+
+def clear_document_cache() -> None:
+    _cache.clear()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Single-pass rule engine for SKILL.md checks
+Tokenizes a document once into line events and runs every rule as a visitor,
+so a file costs O(lines) no matter how many rules are registered
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import ClassVar
+
+FRONT_MATTER_DELIM = re.compile(r"^---\s*$")
+HEADING_PREFIX = re.compile(r"^(#{1,6}) ")
+FENCE_MARKER = "```"
+
+# Event kinds
+HEADING = "heading"
+FENCE_OPEN = "fence_open"
+FENCE_CLOSE = "fence_close"
+TEXT = "text"
+ALL_KINDS = frozenset({HEADING, FENCE_OPEN, FENCE_CLOSE, TEXT})
+
+
+@dataclass(frozen=True, slots=True)
+class LineEvent:
+    kind: str
+    lineno: int  # 1-based, counted from the first body line
+    text: str
+    level: int = 0  # heading level for HEADING events
+    in_fence: bool = False  # for HEADING events: the line sits inside a fenced block
+
+
+@dataclass
+class RuleIssue:
+    message: str
+    severity: str = "ERROR"  # ERROR or WARN
+
+
+class Rule:
+    """
+    Visitor over line events; one instance per document
+
+    Subclasses set `kinds` to the event kinds they need (the engine only
+    dispatches those), handle them in visit(), and report in finish().
+    """
+
+    kinds: ClassVar[frozenset[str]] = ALL_KINDS
+
+    def visit(self, event: LineEvent) -> None:
+        """Handle one event"""
+
+    def finish(self) -> list[RuleIssue]:
+        """Issues found once the document has been fully visited"""
+        return []
+
+
+def iter_lines(f: Iterable[str]) -> Iterator[str]:
+    """
+    Lines of a text-mode file, split exactly as str.splitlines() splits the whole text
+
+    Reads incrementally, so memory stays at O(longest line).
+    """
+    for line in f:
+        yield from line.splitlines()
+
+
+def tokenize(lines: Iterable[str]) -> Iterator[LineEvent]:
+    """
+    Turn body lines into events
+
+    A line starting with ``` toggles a fenced block. '#' lines are reported
+    as headings everywhere (as the original regex checks did) and carry
+    in_fence so rules can ignore commented code. Every line yields exactly
+    one event.
+    """
+    in_fence = False
+    for lineno, text in enumerate(lines, start=1):
+        if text.startswith(FENCE_MARKER):
+            kind = FENCE_CLOSE if in_fence else FENCE_OPEN
+            in_fence = not in_fence
+            yield LineEvent(kind, lineno, text)
+        elif text.startswith("#") and (m := HEADING_PREFIX.match(text)):
+            yield LineEvent(HEADING, lineno, text, len(m.group(1)), in_fence)
+        else:
+            yield LineEvent(TEXT, lineno, text)
+
+
+def run_rules(lines: Iterable[str], rules: Sequence[Rule]) -> list[RuleIssue]:
+    """Run every rule over the body in a single pass; issues come back in rule order"""
+    return run_events(tokenize(lines), rules)
+
+
+def run_events(events: Iterable[LineEvent], rules: Sequence[Rule]) -> list[RuleIssue]:
+    """run_rules() over already tokenized events (e.g. SkillDocument.events)"""
+    dispatch: dict[str, list[Rule]] = {kind: [] for kind in ALL_KINDS}
+    for rule in rules:
+        for kind in rule.kinds:
+            dispatch[kind].append(rule)
+    handlers = {kind: [r.visit for r in subs] for kind, subs in dispatch.items()}
+
+    for event in events:
+        for visit in handlers[event.kind]:
+            visit(event)
+
+    issues: list[RuleIssue] = []
+    for rule in rules:
+        issues.extend(rule.finish())
+    return issues
+
+
+def split_front_matter(
+    lines: Iterable[str],
+) -> tuple[list[str] | None, Iterator[str], str | None]:
+    """
+    Split '---' delimited front matter from the body without copying the body
+
+    Returns (front matter lines, body lines, error). When the front matter is
+    missing or unclosed, front matter is None, error says why and the body
+    iterator yields the whole document.
+    """
+    it = iter(lines)
+    first = next(it, None)
+    if first is None:
+        return None, iter(()), "Missing starting '---' for front matter"
+    if not FRONT_MATTER_DELIM.match(first):
+        return None, itertools.chain([first], it), "Missing starting '---' for front matter"
+
+    fm_lines: list[str] = []
+    for line in it:
+        if FRONT_MATTER_DELIM.match(line):
+            return fm_lines, it, None
+        fm_lines.append(line)
+    return None, iter([first, *fm_lines]), "Missing closing '---' for front matter"
+
+
+class CodeBlockCollector(Rule):
+    """Record (open, close) line numbers of every complete fenced block"""
+
+    kinds = frozenset({FENCE_OPEN, FENCE_CLOSE})
+
+    def __init__(self) -> None:
+        self.blocks: list[tuple[int, int]] = []
+        self.open_line: int | None = None
+
+    def visit(self, event: LineEvent) -> None:
+        if event.kind == FENCE_OPEN:
+            self.open_line = event.lineno
+        elif self.open_line is not None:
+            self.blocks.append((self.open_line, event.lineno))
+            self.open_line = None
+
+
+MD_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+BARE_URL_PATTERN = re.compile(r'https?://[^\s<>"\)]+')
+
+
+class LinkCollector(Rule):
+    """Collect HTTP(S) URLs from markdown links and bare URLs, in first-seen order"""
+
+    def __init__(self) -> None:
+        self.urls: dict[str, None] = {}
+
+    def visit(self, event: LineEvent) -> None:
+        text = event.text
+        if "http" not in text:
+            return
+        # Match markdown links [text](url) and bare URLs
+        for match in MD_LINK_PATTERN.finditer(text):
+            url = match.group(2)
+            if url.startswith(("http://", "https://")):
+                self.urls[url] = None
+        # Extract bare URLs (not already in markdown links)
+        for match in BARE_URL_PATTERN.finditer(MD_LINK_PATTERN.sub("", text)):
+            self.urls[match.group(0)] = None
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Byte-offset section index for SKILL.md files
+Lets a runtime read only the '## ' sections it needs instead of the whole file
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import re
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+# Files at or above this size are mmapped; smaller files use seek + read.
+MMAP_THRESHOLD = 1 << 20
+
+FRONT_MATTER_DELIM = re.compile(rb"^---\s*$")
+FENCE = re.compile(rb"^```")
+SECTION_HEADING = re.compile(rb"^## (.+?)\s*$")
+
+
+def index_sections(data: bytes) -> list[dict[str, Any]]:
+    """
+    Return {heading, offset, length} for every '## ' section of a SKILL.md
+
+    A section runs from its heading line to the next '## ' heading (or EOF).
+    Headings inside the front matter or fenced code blocks are ignored.
+    """
+    sections: list[dict[str, Any]] = []
+    size = len(data)
+    pos = 0
+    in_front_matter = False
+    in_fence = False
+    first_line = True
+
+    while pos < size:
+        nl = data.find(b"\n", pos)
+        end = size if nl == -1 else nl + 1
+        line = data[pos:end].rstrip(b"\r\n")
+
+        if first_line:
+            first_line = False
+            if FRONT_MATTER_DELIM.match(line):
+                in_front_matter = True
+                pos = end
+                continue
+        if in_front_matter:
+            if FRONT_MATTER_DELIM.match(line):
+                in_front_matter = False
+        elif FENCE.match(line):
+            in_fence = not in_fence
+        elif not in_fence:
+            m = SECTION_HEADING.match(line)
+            if m:
+                if sections:
+                    sections[-1]["length"] = pos - sections[-1]["offset"]
+                heading = m.group(1).decode("utf-8", errors="replace")
+                sections.append({"heading": heading, "offset": pos, "length": 0})
+        pos = end
+
+    if sections:
+        sections[-1]["length"] = size - sections[-1]["offset"]
+    return sections
+
+
+def normalize_heading(heading: str) -> str:
+    """Accept both 'Output Contract' and '## Output Contract'"""
+    return heading.lstrip("#").strip()
+
+
+def _is_section(chunk: bytes, heading: str, following: bytes) -> bool:
+    """
+    Whether chunk is still exactly the section recorded for heading
+
+    It must index as that one section (heading line first, no other heading or
+    open fence inside) and the bytes after it must be EOF or the next heading.
+    """
+    found = index_sections(chunk)
+    return (
+        len(found) == 1
+        and found[0]["heading"] == heading
+        and found[0]["offset"] == 0
+        and (following == b"" or following == b"## ")
+    )
+
+
+def _read_spans(
+    f: BinaryIO, spans: list[dict[str, Any]], file_size: int, mmap_threshold: int
+) -> list[tuple[bytes, bytes]]:
+    """(section bytes, the 3 bytes after it) for each span"""
+    peek = len(b"## ")
+    if file_size >= mmap_threshold:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [
+                (
+                    mm[s["offset"] : s["offset"] + s["length"]],
+                    mm[s["offset"] + s["length"] : s["offset"] + s["length"] + peek],
+                )
+                for s in spans
+            ]
+    out = []
+    for s in spans:
+        f.seek(s["offset"])
+        data = f.read(s["length"] + peek)
+        out.append((data[: s["length"]], data[s["length"] :]))
+    return out
+
+
+def read_sections(
+    path: Path | str,
+    headings: Iterable[str] | None = None,
+    sections: list[dict[str, Any]] | None = None,
+    size: int | None = None,
+    mmap_threshold: int = MMAP_THRESHOLD,
+) -> dict[str, str]:
+    """
+    Read the requested sections of a SKILL.md without loading the rest of it
+
+    Args:
+        path: SKILL.md path
+        headings: Section headings to return (default: all sections)
+        sections: Precomputed offset table from the index (see index_sections)
+        size: File size the offset table was built against; if the file on disk
+            differs, the table is stale and the file is re-indexed
+        mmap_threshold: Files at least this large are mmapped instead of read
+
+    Returns:
+        {heading: section text (including the heading line)}, in file order.
+        When a heading occurs more than once, the first occurrence wins.
+
+    A precomputed table is also re-indexed when a slice it points at is no
+    longer its section (an edit that kept the file size but moved a heading).
+    """
+    path = Path(path)
+    wanted = None if headings is None else {normalize_heading(h) for h in headings}
+
+    with open(path, "rb") as f:
+        file_size = f.seek(0, 2)
+        reindex = sections is None or (size is not None and size != file_size)
+        while True:
+            if reindex or sections is None:
+                f.seek(0)
+                sections = index_sections(f.read())
+
+            selected: dict[str, dict[str, Any]] = {}
+            for sect in sections:
+                name = sect["heading"]
+                if (wanted is None or name in wanted) and name not in selected:
+                    selected[name] = sect
+            if not selected:
+                return {}
+
+            spans = sorted(selected.values(), key=lambda s: int(s["offset"]))
+            chunks = _read_spans(f, spans, file_size, mmap_threshold)
+            if reindex or all(
+                _is_section(chunk, s["heading"], following)
+                for s, (chunk, following) in zip(spans, chunks, strict=True)
+            ):
+                break
+            reindex = True
+
+    return {
+        s["heading"]: chunk.decode("utf-8") for s, (chunk, _) in zip(spans, chunks, strict=True)
+    }
+
+
+def load_skill_sections(
+    entry: dict[str, Any], headings: Iterable[str] | None = None, root: Path | None = None
+) -> dict[str, str]:
+    """Read sections of the skill behind a skills-index.json entry"""
+    path = Path(entry["entry"])
+    if not path.is_absolute() and root is not None:
+        path = root / path
+    return read_sections(path, headings, sections=entry.get("sections"), size=entry.get("bytes"))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Print selected sections of a skill")
+    ap.add_argument("slug", help="Skill slug")
+    ap.add_argument(
+        "--section",
+        action="append",
+        default=None,
+        help="Section heading to print (repeatable; default: list headings)",
+    )
+    ap.add_argument("--root", type=Path, default=Path("."), help="Repo root")
+    ap.add_argument(
+        "--index",
+        type=Path,
+        default=None,
+        help="skills-index.json path (default: <root>/index/skills-index.json)",
+    )
+    args = ap.parse_args()
+
+    root: Path = args.root.resolve()
+    index_path = args.index or (root / "index" / "skills-index.json")
+    entries = {e["slug"]: e for e in json.loads(index_path.read_text(encoding="utf-8"))}
+    entry = entries.get(args.slug)
+    if entry is None:
+        print(f"ERROR: unknown skill: {args.slug}", file=sys.stderr)
+        return 2
+
+    if not args.section:
+        sections = entry.get("sections")
+        if sections is None:
+            sections = index_sections(Path(entry["entry"]).read_bytes())
+        for sect in sections:
+            print(f"{sect['offset']:>8} {sect['length']:>7}  {sect['heading']}")
+        return 0
+
+    for text in load_skill_sections(entry, args.section, root=root).values():
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
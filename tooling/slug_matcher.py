@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Single-pass slug matcher for agent dependency extraction
+Every known skill and agent slug is compiled into one trie-shaped regex with
+slug-boundary lookarounds, so each AGENT.md is scanned once in time linear in
+its length whatever the size of the catalog
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from pathlib import Path
+
+from skill_document import AgentDocument, load_document
+from trie_regex import trie_pattern
+
+# Characters that continue a slug; a match must not touch one on either side,
+# so `api-design` is not found inside `api-design-validator`
+SLUG_CHARS = "a-z0-9-"
+
+
+@dataclass(frozen=True)
+class SlugReferences:
+    """Distinct slugs mentioned by one document, sorted"""
+
+    skills: tuple[str, ...]
+    agents: tuple[str, ...]
+
+
+class SlugMatcher:
+    """
+    Find mentions of known skill and agent slugs in text
+
+    Backticked (`slug`) and bare mentions are both found. At a given position
+    the longest slug wins; shorter slugs only match when the longer one is
+    not followed by a slug boundary.
+    """
+
+    def __init__(self, skills: Iterable[str], agents: Iterable[str] = ()) -> None:
+        self.skills = frozenset(skills)
+        self.agents = frozenset(agents) - self.skills
+        words = self.skills | self.agents
+        self.regex = re.compile(
+            f"(?<![{SLUG_CHARS}]){trie_pattern(sorted(words))}(?![{SLUG_CHARS}])"
+        )
+
+    def find(self, text: str) -> set[str]:
+        """Distinct known slugs mentioned in `text`"""
+        return set(self.regex.findall(text))
+
+    def references(self, text: str, exclude: str | None = None) -> SlugReferences:
+        """Skill and agent mentions in `text`, leaving out `exclude` (the document's own slug)"""
+        found = self.find(text)
+        if exclude:
+            found.discard(exclude)
+        return SlugReferences(
+            skills=tuple(sorted(found & self.skills)),
+            agents=tuple(sorted(found & self.agents)),
+        )
+
+
+@lru_cache(maxsize=4)
+def get_matcher(skills: tuple[str, ...], agents: tuple[str, ...] = ()) -> SlugMatcher:
+    """Shared matcher per slug set (compiling the regex once per process)"""
+    return SlugMatcher(skills, agents)
+
+
+def scan_agent(path: Path, skills: tuple[str, ...], agents: tuple[str, ...] = ()) -> SlugReferences:
+    doc = load_document(path, AgentDocument)
+    return get_matcher(skills, agents).references(doc.text, exclude=doc.slug)
+
+
+def scan_agents(
+    paths: list[Path],
+    skills: Iterable[str],
+    agents: Iterable[str] = (),
+    jobs: int = 1,
+) -> list[SlugReferences]:
+    """References for each AGENT.md in `paths`, in input order; jobs > 1 uses a process pool"""
+    scan = partial(scan_agent, skills=tuple(sorted(skills)), agents=tuple(sorted(agents)))
+    if jobs <= 1 or len(paths) <= 1:
+        return list(map(scan, paths))
+
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(scan, paths, chunksize=chunksize))
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Token estimation and budget-constrained selection
+Pluggable tokenizers (offline character-ratio fallback) and a small knapsack solver
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any
+
+Tokenizer = Callable[[str], int]
+
+# Rough average for English prose and Markdown with cl100k-style BPE vocabularies
+CHARS_PER_TOKEN = 4.0
+
+# Upper bound on knapsack DP columns; weights are rounded up to fit, so a
+# solution never exceeds the budget, it can only leave a little unused.
+MAX_DP_COLUMNS = 4096
+
+
+def char_ratio_tokens(text: str) -> int:
+    """Estimate token count from character length (no dependencies, no network)"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _tiktoken_factory() -> Tokenizer:
+    import tiktoken  # type: ignore[import-not-found,unused-ignore]
+
+    # get_encoding() may need to download the BPE file; failures fall back to chars
+    encoding = tiktoken.get_encoding("cl100k_base")
+
+    def count(text: str) -> int:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    return count
+
+
+_TOKENIZER_FACTORIES: dict[str, Callable[[], Tokenizer]] = {
+    "chars": lambda: char_ratio_tokens,
+    "tiktoken": _tiktoken_factory,
+}
+
+
+def register_tokenizer(name: str, factory: Callable[[], Tokenizer]) -> None:
+    """Register a tokenizer factory under `name` (called lazily by get_tokenizer)"""
+    _TOKENIZER_FACTORIES[name] = factory
+
+
+def available_tokenizers() -> list[str]:
+    return sorted(_TOKENIZER_FACTORIES)
+
+
+def get_tokenizer(name: str = "chars") -> Tokenizer:
+    """Return the named tokenizer, falling back to the character ratio if it can't load"""
+    factory = _TOKENIZER_FACTORIES.get(name)
+    if factory is None:
+        msg = f"Unknown tokenizer: {name} (available: {', '.join(available_tokenizers())})"
+        raise ValueError(msg)
+    try:
+        return factory()
+    except Exception as e:
+        print(f"WARN: tokenizer '{name}' unavailable ({e}); using chars", file=sys.stderr)
+        return char_ratio_tokens
+
+
+def estimate_skill_tokens(
+    data: bytes, sections: list[dict[str, Any]], tokenizer: Tokenizer = char_ratio_tokens
+) -> dict[str, int]:
+    """
+    Annotate each section dict with a "tokens" estimate
+
+    Returns {"front_matter": n, "total": n}; "front_matter" covers everything
+    before the first '## ' section (YAML header plus any preamble).
+    """
+    header_end = sections[0]["offset"] if sections else len(data)
+    front_matter = tokenizer(data[:header_end].decode("utf-8"))
+    total = front_matter
+    for sect in sections:
+        chunk = data[sect["offset"] : sect["offset"] + sect["length"]]
+        sect["tokens"] = tokenizer(chunk.decode("utf-8"))
+        total += sect["tokens"]
+    return {"front_matter": front_matter, "total": total}
+
+
+def select_within_budget(
+    items: Sequence[tuple[Hashable, float, int]], budget: int
+) -> list[Hashable]:
+    """
+    0/1 knapsack: pick keys maximizing total value with total weight <= budget
+
+    Args:
+        items: (key, value, weight) triples; weight in tokens
+        budget: Token budget
+
+    Returns:
+        Selected keys in input order
+    """
+    if budget <= 0:
+        return []
+    fitting = [(i, v, w) for i, (_, v, w) in enumerate(items) if w <= budget and v > 0]
+    if not fitting:
+        return []
+
+    scale = max(1, math.ceil(budget / MAX_DP_COLUMNS))
+    capacity = budget // scale
+    # best[c] = (value, chosen indices) using at most c scaled units
+    best: list[tuple[float, tuple[int, ...]]] = [(0.0, ())] * (capacity + 1)
+    for idx, value, weight in fitting:
+        units = max(1, math.ceil(weight / scale))
+        if units > capacity:
+            continue
+        for c in range(capacity, units - 1, -1):
+            candidate = best[c - units][0] + value
+            if candidate > best[c][0]:
+                best[c] = (candidate, (*best[c - units][1], idx))
+
+    chosen = set(best[capacity][1])
+    return [items[i][0] for i in range(len(items)) if i in chosen]
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Compile a word list into a trie-shaped regular expression
+Alternatives that share a prefix share one branch, so the regex engine does
+O(longest word) work per position instead of O(number of words)
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+_END = ""  # trie key marking the end of a word
+
+
+def _build_trie(words: Iterable[str]) -> dict[str, Any]:
+    trie: dict[str, Any] = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[_END] = True
+    return trie
+
+
+def _node_pattern(node: dict[str, Any]) -> str:
+    """Pattern for the word suffixes below `node` (words ending at node excluded)"""
+    branches = []
+    for ch in sorted(k for k in node if k != _END):
+        child = node[ch]
+        # Collapse single-child chains into one literal run
+        run = [ch]
+        while _END not in child and len(child) == 1:
+            ((next_ch, child),) = child.items()
+            run.append(next_ch)
+        literal = re.escape("".join(run))
+        if all(k == _END for k in child):
+            branches.append(literal)
+        elif _END in child:
+            # Greedy optional suffix: the longer word is tried first
+            branches.append(f"{literal}(?:{_node_pattern(child)})?")
+        else:
+            branches.append(literal + _node_pattern(child))
+    return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex source matching any of `words`, longest alternative first
+
+    The result is a non-capturing expression; wrap it in lookarounds or a
+    group as needed. Matching is greedy, so at a given position the longest
+    word wins and shorter words are tried only on backtracking.
+    """
+    trie = _build_trie(words)
+    if not trie:
+        return "(?!)"  # matches nothing
+    return _node_pattern(trie)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+JSON Schema validation for catalog metadata
+Checks skills/*/index-entry.json, index/agents-index.json, index/skills-index.json
+and tests/evals_*.yaml against tooling/schemas/, compiling each schema once per process
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+try:
+    import yaml  # type: ignore[import-untyped,unused-ignore]
+except Exception:  # pragma: no cover
+    yaml = None  # type: ignore[assignment]
+
+# Longer schema messages (they embed the offending value) are cut to this length
+MAX_MESSAGE_LEN = 200
+
+SCHEMA_DIR = Path(__file__).resolve().parent / "schemas"
+
+# kind -> repo-relative glob of the files it covers
+CATALOG_KINDS: dict[str, str] = {
+    "index-entry": "skills/*/index-entry.json",
+    "agents-index": "index/agents-index.json",
+    "skills-index": "index/skills-index.json",
+    "evals": "tests/evals_*.yaml",
+}
+
+
+@dataclass
+class CatalogIssue:
+    path: Path
+    message: str
+
+
+def yaml_loader() -> Any:
+    """libyaml-backed SafeLoader when available (several times faster), else the pure one"""
+    if yaml is None:
+        msg = "PyYAML not installed. Please add 'pyyaml'."
+        raise RuntimeError(msg)
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@cache
+def get_validator(kind: str) -> Any:
+    """Checked and compiled validator for a catalog kind, built once per process"""
+    # Imported here rather than at module level: it is a large import that
+    # commands which only read YAML (run_evals, analyze_agent_dependencies) never need
+    try:
+        import jsonschema
+    except ImportError:  # pragma: no cover
+        msg = "jsonschema not installed. Please add 'jsonschema'."
+        raise RuntimeError(msg) from None
+    if kind not in CATALOG_KINDS:
+        msg = f"Unknown catalog kind: {kind} (expected one of {', '.join(CATALOG_KINDS)})"
+        raise ValueError(msg)
+    schema = json.loads((SCHEMA_DIR / f"{kind}.schema.json").read_text(encoding="utf-8"))
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def load_data(path: Path) -> Any:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix in {".yaml", ".yml"}:
+        return yaml.load(text, Loader=yaml_loader())
+    return json.loads(text)
+
+
+def _most_relevant(error: Any) -> Any:
+    """
+    For oneOf/anyOf failures, the error inside the branch that fit best
+
+    Branches rejected only for the wrong top-level type are skipped, so a list
+    of scenarios reports the bad scenario rather than "is not of type object".
+    """
+    from jsonschema.exceptions import best_match
+
+    while error.context:
+        branch_errors = [
+            e for e in error.context if not (e.validator == "type" and not e.relative_path)
+        ]
+        if not branch_errors:
+            break
+        error = best_match(branch_errors)
+    return error
+
+
+def validate_data(data: Any, kind: str, path: Path) -> list[CatalogIssue]:
+    """Schema errors for already loaded data, ordered by location"""
+    located = []
+    for error in get_validator(kind).iter_errors(data):
+        error = _most_relevant(error)  # noqa: PLW2901
+        message = error.message
+        if len(message) > MAX_MESSAGE_LEN:
+            message = message[: MAX_MESSAGE_LEN - 3] + "..."
+        located.append((list(map(str, error.absolute_path)), message))
+    located.sort()
+    return [CatalogIssue(path, f"{'/'.join(where) or '<root>'}: {msg}") for where, msg in located]
+
+
+def validate_file(path: Path, kind: str) -> list[CatalogIssue]:
+    try:
+        data = load_data(path)
+    except Exception as e:
+        return [CatalogIssue(path, f"Parse error: {e}")]
+    return validate_data(data, kind, path)
+
+
+def _validate_target(target: tuple[Path, str]) -> list[CatalogIssue]:
+    return validate_file(*target)
+
+
+def collect_targets(root: Path, kinds: list[str] | None = None) -> list[tuple[Path, str]]:
+    """(path, kind) pairs for every catalog file under `root`"""
+    targets: list[tuple[Path, str]] = []
+    for kind in kinds or CATALOG_KINDS:
+        targets.extend((p, kind) for p in sorted(root.glob(CATALOG_KINDS[kind])))
+    return targets
+
+
+def iter_catalog_results(
+    targets: list[tuple[Path, str]], jobs: int = 1
+) -> Iterator[tuple[Path, list[CatalogIssue]]]:
+    """Yield (path, issues) in input order; jobs > 1 spreads files over processes"""
+    if jobs <= 1 or len(targets) <= 1:
+        for target in targets:
+            yield target[0], _validate_target(target)
+        return
+
+    chunksize = max(1, len(targets) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(_validate_target, targets, chunksize=chunksize)
+        yield from zip((p for p, _ in targets), results, strict=True)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Validate catalog JSON/YAML files against schemas")
+    ap.add_argument("--root", type=Path, default=Path("."), help="Repo root (default: .)")
+    ap.add_argument(
+        "--kind",
+        action="append",
+        choices=sorted(CATALOG_KINDS),
+        default=None,
+        help="Only validate these kinds (repeatable; default: all)",
+    )
+    ap.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Validate files across N processes (0 = one per CPU; default: 1)",
+    )
+    ap.add_argument("--quiet", "-q", action="store_true", help="Only print failures")
+    args = ap.parse_args()
+
+    root: Path = args.root.resolve()
+    targets = collect_targets(root, args.kind)
+    if not targets:
+        print("No catalog files found.")
+        return 0
+
+    start = time.perf_counter()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    total_issues: list[CatalogIssue] = []
+    try:
+        for p, issues in iter_catalog_results(targets, jobs):
+            if issues:
+                for issue in issues:
+                    print(f"[FAIL] {issue.path}: {issue.message}")
+                total_issues.extend(issues)
+            elif not args.quiet:
+                print(f"[OK]   {p}")
+    except RuntimeError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+
+    if total_issues:
+        print(
+            f"\n{len(total_issues)} issue(s) found across {len(targets)} file(s).",
+            file=sys.stderr,
+        )
+        return 1
+    print(f"\nAll {len(targets)} catalog file(s) match their schemas ({elapsed:.2f}s).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,18 +2,51 @@
 from __future__ import annotations
 
 import argparse
+import os
 import re
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from profiling import add_profiling_args, profiled, span
+from result_cache import CACHE_DIR_NAME, ResultCache, tool_fingerprint
+from secret_scan import (
+    DEFAULT_PATTERNS,
+    SecretFinding,
+    SecretPattern,
+    SecretScanner,
+    get_scanner,
+    iter_asset_files,
+    load_patterns,
+    scan_file,
+)
+from skill_document import load_document, load_front_matter
+from skill_rules import (
+    FENCE_CLOSE,
+    FENCE_OPEN,
+    HEADING,
+    CodeBlockCollector,
+    LineEvent,
+    Rule,
+    RuleIssue,
+    iter_lines,
+    run_events,
+    run_rules,
+    split_front_matter,
+)
+
 try:
     import yaml  # type: ignore[import-untyped,unused-ignore]
 except Exception:  # pragma: no cover
     yaml = None  # type: ignore[assignment]
 
-FRONT_MATTER_DELIM = re.compile(r"^---\s*$")
+# Modules whose source changes invalidate cached validation results
+CACHE_MODULES = ["validate_skill", "skill_document", "skill_rules", "secret_scan", "trie_regex"]
+
 REQ_META_KEYS = {
     "name",
     "slug",
@@ -41,13 +74,11 @@ MAX_DESCRIPTION_LEN = 160
 MAX_EXAMPLE_LINES = 30
 MAX_CODEBLOCK_LINES = 200
 
-SECRET_PATTERNS = [
-    re.compile(r"AKIA[0-9A-Z]{16}"),  # AWS access key id
-    re.compile(r"BEGIN (?:RSA |EC |)PRIVATE KEY"),
-    re.compile(r"ssh-rsa "),
-    re.compile(r"(?i)password\s*[:=]\s*[^\s]{6,}"),
-    re.compile(r"(?i)secret\s*[:=]\s*[^\s]{6,}"),
-]
+# Files at or above this size are validated in streaming mode by default
+STREAM_THRESHOLD = 4 << 20
+
+# Compiled regexes of the built-in detectors (see secret_scan.DEFAULT_PATTERNS)
+SECRET_PATTERNS = [p.regex for p in DEFAULT_PATTERNS]
 
 
 @dataclass
@@ -66,96 +97,260 @@ def read_text(p: Path) -> str:
     return p.read_text(encoding="utf-8")
 
 
+def parse_front_matter(lines: Iterable[str]) -> tuple[dict[str, Any], Iterator[str], int]:
+    """
+    Parse YAML front matter without joining the body.
+
+    Returns (meta, body lines, file line number of the first body line).
+    """
+    fm_lines, body_lines, error = split_front_matter(lines)
+    if fm_lines is None:
+        raise ValueError(error)
+
+    return load_front_matter(fm_lines), body_lines, len(fm_lines) + 3
+
+
 def extract_front_matter(md_text: str) -> FrontMatter:
     """Extract YAML front matter delimited by '---' at the top of the file."""
-    lines = md_text.splitlines()
-    if not lines or not FRONT_MATTER_DELIM.match(lines[0]):
-        msg = "Missing starting '---' for front matter"
-        raise ValueError(msg)
-    # find closing '---'
-    end_idx = None
-    for i in range(1, len(lines)):
-        if FRONT_MATTER_DELIM.match(lines[i]):
-            end_idx = i
-            break
-    if end_idx is None:
-        msg = "Missing closing '---' for front matter"
-        raise ValueError(msg)
-
-    fm_text = "\n".join(lines[1:end_idx])
-    body = "\n".join(lines[end_idx + 1 :])
-
-    if yaml is None:
-        msg = "PyYAML not installed. Please add 'pyyaml' and re-run validator."
-        raise RuntimeError(msg)
-    try:
-        meta = yaml.safe_load(fm_text) or {}
-    except Exception as e:  # pragma: no cover
-        msg = f"Failed to parse front matter YAML: {e}"
-        raise ValueError(msg) from e
+    meta, body_lines, _ = parse_front_matter(md_text.splitlines())
+    return FrontMatter(meta=meta, body="\n".join(body_lines))
+
+
+class RequiredSectionsRule(Rule):
+    """Every REQ_BODY_SECTIONS heading must be present."""
+
+    kinds = frozenset({HEADING})
+
+    def __init__(self, sections: list[str] = REQ_BODY_SECTIONS) -> None:
+        self.missing = dict.fromkeys(sections)
+
+    def visit(self, event: LineEvent) -> None:
+        self.missing.pop(event.text.rstrip(), None)
+
+    def finish(self) -> list[RuleIssue]:
+        return [RuleIssue(f"Missing required section heading: {s}") for s in self.missing]
+
+
+class TokenBudgetRule(Rule):
+    """T1, T2 and T3 must all be mentioned somewhere in the body."""
+
+    pattern = re.compile(r"\bT([123])\b")
+
+    def __init__(self) -> None:
+        self.seen: set[str] = set()
+
+    def visit(self, event: LineEvent) -> None:
+        if len(self.seen) < 3 and "T" in event.text:
+            self.seen.update(self.pattern.findall(event.text))
 
-    if not isinstance(meta, dict):
-        msg = "Front matter must be a YAML mapping (object)"
-        raise ValueError(msg)
+    def finish(self) -> list[RuleIssue]:
+        if len(self.seen) == 3:
+            return []
+        return [RuleIssue("Token budgets (T1/T2/T3) not found")]
 
-    return FrontMatter(meta=meta, body=body)
+
+class ExamplesBlockRule(Rule):
+    """The first code block under '## Examples' must exist and stay short."""
+
+    kinds = frozenset({HEADING, FENCE_OPEN, FENCE_CLOSE})
+    heading = re.compile(r"^## Examples\s*$")
+
+    def __init__(self, max_lines: int = MAX_EXAMPLE_LINES) -> None:
+        self.max_lines = max_lines
+        self.in_examples = False
+        self.done = False
+        self.open_line: int | None = None
+        self.length: int | None = None
+
+    def visit(self, event: LineEvent) -> None:
+        if self.done:
+            return
+        if event.kind == HEADING:
+            if self.heading.match(event.text):
+                # The block must sit before any repeated '## Examples' heading
+                self.done = self.in_examples
+                self.in_examples = True
+        elif not self.in_examples:
+            return
+        # Fences pair up afresh from the Examples heading on
+        elif self.open_line is None:
+            self.open_line = event.lineno
+        else:
+            self.length = max(0, event.lineno - self.open_line - 1)  # exclude fence lines
+            self.done = True
+
+    def finish(self) -> list[RuleIssue]:
+        if self.length is None:
+            return [RuleIssue("No code example found under '## Examples'")]
+        if self.length > self.max_lines:
+            return [RuleIssue(f"Example too long: {self.length} lines (max {self.max_lines})")]
+        return []
+
+
+class CodeBlockLengthRule(Rule):
+    """No fenced code block may exceed MAX_CODEBLOCK_LINES."""
+
+    kinds = frozenset({FENCE_OPEN, FENCE_CLOSE})
+
+    def __init__(self, max_lines: int = MAX_CODEBLOCK_LINES) -> None:
+        self.max_lines = max_lines
+        self.open_line: int | None = None
+        self.issues: list[RuleIssue] = []
+
+    def visit(self, event: LineEvent) -> None:
+        if event.kind == FENCE_OPEN:
+            self.open_line = event.lineno
+        elif self.open_line is not None:
+            n = max(0, event.lineno - self.open_line - 1)
+            if n > self.max_lines:
+                self.issues.append(
+                    RuleIssue(f"Code block too long: {n} lines (max {self.max_lines})")
+                )
+            self.open_line = None
+
+    def finish(self) -> list[RuleIssue]:
+        return self.issues
+
+
+class SecretsRule(Rule):
+    """Report every secret finding with its file line and column."""
+
+    def __init__(self, scanner: SecretScanner | None = None, first_lineno: int = 1) -> None:
+        self.scanner = scanner or get_scanner()
+        self.line_offset = first_lineno - 1
+        self.stream = self.scanner.stream()
+        self.findings: list[SecretFinding] = []
+
+    def visit(self, event: LineEvent) -> None:
+        self.findings.extend(self.stream.push(event.text, event.lineno + self.line_offset))
+
+    def finish(self) -> list[RuleIssue]:
+        self.findings.extend(self.stream.flush())
+        return [RuleIssue(secret_message(f)) for f in self.findings]
+
+
+def secret_message(finding: SecretFinding) -> str:
+    return (
+        f"Potential secret matched pattern: {finding.pattern.regex.pattern}"
+        f" (line {finding.line}, col {finding.column})"
+    )
+
+
+# Body rules in reporting order; each file gets fresh instances
+VALIDATION_RULES: list[type[Rule]] = [
+    RequiredSectionsRule,
+    TokenBudgetRule,
+    ExamplesBlockRule,
+    CodeBlockLengthRule,
+]
 
 
 def find_code_blocks(text: str) -> list[tuple[int, int]]:
     """Return list of (start_line_idx, end_line_idx) for fenced code blocks."""
-    blocks: list[tuple[int, int]] = []
-    fence = re.compile(r"^```")
-    lines = text.splitlines()
-    open_idx: int | None = None
-    for i, ln in enumerate(lines):
-        if fence.match(ln):
-            if open_idx is None:
-                open_idx = i
-            else:
-                blocks.append((open_idx, i))
-                open_idx = None
-    return blocks
+    collector = CodeBlockCollector()
+    run_rules(text.splitlines(), [collector])
+    return [(start - 1, end - 1) for start, end in collector.blocks]
 
 
 def first_examples_block_len(text: str) -> int | None:
     """Return line count of the first code block under '## Examples'."""
-    parts = re.split(r"^## Examples\s*$", text, flags=re.M)
-    if len(parts) < 2:
-        return None
-    examples = parts[1]
-    blocks = find_code_blocks(examples)
-    if not blocks:
-        return None
-    start, end = blocks[0]
-    return max(0, end - start - 1)  # exclude fence lines
+    rule = ExamplesBlockRule()
+    run_rules(text.splitlines(), [rule])
+    return rule.length
 
 
 def has_token_budgets(text: str) -> bool:
     # simple check for presence of T1/T2/T3 in the Quality Gates or anywhere
-    return bool(
-        re.search(r"\bT1\b", text) and re.search(r"\bT2\b", text) and re.search(r"\bT3\b", text)
-    )
+    return not run_rules(text.splitlines(), [TokenBudgetRule()])
 
 
 def scan_secrets(text: str) -> str | None:
-    for pat in SECRET_PATTERNS:
-        m = pat.search(text)
-        if m:
-            return f"Potential secret matched pattern: {pat.pattern}"
-    return None
+    """Message for the first secret found in `text`, if any."""
+    findings = get_scanner().scan_text(text)
+    return secret_message(findings[0]) if findings else None
+
+
+def validate_skill_file(
+    path: Path,
+    scan_all: bool = False,
+    secret_patterns: tuple[SecretPattern, ...] | None = None,
+    stream: bool | None = None,
+) -> list[SkillValidationIssue]:
+    """
+    Validate one SKILL.md.
+
+    With scan_all, files under the skill's examples/, resources/ and scripts/
+    are secret-scanned too; their issues carry the asset's own path.
+    stream=None streams files of STREAM_THRESHOLD bytes or more (see
+    validate_skill_stream); True/False force either mode.
+    """
+    if stream is None:
+        try:
+            stream = path.stat().st_size >= STREAM_THRESHOLD
+        except OSError:
+            stream = False
+    if stream:
+        return validate_skill_stream(path, scan_all, secret_patterns)
 
-
-def validate_skill_file(path: Path) -> list[SkillValidationIssue]:
     issues: list[SkillValidationIssue] = []
+    scanner = get_scanner(secret_patterns)
     try:
-        fm = extract_front_matter(read_text(path))
+        doc = load_document(path)
+        meta = doc.meta
     except Exception as e:
         issues.append(SkillValidationIssue(path, f"Front matter error: {e}"))
         return issues
 
-    meta = fm.meta
-    body = fm.body
+    issues.extend(_meta_issues(path, meta))
+
+    # Body rules: sections, token budgets, examples, code block sizes, secrets
+    rules = [rule() for rule in VALIDATION_RULES]
+    rules.append(SecretsRule(scanner, first_lineno=doc.body_start))
+    events = doc.events
+    with span("regex checks"):
+        body_issues = run_events(events, rules)
+    issues.extend(SkillValidationIssue(path, issue.message) for issue in body_issues)
+
+    issues.extend(_asset_issues(path, scan_all, scanner))
+    return issues
+
+
+def validate_skill_stream(
+    path: Path,
+    scan_all: bool = False,
+    secret_patterns: tuple[SecretPattern, ...] | None = None,
+) -> list[SkillValidationIssue]:
+    """
+    validate_skill_file() over a line iterator of the open file
+
+    Only the front matter and each rule's own state are held, so peak memory
+    is O(longest line) rather than a multiple of the file size. Issues and
+    line numbers match the in-memory mode.
+    """
+    issues: list[SkillValidationIssue] = []
+    scanner = get_scanner(secret_patterns)
+    try:
+        with open(path, encoding="utf-8") as f:
+            try:
+                meta, body_lines, body_start = parse_front_matter(iter_lines(f))
+            except Exception as e:
+                return [SkillValidationIssue(path, f"Front matter error: {e}")]
+
+            issues.extend(_meta_issues(path, meta))
+            rules = [rule() for rule in VALIDATION_RULES]
+            rules.append(SecretsRule(scanner, first_lineno=body_start))
+            with span("parse + regex checks"):
+                body_issues = run_rules(body_lines, rules)
+    except (OSError, UnicodeDecodeError) as e:
+        return [SkillValidationIssue(path, f"Front matter error: {e}")]
+
+    issues.extend(SkillValidationIssue(path, issue.message) for issue in body_issues)
+    issues.extend(_asset_issues(path, scan_all, scanner))
+    return issues
+
 
+def _meta_issues(path: Path, meta: dict[str, Any]) -> list[SkillValidationIssue]:
+    issues: list[SkillValidationIssue] = []
     # Required metadata keys
     missing = sorted(k for k in REQ_META_KEYS if k not in meta)
     if missing:
@@ -175,49 +370,90 @@ def validate_skill_file(path: Path) -> list[SkillValidationIssue]:
 
     if not isinstance(meta.get("keywords", []), list) or not meta.get("keywords"):
         issues.append(SkillValidationIssue(path, "keywords must be a non-empty list"))
+    return issues
 
-    # Body sections present
-    for sect in REQ_BODY_SECTIONS:
-        if re.search(rf"^{re.escape(sect)}\s*$", body, flags=re.M) is None:
-            issues.append(SkillValidationIssue(path, f"Missing required section heading: {sect}"))
-
-    # Token budgets present
-    if not has_token_budgets(body):
-        issues.append(SkillValidationIssue(path, "Token budgets (T1/T2/T3) not found"))
-
-    # Examples block sanity
-    ex_len = first_examples_block_len(body)
-    if ex_len is None:
-        issues.append(SkillValidationIssue(path, "No code example found under '## Examples'"))
-    else:
-        if ex_len > MAX_EXAMPLE_LINES:
-            issues.append(
-                SkillValidationIssue(
-                    path,
-                    f"Example too long: {ex_len} lines (max {MAX_EXAMPLE_LINES})",
-                )
-            )
-
-    # Oversized code blocks
-    for start, end in find_code_blocks(body):
-        n = max(0, end - start - 1)
-        if n > MAX_CODEBLOCK_LINES:
-            issues.append(
-                SkillValidationIssue(
-                    path,
-                    f"Code block too long: {n} lines (max {MAX_CODEBLOCK_LINES})",
-                )
-            )
-
-    # Secret scanning
-    sec = scan_secrets(body)
-    if sec:
-        issues.append(SkillValidationIssue(path, sec))
 
+def _asset_issues(path: Path, scan_all: bool, scanner: SecretScanner) -> list[SkillValidationIssue]:
+    issues: list[SkillValidationIssue] = []
+    if scan_all:
+        with span("scan assets"):
+            for asset in iter_asset_files(path.parent):
+                for finding in scan_file(asset, scanner):
+                    issues.append(SkillValidationIssue(asset, secret_message(finding)))
     return issues
 
 
-def main() -> int:
+def iter_validation_results(
+    paths: list[Path],
+    jobs: int = 1,
+    scan_all: bool = False,
+    secret_patterns: tuple[SecretPattern, ...] | None = None,
+    cache: ResultCache | None = None,
+    stream: bool | None = None,
+) -> Iterator[tuple[Path, list[SkillValidationIssue]]]:
+    """
+    Yield (path, issues) in input order
+
+    With jobs > 1 files are validated across a process pool; each result is
+    yielded as soon as it and every result before it are done. With a cache,
+    unchanged files replay their stored issues and only the rest are parsed.
+    """
+    validate = partial(
+        validate_skill_file, scan_all=scan_all, secret_patterns=secret_patterns, stream=stream
+    )
+    cached: dict[Path, list[SkillValidationIssue]] = {}
+    deps: dict[Path, list[Path]] = {}
+    if cache is not None:
+        for p in paths:
+            deps[p] = [p, *iter_asset_files(p.parent)] if scan_all else [p]
+            stored = cache.get(str(p), deps[p])
+            if stored is not None:
+                cached[p] = [SkillValidationIssue(Path(f), m) for f, m in stored]
+    todo = [p for p in paths if p not in cached]
+
+    fresh: Iterator[list[SkillValidationIssue]]
+    if jobs <= 1 or len(todo) <= 1:
+        fresh = map(validate, todo)
+        yield from _merge_cached(paths, cached, fresh, cache, deps)
+        return
+
+    chunksize = max(1, len(todo) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        fresh = pool.map(validate, todo, chunksize=chunksize)
+        yield from _merge_cached(paths, cached, fresh, cache, deps)
+
+
+def _merge_cached(
+    paths: list[Path],
+    cached: dict[Path, list[SkillValidationIssue]],
+    fresh: Iterator[list[SkillValidationIssue]],
+    cache: ResultCache | None,
+    deps: dict[Path, list[Path]],
+) -> Iterator[tuple[Path, list[SkillValidationIssue]]]:
+    for p in paths:
+        if p in cached:
+            yield p, cached[p]
+            continue
+        issues = next(fresh)
+        if cache is not None:
+            cache.put(str(p), deps[p], [[str(i.path), i.message] for i in issues])
+        yield p, issues
+
+
+def cache_fingerprint(scan_all: bool, secret_patterns: tuple[SecretPattern, ...] | None) -> str:
+    """Fingerprint of the validation rules and the options that change their output"""
+    patterns = [
+        [p.name, p.regex.pattern, list(p.anchors)] for p in (secret_patterns or DEFAULT_PATTERNS)
+    ]
+    options = {
+        "scan_all": scan_all,
+        "secret_patterns": patterns,
+        "yaml": getattr(yaml, "__version__", None),
+    }
+    return tool_fingerprint(CACHE_MODULES, options)
+
+
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate Anthropic SKILL.md files")
     ap.add_argument(
         "--root",
@@ -225,8 +461,47 @@ def main() -> int:
         default=Path("."),
         help="Repo root (default: .)",
     )
-    args = ap.parse_args()
+    ap.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Validate files across N processes (0 = one per CPU; default: 1)",
+    )
+    ap.add_argument(
+        "--scan-all",
+        action="store_true",
+        help="Also secret-scan each skill's examples/, resources/ and scripts/",
+    )
+    ap.add_argument(
+        "--secret-patterns",
+        type=Path,
+        default=None,
+        help="YAML/JSON file of extra secret detectors ({name, pattern, anchors})",
+    )
+    ap.add_argument(
+        "--stream",
+        action="store_true",
+        help=f"Stream every file line by line (default: files >= {STREAM_THRESHOLD >> 20} MiB)",
+    )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate every file instead of replaying cached results",
+    )
+    ap.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=f"Result cache directory (default: <root>/{CACHE_DIR_NAME})",
+    )
+    add_profiling_args(ap)
+    args = ap.parse_args(argv)
+    with profiled(args):
+        return run(args)
 
+
+def run(args: argparse.Namespace) -> int:
     root: Path = args.root.resolve()
     skills_dir = root / "skills"
     if not skills_dir.exists():
@@ -238,15 +513,36 @@ def main() -> int:
         print("No skills found.")
         return 0
 
+    secret_patterns = None
+    if args.secret_patterns:
+        try:
+            extra = load_patterns(args.secret_patterns)
+        except (OSError, ValueError, re.error) as e:
+            print(f"ERROR: invalid secret patterns: {e}", file=sys.stderr)
+            return 2
+        secret_patterns = (*DEFAULT_PATTERNS, *extra)
+
+    cache = None
+    if not args.no_cache:
+        cache_dir: Path = args.cache_dir or (root / CACHE_DIR_NAME)
+        cache = ResultCache(
+            cache_dir / "validate.json", cache_fingerprint(args.scan_all, secret_patterns)
+        )
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
     total_issues: list[SkillValidationIssue] = []
-    for p in md_files:
-        issues = validate_skill_file(p)
+    results = iter_validation_results(
+        md_files, jobs, args.scan_all, secret_patterns, cache, stream=args.stream or None
+    )
+    for p, issues in results:
         if issues:
             for isue in issues:
                 print(f"[FAIL] {isue.path}: {isue.message}")
             total_issues.extend(issues)
         else:
             print(f"[OK]   {p}")
+    if cache is not None:
+        cache.save()
 
     if total_issues:
         print(